@@ -6,86 +6,208 @@ Analyzes error logs to identify common conversation failure patterns
 import os
 import re
 import json
-from collections import defaultdict, Counter
+import mmap
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
+from operator import attrgetter
 from src.config import Config
 
+# Details of timeout and turn-limit errors; each category's handler reads only its own named groups
+ERROR_DETAILS_RE = re.compile(
+    r'timeout after (?P<timeout_limit>\d+) seconds \(actual: (?P<timeout_actual>[\d.]+)s\)'
+    r'|max turns limit \((?P<turn_limit>\d+)\)'
+)
+
+# Lowercased markers of every error category; lines without any of them are skipped
+ERROR_KEYWORDS = (
+    'timeout',
+    'max turns limit',
+    'openai api',
+    'conversation failed',
+    'tool call failed',
+    'missing variable',
+)
+# Only this many conversation failure lines are kept for the examples section
+CONVERSATION_ERROR_EXAMPLES = 3
+ERROR_KEYWORDS_BYTES_RE = re.compile(
+    '|'.join(re.escape(keyword) for keyword in ERROR_KEYWORDS).encode('ascii'), re.IGNORECASE
+)
+
+# Named groups are listed in priority order; the group name is the error category
+ERROR_CATEGORY_RE = re.compile(
+    r'(?P<timeout>timeout)|(?P<turn_limit>max turns limit)|(?P<openai_api>openai api)'
+    r'|(?P<conversation_failed>conversation failed)|(?P<tool_failure>tool call failed)'
+    r'|(?P<missing_variable>missing variable)',
+    re.IGNORECASE,
+)
+# Sub-categories of OpenAI API errors, also in priority order
+API_ERROR_TYPE_RE = re.compile(
+    r'(?P<rate_limit>rate limit)|(?P<api_timeout>timeout)|(?P<quota_exceeded>quota)',
+    re.IGNORECASE,
+)
+
+def iter_error_lines(file_path):
+    """Yield decoded lines of an error log that contain at least one error keyword
+
+    The file is memory-mapped and scanned as raw bytes; only lines passing the
+    keyword filter are decoded.
+    """
+    with open(file_path, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Local bindings keep global/attribute lookups out of the per-line loop
+            has_keyword = ERROR_KEYWORDS_BYTES_RE.search
+            for raw_line in iter(mm.readline, b''):
+                if not has_keyword(raw_line):
+                    continue
+                yield raw_line.rstrip(b'\r\n').decode('utf-8', 'replace')
+
+def highest_priority_group(pattern, line):
+    """Return the name of the lowest-numbered group of pattern matched anywhere in line"""
+    matches = list(pattern.finditer(line))
+    if not matches:
+        return None
+    return min(matches, key=attrgetter('lastindex')).lastgroup
+
+def classify_error_line(line):
+    """Return the error category of a log line, or None if it has none
+
+    When several keywords occur, the highest-priority category wins regardless
+    of where it appears in the line.
+    """
+    return highest_priority_group(ERROR_CATEGORY_RE, line)
+
+def scan_error_file(file_path):
+    """Scan one error log and return its partial results
+
+    Returns a tuple of (error_patterns, timeout_actuals, timeout_limits,
+    turn_limits, api_errors, conversation_errors) that analyze_error_logs
+    merges across files.
+    """
+    # Category names are collected per line and counted once at the end
+    categories = []
+    timeout_actuals = array('d')
+    timeout_limits = Counter()
+    turn_limits = Counter()
+    api_error_types = []
+    conversation_errors = []
+
+    def find_detail(line, group):
+        # First match of the merged detail regex that filled the given group
+        for match in ERROR_DETAILS_RE.finditer(line):
+            if match.group(group):
+                return match
+        return None
+
+    def handle_timeout(line):
+        # Extract timeout details
+        match = find_detail(line, 'timeout_limit')
+        if match:
+            timeout_limits[int(match.group('timeout_limit'))] += 1
+            timeout_actuals.append(float(match.group('timeout_actual')))
+
+    def handle_turn_limit(line):
+        # Extract turn limit details
+        match = find_detail(line, 'turn_limit')
+        if match:
+            turn_limits[int(match.group('turn_limit'))] += 1
+
+    def handle_openai_api(line):
+        api_error_types.append(highest_priority_group(API_ERROR_TYPE_RE, line) or 'other_api_error')
+
+    def handle_conversation_failed(line):
+        if len(conversation_errors) < CONVERSATION_ERROR_EXAMPLES:
+            conversation_errors.append(line)
+
+    # Categories without a handler are only counted
+    category_handlers = {
+        'timeout': handle_timeout,
+        'turn_limit': handle_turn_limit,
+        'openai_api': handle_openai_api,
+        'conversation_failed': handle_conversation_failed,
+    }
+
+    # Local bindings keep global/attribute lookups out of the per-line loop
+    classify = classify_error_line
+    add_category = categories.append
+    get_handler = category_handlers.get
+
+    for line in iter_error_lines(file_path):
+        category = classify(line)
+        if category is None:
+            continue
+
+        add_category(category)
+
+        handler = get_handler(category)
+        if handler:
+            handler(line)
+
+    return (
+        Counter(categories),
+        timeout_actuals,
+        timeout_limits,
+        turn_limits,
+        Counter(api_error_types),
+        conversation_errors,
+    )
+
 def analyze_error_logs():
     """Analyze error logs to find patterns in conversation failures"""
     
     # Ensure logs directory exists
     Config.ensure_directories()
     
-    if not os.path.exists(Config.LOGS_DIR):
+    # Find error log files
+    try:
+        with os.scandir(Config.LOGS_DIR) as entries:
+            error_files = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith('error_') and entry.name.endswith('.log') and entry.is_file()
+            ]
+    except FileNotFoundError:
         print(f"Logs directory not found: {Config.LOGS_DIR}")
         return
     
-    # Find error log files
-    error_files = [f for f in os.listdir(Config.LOGS_DIR) if f.startswith('error_') and f.endswith('.log')]
-    
     if not error_files:
         print("No error log files found")
         return
     
     print(f"Found {len(error_files)} error log files")
     
-    # Analyze patterns
-    error_patterns = defaultdict(int)
-    timeout_info = []
-    turn_limit_info = []
-    api_errors = defaultdict(int)
+    # Analyze patterns; files are independent, so scan them in parallel
+    error_patterns = Counter()
+    timeout_actuals = array('d')
+    timeout_limits = Counter()
+    turn_limits = Counter()
+    api_errors = Counter()
     conversation_errors = []
-    
-    for error_file in error_files:
-        file_path = os.path.join(Config.LOGS_DIR, error_file)
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-            # Parse error lines
-            for line in content.split('\n'):
-                if not line.strip():
-                    continue
-                    
-                # Count different error types
-                if 'timeout' in line.lower():
-                    error_patterns['timeout'] += 1
-                    # Extract timeout details
-                    if 'actual:' in line:
-                        match = re.search(r'timeout after (\d+) seconds \(actual: ([\d.]+)s\)', line)
-                        if match:
-                            expected = int(match.group(1))
-                            actual = float(match.group(2))
-                            timeout_info.append({'expected': expected, 'actual': actual})
-                
-                elif 'max turns limit' in line.lower():
-                    error_patterns['turn_limit'] += 1
-                    # Extract turn limit details
-                    match = re.search(r'max turns limit \((\d+)\)', line)
-                    if match:
-                        max_turns = int(match.group(1))
-                        turn_limit_info.append({'max_turns': max_turns})
-                
-                elif 'openai api' in line.lower():
-                    error_patterns['openai_api'] += 1
-                    if 'rate limit' in line.lower():
-                        api_errors['rate_limit'] += 1
-                    elif 'timeout' in line.lower():
-                        api_errors['api_timeout'] += 1
-                    elif 'quota' in line.lower():
-                        api_errors['quota_exceeded'] += 1
-                    else:
-                        api_errors['other_api_error'] += 1
-                
-                elif 'conversation failed' in line.lower():
-                    error_patterns['conversation_failed'] += 1
-                    conversation_errors.append(line)
-                
-                elif 'tool call failed' in line.lower():
-                    error_patterns['tool_failure'] += 1
-                
-                elif 'missing variable' in line.lower():
-                    error_patterns['missing_variable'] += 1
+
+    max_workers = min(len(error_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        for file_results in executor.map(scan_error_file, error_files):
+            (
+                file_patterns,
+                file_timeout_actuals,
+                file_timeout_limits,
+                file_turn_limits,
+                file_api_errors,
+                file_conversation_errors,
+            ) = file_results
+            error_patterns.update(file_patterns)
+            timeout_actuals.extend(file_timeout_actuals)
+            timeout_limits.update(file_timeout_limits)
+            turn_limits.update(file_turn_limits)
+            api_errors.update(file_api_errors)
+            conversation_errors.extend(
+                islice(file_conversation_errors, CONVERSATION_ERROR_EXAMPLES - len(conversation_errors))
+            )
     
     # Print analysis results
     print("\n" + "="*60)
@@ -96,18 +218,16 @@ def analyze_error_logs():
     for error_type, count in sorted(error_patterns.items(), key=lambda x: x[1], reverse=True):
         print(f"   {error_type.replace('_', ' ').title()}: {count}")
     
-    if timeout_info:
-        print(f"\n2. TIMEOUT ANALYSIS ({len(timeout_info)} timeouts):")
-        avg_timeout = sum(t['actual'] for t in timeout_info) / len(timeout_info)
-        max_timeout = max(t['actual'] for t in timeout_info)
+    if timeout_actuals:
+        print(f"\n2. TIMEOUT ANALYSIS ({len(timeout_actuals)} timeouts):")
+        avg_timeout = sum(timeout_actuals) / len(timeout_actuals)
+        max_timeout = max(timeout_actuals)
         print(f"   Average timeout duration: {avg_timeout:.1f} seconds")
         print(f"   Maximum timeout duration: {max_timeout:.1f} seconds")
-        expected_timeouts = Counter(t['expected'] for t in timeout_info)
-        print(f"   Timeout limits being hit: {dict(expected_timeouts)}")
+        print(f"   Timeout limits being hit: {dict(timeout_limits)}")
     
-    if turn_limit_info:
-        print(f"\n3. TURN LIMIT ANALYSIS ({len(turn_limit_info)} turn limits):")
-        turn_limits = Counter(t['max_turns'] for t in turn_limit_info)
+    if turn_limits:
+        print(f"\n3. TURN LIMIT ANALYSIS ({sum(turn_limits.values())} turn limits):")
         print(f"   Turn limits being hit: {dict(turn_limits)}")
     
     if api_errors:
@@ -116,8 +236,8 @@ def analyze_error_logs():
             print(f"   {error_type.replace('_', ' ').title()}: {count}")
     
     if conversation_errors:
-        print(f"\n5. CONVERSATION FAILURE EXAMPLES (showing first 3):")
-        for i, error in enumerate(conversation_errors[:3]):
+        print(f"\n5. CONVERSATION FAILURE EXAMPLES (showing first {CONVERSATION_ERROR_EXAMPLES}):")
+        for i, error in enumerate(conversation_errors):
             print(f"   {i+1}. {error.strip()}")
     
     # Recommendations
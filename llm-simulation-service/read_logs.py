@@ -3,69 +3,111 @@
 Script to read and display conversation logs in readable format
 """
 import json
+import mmap
+import re
 import sys
 import os
 
+try:
+    from orjson import loads as loads_json
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    from json import loads as loads_json
+
+# App log lines worth showing: tool activity and client hang-ups
+APP_LOG_EVENT_RE = re.compile(r'Tool call:|Tool executed:|Client ended call:')
+
+# Number of buffered output pieces written to stdout at once
+OUTPUT_FLUSH_CHUNKS = 1000
+
+def iter_mapped_lines(f):
+    """Yield raw byte lines of an open binary file through a read-only memory map"""
+    # mmap cannot map an empty file
+    if os.fstat(f.fileno()).st_size == 0:
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        yield from iter(mm.readline, b'')
+
+def iter_events(lines, on_error=None):
+    """Yield decoded events from JSONL conversation log lines
+
+    Lines may be str or raw bytes; bytes are handed to the JSON parser
+    without decoding. Blank lines are skipped. Lines that fail to parse are
+    passed to on_error(line, error) when given, otherwise silently dropped.
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            yield loads_json(line)
+        except json.JSONDecodeError as e:
+            if on_error is not None:
+                on_error(line, e)
+
+def format_event(data):
+    """Render a single conversation log event as display text"""
+    if 'event_type' in data and data['event_type'] == 'conversation_complete':
+        return (
+            "🏁 CONVERSATION COMPLETE:\n"
+            f"   Total Turns: {data['total_turns']}\n"
+            f"   Score: {data.get('final_score', 'N/A')}\n"
+            f"   Comment: {data.get('evaluator_comment', 'N/A')}\n"
+            f"   Status: {data['status']}\n\n"
+        )
+
+    # Pull each field once and render the whole turn with a single template
+    role = data['role'].upper()
+    turn = data['turn_number']
+    content = data['content']
+    timestamp = data['timestamp']
+    tool_calls = data.get('tool_calls')
+    tool_results = data.get('tool_results')
+
+    tool_calls_line = f"  🔧 TOOL CALLS: {len(tool_calls)} tools used\n" if tool_calls else ''
+    tool_results_line = f"  📋 TOOL RESULTS: {len(tool_results)} results\n" if tool_results else ''
+
+    return f"Turn {turn} - {role}:\n  {content}\n{tool_calls_line}{tool_results_line}  ⏰ Time: {timestamp}\n\n"
+
 def read_conversation_log(filename):
-    """Read and display conversation log in readable format"""
+    """Read and display conversation log in readable format
+
+    Output is collected in memory and written to stdout in chunks of
+    OUTPUT_FLUSH_CHUNKS pieces instead of one print() per line.
+    """
+    out = []
+
+    def report_parse_error(line, error):
+        line = line.decode('utf-8', 'replace')
+        out.append(f"Error parsing line: {error}\nLine content: {line}\n")
+
     try:
-        with open(filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        print(f'=== COMPLETE CONVERSATION LOG: {filename} ===')
-        print()
-        
-        for line in lines:
-            if line.strip():
-                try:
-                    data = json.loads(line.strip())
-                    
-                    if 'event_type' in data and data['event_type'] == 'conversation_complete':
-                        print(f"🏁 CONVERSATION COMPLETE:")
-                        print(f"   Total Turns: {data['total_turns']}")
-                        print(f"   Score: {data.get('final_score', 'N/A')}")
-                        print(f"   Comment: {data.get('evaluator_comment', 'N/A')}")
-                        print(f"   Status: {data['status']}")
-                        print()
-                    else:
-                        role = data['role'].upper()
-                        turn = data['turn_number']
-                        content = data['content']
-                        timestamp = data['timestamp']
-                        
-                        print(f"Turn {turn} - {role}:")
-                        print(f"  {content}")
-                        
-                        if data.get('tool_calls'):
-                            print(f"  🔧 TOOL CALLS: {len(data['tool_calls'])} tools used")
-                        
-                        if data.get('tool_results'):
-                            print(f"  📋 TOOL RESULTS: {len(data['tool_results'])} results")
-                            
-                        print(f"  ⏰ Time: {timestamp}")
-                        print()
-                except json.JSONDecodeError as e:
-                    print(f"Error parsing line: {e}")
-                    print(f"Line content: {line}")
-                    
+        with open(filename, 'rb') as f:
+            out.append(f'=== COMPLETE CONVERSATION LOG: {filename} ===\n\n')
+
+            for data in iter_events(iter_mapped_lines(f), on_error=report_parse_error):
+                out.append(format_event(data))
+
+                if len(out) >= OUTPUT_FLUSH_CHUNKS:
+                    sys.stdout.write(''.join(out))
+                    out.clear()
+
     except FileNotFoundError:
-        print(f"Log file not found: {filename}")
+        out.append(f"Log file not found: {filename}\n")
     except Exception as e:
-        print(f"Error reading log file: {e}")
+        out.append(f"Error reading log file: {e}\n")
+
+    sys.stdout.write(''.join(out))
 
 def read_app_log(filename):
     """Read and display app log with tool calls"""
     try:
         with open(filename, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        print(f'=== APP LOG WITH TOOL CALLS: {filename} ===')
-        print()
-        
-        for line in lines:
-            if 'Tool call:' in line or 'Tool executed:' in line or 'Client ended call:' in line:
-                print(line.strip())
-                
+            print(f'=== APP LOG WITH TOOL CALLS: {filename} ===')
+            print()
+
+            for line in f:
+                if APP_LOG_EVENT_RE.search(line):
+                    print(line.strip())
+
     except FileNotFoundError:
         print(f"App log file not found: {filename}")
     except Exception as e:
@@ -74,18 +116,20 @@ def read_app_log(filename):
 if __name__ == "__main__":
     # Get the latest log files
     logs_dir = "logs"
-    
+    with os.scandir(logs_dir) as entries:
+        log_files = {entry.name: entry.path for entry in entries if entry.is_file()}
+
     # Find the most recent conversation log
-    conversation_files = [f for f in os.listdir(logs_dir) if f.startswith('conversations_') and f.endswith('.jsonl')]
+    conversation_files = [f for f in log_files if f.startswith('conversations_') and f.endswith('.jsonl')]
     if conversation_files:
         latest_conversation = sorted(conversation_files)[-1]
-        read_conversation_log(os.path.join(logs_dir, latest_conversation))
+        read_conversation_log(log_files[latest_conversation])
         
         # Find corresponding app log
         timestamp = latest_conversation.split('_')[1].split('.')[0]  # Extract timestamp
         app_log = f"app_{timestamp}.log"
-        if os.path.exists(os.path.join(logs_dir, app_log)):
+        if app_log in log_files:
             print("\n" + "="*60 + "\n")
-            read_app_log(os.path.join(logs_dir, app_log))
+            read_app_log(log_files[app_log])
     else:
         print("No conversation log files found") 
\ No newline at end of file
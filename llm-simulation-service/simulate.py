@@ -5,24 +5,70 @@ CLI for LLM conversation simulation and batch management
 
 import argparse
 import asyncio
+import contextlib
 import json
+import mmap
 import sys
 import os
 import re
-from typing import Dict, Any, List, Optional
+import signal
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Any, Iterator, List, Optional, Tuple
 from datetime import datetime
 
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib serializer
+    orjson = None
 
 from src.config import Config
-from src.openai_wrapper import OpenAIWrapper
-from src.autogen_conversation_engine import AutogenConversationEngine
-from src.evaluator import ConversationEvaluator
-from src.batch_processor import BatchProcessor
-from src.result_storage import ResultStorage
 from src.logging_utils import get_logger
-from src.prompt_specification import PromptSpecificationManager
+
+# Heavy modules (openai, autogen, pandas) are imported inside the commands that need them
+if TYPE_CHECKING:
+    from src.openai_wrapper import OpenAIWrapper
+    from src.autogen_conversation_engine import AutogenConversationEngine
+    from src.evaluator import ConversationEvaluator
+    import requests
+
+
+def read_json_file(file_path: str) -> Any:
+    """Parse a JSON file, using orjson over a memory map when available"""
+    with open(file_path, "rb") as f:
+        if not orjson or os.fstat(f.fileno()).st_size == 0:
+            data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data)
+
+        # orjson parses the mapped pages directly, so the file is never copied into a bytes object
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+            return orjson.loads(view)
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize to indented, non-ASCII-escaped JSON text"""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+# Connections kept alive to the service API
+API_POOL_SIZE = 4
+
+# Bytes per read when streaming fetched results to disk
+FETCH_CHUNK_SIZE = 64 * 1024
+
+# Display labels for conversation speakers; anything other than the agent is shown as the client
+CLIENT_LABEL = "👤 Client"
+SPEAKER_LABELS = {"agent": "🤖 Agent", "client": CLIENT_LABEL}
+
+_speaker_and_content = itemgetter("speaker", "content")
+
+# Whitespace and commas separating items of a JSON array
+SCENARIO_SEPARATOR_RE = re.compile(r"[\s,]*")
+
+# Characters read per refill when streaming a scenarios file
+SCENARIO_READ_CHUNK_SIZE = 64 * 1024
 
 
 def safe_filename(name: str, max_length: int = 50) -> str:
@@ -44,12 +90,25 @@ async def run_batch_local(
     return await run_batch_scenarios(scenarios, output_dir, prompt_spec_name)
 
 
+@lru_cache(maxsize=None)
+def _get_http_session() -> "requests.Session":
+    """Return the pooled HTTP session used for service API calls"""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=API_POOL_SIZE, pool_maxsize=API_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 def get_batch_status_via_api(batch_id: str, api_url: str = "http://localhost:5000") -> Optional[Dict[str, Any]]:
     """Retrieve batch status from the service API."""
     import requests
 
     try:
-        response = requests.get(f"{api_url}/api/batches/{batch_id}")
+        response = _get_http_session().get(f"{api_url}/api/batches/{batch_id}")
         if response.status_code == 200:
             return response.json()
     except requests.RequestException:
@@ -64,7 +123,7 @@ def fetch_batch_results_via_api(
     import requests
 
     try:
-        response = requests.get(f"{api_url}/api/batches/{batch_id}/results", params={"format": fmt})
+        response = _get_http_session().get(f"{api_url}/api/batches/{batch_id}/results", params={"format": fmt})
         if response.status_code == 200:
             return response.text
     except requests.RequestException:
@@ -72,6 +131,41 @@ def fetch_batch_results_via_api(
     return None
 
 
+@lru_cache(maxsize=None)
+def _get_openai_wrapper() -> "OpenAIWrapper":
+    """Return the OpenAI wrapper shared by all single-scenario runs in this process"""
+    from src.openai_wrapper import OpenAIWrapper
+
+    return OpenAIWrapper(Config.OPENAI_API_KEY)
+
+
+@lru_cache(maxsize=None)
+def _get_components(
+    prompt_spec_name: str,
+) -> Tuple["OpenAIWrapper", "AutogenConversationEngine", "ConversationEvaluator"]:
+    """Return cached (wrapper, engine, evaluator) for a prompt specification
+
+    Engines and evaluators keep no per-conversation state, so they are built
+    once per specification and reuse the wrapper's HTTP connection pool.
+    """
+    from src.autogen_conversation_engine import AutogenConversationEngine
+    from src.evaluator import ConversationEvaluator
+
+    openai_wrapper = _get_openai_wrapper()
+    conversation_engine = AutogenConversationEngine(openai_wrapper, prompt_spec_name)
+    evaluator = ConversationEvaluator(openai_wrapper, prompt_spec_name)
+    return openai_wrapper, conversation_engine, evaluator
+
+
+def install_uvloop() -> None:
+    """Use uvloop for asyncio.run when it is installed"""
+    try:
+        import uvloop
+    except ImportError:  # uvloop is optional and unavailable on Windows
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 def setup_cli_logging():
     """Setup logging for CLI usage"""
     # For CLI, we'll just use a simple logger setup
@@ -79,15 +173,36 @@ def setup_cli_logging():
     pass
 
 
+def format_history_entry(entry: Dict[str, Any]) -> str:
+    """Render one conversation history entry with its tool calls and results"""
+    speaker, content = _speaker_and_content(entry)
+    lines = [f"\n{SPEAKER_LABELS.get(speaker, CLIENT_LABEL)}: {content}"]
+
+    # Show tool calls if present
+    tool_calls = entry.get("tool_calls")
+    if tool_calls:
+        lines.extend(f"  🔧 Tool: {tool_call['function']['name']}" for tool_call in tool_calls)
+
+    tool_results = entry.get("tool_results")
+    if tool_results:
+        lines.extend(
+            f"  ↳ Result: {result['status']}"
+            for result in tool_results
+            if isinstance(result, dict) and "status" in result
+        )
+
+    return "\n".join(lines)
+
+
 async def run_single_scenario(
     scenario: Dict[str, Any], output_dir: str, stream: bool = True, prompt_spec_name: str = "default_prompts"
 ) -> Dict[str, Any]:
     """Run a single scenario with optional streaming output"""
+    from src.result_storage import ResultStorage
+    from src.webhook_manager import WebhookManager
 
     logger = get_logger()
-    openai_wrapper = OpenAIWrapper(Config.OPENAI_API_KEY)
-    conversation_engine = AutogenConversationEngine(openai_wrapper, prompt_spec_name)
-    evaluator = ConversationEvaluator(openai_wrapper, prompt_spec_name)
+    openai_wrapper, conversation_engine, evaluator = _get_components(prompt_spec_name)
 
     scenario_name = scenario.get("name", "unknown")
 
@@ -98,38 +213,34 @@ async def run_single_scenario(
     if stream:
         print("🔄 Starting conversation...")
 
-    conversation_result = await conversation_engine.run_conversation_with_tools(scenario)
-
-    if stream:
-        if conversation_result.get("status") == "completed":
-            print(f"✅ Conversation completed in {conversation_result.get('duration_seconds', 0):.1f}s")
-            print(f"📊 Total turns: {conversation_result.get('total_turns', 0)}")
-
-            # Display conversation history
-            history = conversation_result.get("conversation_history", [])
-            for entry in history:
-                speaker = "🤖 Agent" if entry["speaker"] == "agent" else "👤 Client"
-                content = entry["content"]
-                print(f"\n{speaker}: {content}")
-
-                # Show tool calls if present
-                if "tool_calls" in entry and entry["tool_calls"]:
-                    for tool_call in entry["tool_calls"]:
-                        tool_name = tool_call["function"]["name"]
-                        print(f"  🔧 Tool: {tool_name}")
-
-                if "tool_results" in entry and entry["tool_results"]:
-                    for result in entry["tool_results"]:
-                        if isinstance(result, dict) and "status" in result:
-                            print(f"  ↳ Result: {result.get('status', 'unknown')}")
-        else:
-            print(f"❌ Conversation failed: {conversation_result.get('error', 'unknown error')}")
+    try:
+        conversation_result = await conversation_engine.run_conversation_with_tools(scenario)
+
+        if stream:
+            if conversation_result.get("status") == "completed":
+                print(f"✅ Conversation completed in {conversation_result.get('duration_seconds', 0):.1f}s")
+                print(f"📊 Total turns: {conversation_result.get('total_turns', 0)}")
+
+                # Display conversation history
+                history = conversation_result.get("conversation_history", [])
+                if sys.stdout.isatty():
+                    for entry in history:
+                        print(format_history_entry(entry))
+                elif history:
+                    # Redirected output: emit the whole transcript in one write
+                    print("\n".join(map(format_history_entry, history)))
+            else:
+                print(f"❌ Conversation failed: {conversation_result.get('error', 'unknown error')}")
 
-    # Evaluate conversation
-    if stream:
-        print("\n🔄 Evaluating conversation...")
+        # Evaluate conversation
+        if stream:
+            print("\n🔄 Evaluating conversation...")
 
-    evaluation_result = await evaluator.evaluate_conversation(conversation_result)
+        evaluation_result = await evaluator.evaluate_conversation(conversation_result)
+    finally:
+        await WebhookManager.shared().aclose()
+        # Pooled connections belong to this event loop, so they are closed before asyncio.run closes it
+        await openai_wrapper.close()
 
     if stream:
         score = evaluation_result.get("score", 0)
@@ -164,6 +275,11 @@ async def run_batch_scenarios(
 ) -> Dict[str, Any]:
     """Run multiple scenarios as a batch"""
 
+    from tqdm import tqdm
+    from src.batch_processor import BatchProcessor
+    from src.result_storage import ResultStorage
+    from src.webhook_manager import WebhookManager
+
     logger = get_logger()
     batch_processor = BatchProcessor(Config.OPENAI_API_KEY, Config.CONCURRENCY)
 
@@ -179,39 +295,59 @@ async def run_batch_scenarios(
 
     print(f"🆔 Batch ID: {batch_id}")
 
-    # Run batch with progress tracking
+    # Run batch with progress tracking; tqdm rate-limits redraws, so the callback stays cheap
+    progress_bar = tqdm(total=len(scenarios), desc="📊 Progress", unit="scenario")
+
     def progress_callback(completed: int, total: int):
-        percentage = (completed / total) * 100
-        print(f"📊 Progress: {completed}/{total} ({percentage:.1f}%)")
+        progress_bar.update(completed - progress_bar.n)
 
-    try:
-        result = await batch_processor.run_batch(batch_id, progress_callback)
+    result_storage = ResultStorage(output_dir)
 
-        if result.get("status") == "completed":
-            print(f"\n✅ Batch completed successfully!")
-            print(f"⏱️  Duration: {result.get('duration_seconds', 0):.1f}s")
-            print(f"📊 Success rate: {result.get('success_rate', 0):.1%}")
+    # First Ctrl-C drains: running scenarios finish, queued ones are skipped and partial results are saved
+    drain = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def request_drain():
+        drain.set()
+        # Restores the default handler, so a second Ctrl-C interrupts immediately
+        loop.remove_signal_handler(signal.SIGINT)
+        progress_bar.write("\n⏸️  Interrupted: finishing running scenarios, press Ctrl-C again to abort")
 
-            # Save results
-            results = result.get("results", [])
-            result_storage = ResultStorage(output_dir)
+    with contextlib.suppress(NotImplementedError):  # Not available on Windows event loops
+        loop.add_signal_handler(signal.SIGINT, request_drain)
 
-            # Save in multiple formats
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    try:
+        with result_storage.stream_batch_results_ndjson(batch_id) as (ndjson_path, write_result):
+            try:
+                result = await batch_processor.run_batch(
+                    batch_id, progress_callback, on_result=write_result, drain=drain
+                )
+            finally:
+                progress_bar.close()
+                with contextlib.suppress(NotImplementedError):
+                    loop.remove_signal_handler(signal.SIGINT)
+                await WebhookManager.shared().aclose()
+                await batch_processor.openai_wrapper.close()
+
+        if result.get("status") in ("completed", "cancelled"):
+            if result.get("status") == "completed":
+                print(f"\n✅ Batch completed successfully!")
+            else:
+                print(
+                    f"\n⏸️  Batch interrupted: {len(result.get('results', []))} of "
+                    f"{result.get('total_scenarios', 0)} scenarios finished"
+                )
+            print(f"⏱️  Duration: {result.get('duration_seconds', 0):.1f}s")
+            print(f"📊 Success rate: {result.get('success_rate', 0):.1%}")
 
-            ndjson_path = result_storage.save_batch_results_ndjson(batch_id, results)
-            csv_path = result_storage.save_batch_results_csv(batch_id, results)
-            json_path = result_storage.save_batch_results_json(batch_id, results)
+            # NDJSON was written as results arrived; derive the remaining formats in one pass
+            paths = result_storage.save_all(batch_id, result.get("results", []), formats=("csv", "json", "summary"))
 
             print(f"\n💾 Results saved:")
             print(f"  📄 NDJSON: {ndjson_path}")
-            print(f"  📊 CSV: {csv_path}")
-            print(f"  📋 JSON: {json_path}")
-
-            # Generate summary
-            summary = result_storage.generate_summary_report(batch_id, results)
-            summary_path = result_storage.save_summary_report(summary)
-            print(f"  📈 Summary: {summary_path}")
+            print(f"  📊 CSV: {paths['csv']}")
+            print(f"  📋 JSON: {paths['json']}")
+            print(f"  📈 Summary: {paths['summary']}")
 
         else:
             print(f"\n❌ Batch failed: {result.get('error', 'unknown error')}")
@@ -227,8 +363,7 @@ async def run_batch_scenarios(
 def load_scenarios_from_file(file_path: str) -> List[Dict[str, Any]]:
     """Load scenarios from JSON file"""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            scenarios = json.load(f)
+        scenarios = read_json_file(file_path)
 
         if not isinstance(scenarios, list):
             raise ValueError("Scenarios file must contain a JSON array")
@@ -240,12 +375,58 @@ def load_scenarios_from_file(file_path: str) -> List[Dict[str, Any]]:
         sys.exit(1)
 
 
-def main():
-    """Main CLI entry point"""
-    parser = argparse.ArgumentParser(
-        description="LLM Conversation Simulation CLI",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+def iter_scenarios_from_file(file_path: str, chunk_size: int = SCENARIO_READ_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
+    """Lazily yield scenarios from a JSON array file, decoding one item at a time"""
+    decoder = json.JSONDecoder()
+    with open(file_path, "r", encoding="utf-8") as f:
+        buffer = f.read(chunk_size).lstrip()
+        if not buffer.startswith("["):
+            raise ValueError("Scenarios file must contain a JSON array")
+        pos = 1
+        eof = False
+
+        while True:
+            pos = SCENARIO_SEPARATOR_RE.match(buffer, pos).end()
+            if pos < len(buffer):
+                if buffer[pos] == "]":
+                    return
+                try:
+                    scenario, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    # A value ending exactly at the buffer edge may be truncated, so refill first
+                    if end < len(buffer) or eof:
+                        yield scenario
+                        pos = end
+                        continue
+            elif eof:
+                raise ValueError("Scenarios array is not terminated")
+
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+
+def load_scenario_at_index(file_path: str, index: int) -> Dict[str, Any]:
+    """Load a single scenario by index, parsing the file only up to that item"""
+    try:
+        count = 0
+        for count, scenario in enumerate(iter_scenarios_from_file(file_path), 1):
+            if count - 1 == index:
+                return scenario
+
+    except Exception as e:
+        print(f"❌ Failed to load scenarios from {file_path}: {str(e)}")
+        sys.exit(1)
+
+    print(f"❌ Invalid scenario index: {index}. Available: 0-{count - 1}")
+    sys.exit(1)
+
+
+CLI_EPILOG = """
 Examples:
   # Run all scenarios in batch mode
   python simulate.py run scenarios/sample_scenarios.json
@@ -276,67 +457,110 @@ Examples:
   
   # Duplicate existing specification
   python simulate.py prompts duplicate default_prompts my_copy
-        """,
-    )
+        """
 
-    subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Run command
-    run_parser = subparsers.add_parser("run", help="Run conversation scenarios")
+def _add_run_arguments(run_parser: argparse.ArgumentParser, argv: List[str]) -> None:
     run_parser.add_argument("scenarios_file", help="Path to scenarios JSON file")
     run_parser.add_argument("--output-dir", default="./results", help="Output directory for results")
     run_parser.add_argument("--single", type=int, metavar="INDEX", help="Run only the scenario at specified index")
     run_parser.add_argument("--no-stream", action="store_true", help="Disable streaming output for single scenarios")
     run_parser.add_argument("--prompt-spec", default="default_prompts", help="Prompt specification name to use")
 
-    # Status command
-    status_parser = subparsers.add_parser("status", help="Check batch status")
+
+def _add_status_arguments(status_parser: argparse.ArgumentParser, argv: List[str]) -> None:
     status_parser.add_argument("batch_id", help="Batch ID to check")
     status_parser.add_argument("--api-url", default="http://localhost:5000", help="API base URL")
 
-    # Fetch command
-    fetch_parser = subparsers.add_parser("fetch", help="Fetch batch results")
+
+def _add_fetch_arguments(fetch_parser: argparse.ArgumentParser, argv: List[str]) -> None:
     fetch_parser.add_argument("batch_id", help="Batch ID to fetch results for")
     fetch_parser.add_argument("--output", help="Output file path")
     fetch_parser.add_argument("--format", choices=["json", "csv", "ndjson"], default="json", help="Output format")
     fetch_parser.add_argument("--api-url", default="http://localhost:5000", help="API base URL")
 
-    # Prompt specifications command
-    prompts_parser = subparsers.add_parser("prompts", help="Manage prompt specifications")
-    prompts_subparsers = prompts_parser.add_subparsers(dest="prompts_command", help="Prompt specification commands")
-
-    # List prompt specs
-    list_prompts_parser = prompts_subparsers.add_parser("list", help="List available prompt specifications")
 
-    # Get prompt spec
-    get_prompts_parser = prompts_subparsers.add_parser("get", help="Get prompt specification contents")
+def _add_prompts_get_arguments(get_prompts_parser: argparse.ArgumentParser) -> None:
     get_prompts_parser.add_argument("spec_name", help="Name of the specification to retrieve")
     get_prompts_parser.add_argument("--output", help="Output file path (default: print to console)")
 
-    # Create prompt spec
-    create_prompts_parser = prompts_subparsers.add_parser("create", help="Create new prompt specification")
+
+def _add_prompts_create_arguments(create_prompts_parser: argparse.ArgumentParser) -> None:
     create_prompts_parser.add_argument("spec_name", help="Name for the new specification")
     create_prompts_parser.add_argument("--from-file", required=True, help="JSON file containing the specification")
 
-    # Duplicate prompt spec
-    duplicate_prompts_parser = prompts_subparsers.add_parser(
-        "duplicate", help="Duplicate existing prompt specification"
-    )
+
+def _add_prompts_duplicate_arguments(duplicate_prompts_parser: argparse.ArgumentParser) -> None:
     duplicate_prompts_parser.add_argument("source_spec", help="Name of the specification to duplicate")
     duplicate_prompts_parser.add_argument("new_spec", help="Name for the duplicated specification")
     duplicate_prompts_parser.add_argument("--display-name", help="Display name for the new specification")
     duplicate_prompts_parser.add_argument("--version", default="1.0.0", help="Version for the new specification")
     duplicate_prompts_parser.add_argument("--description", help="Description for the new specification")
 
-    # Delete prompt spec
-    delete_prompts_parser = prompts_subparsers.add_parser("delete", help="Delete prompt specification")
+
+def _add_prompts_delete_arguments(delete_prompts_parser: argparse.ArgumentParser) -> None:
     delete_prompts_parser.add_argument("spec_name", help="Name of the specification to delete")
     delete_prompts_parser.add_argument("--force", action="store_true", help="Skip confirmation prompt")
 
-    # Validate prompt spec
-    validate_prompts_parser = prompts_subparsers.add_parser("validate", help="Validate prompt specification")
+
+def _add_prompts_validate_arguments(validate_prompts_parser: argparse.ArgumentParser) -> None:
     validate_prompts_parser.add_argument("spec_file", help="JSON file containing the specification to validate")
 
+
+# prompts subcommand -> (help, argument builder)
+PROMPTS_COMMANDS = {
+    "list": ("List available prompt specifications", lambda parser: None),
+    "get": ("Get prompt specification contents", _add_prompts_get_arguments),
+    "create": ("Create new prompt specification", _add_prompts_create_arguments),
+    "duplicate": ("Duplicate existing prompt specification", _add_prompts_duplicate_arguments),
+    "delete": ("Delete prompt specification", _add_prompts_delete_arguments),
+    "validate": ("Validate prompt specification", _add_prompts_validate_arguments),
+}
+
+
+def _add_prompts_arguments(prompts_parser: argparse.ArgumentParser, argv: List[str]) -> None:
+    prompts_subparsers = prompts_parser.add_subparsers(dest="prompts_command", help="Prompt specification commands")
+    selected = argv[0] if argv and argv[0] in PROMPTS_COMMANDS else None
+    for name, (help_text, add_arguments) in PROMPTS_COMMANDS.items():
+        subparser = prompts_subparsers.add_parser(name, help=help_text)
+        if selected in (None, name):
+            add_arguments(subparser)
+
+
+# command -> (help, argument builder)
+CLI_COMMANDS = {
+    "run": ("Run conversation scenarios", _add_run_arguments),
+    "status": ("Check batch status", _add_status_arguments),
+    "fetch": ("Fetch batch results", _add_fetch_arguments),
+    "prompts": ("Manage prompt specifications", _add_prompts_arguments),
+}
+
+
+def build_parser(argv: List[str]) -> argparse.ArgumentParser:
+    """Build the CLI parser, adding arguments only for the command named in ``argv``
+
+    Other commands get bare subparsers so they still appear in the top-level help.
+    Without a recognised command the full tree is built.
+    """
+    parser = argparse.ArgumentParser(
+        description="LLM Conversation Simulation CLI",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=CLI_EPILOG,
+    )
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    selected = argv[0] if argv and argv[0] in CLI_COMMANDS else None
+    for name, (help_text, add_arguments) in CLI_COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=help_text)
+        if selected in (None, name):
+            add_arguments(subparser, argv[1:])
+
+    return parser
+
+
+def main():
+    """Main CLI entry point"""
+    parser = build_parser(sys.argv[1:])
     args = parser.parse_args()
 
     if not args.command:
@@ -347,19 +571,14 @@ Examples:
     setup_cli_logging()
 
     if args.command == "run":
-        # Load scenarios
-        scenarios = load_scenarios_from_file(args.scenarios_file)
+        install_uvloop()
 
         # Create output directory
         os.makedirs(args.output_dir, exist_ok=True)
 
         if args.single is not None:
-            # Run single scenario
-            if args.single < 0 or args.single >= len(scenarios):
-                print(f"❌ Invalid scenario index: {args.single}. Available: 0-{len(scenarios) - 1}")
-                sys.exit(1)
-
-            scenario = scenarios[args.single]
+            # Run single scenario, decoding the file only up to the requested item
+            scenario = load_scenario_at_index(args.scenarios_file, args.single)
             stream = not args.no_stream
 
             result = asyncio.run(
@@ -374,7 +593,8 @@ Examples:
                 print(f"Duration: {result.get('duration_seconds', 0):.1f}s")
 
         else:
-            # Run batch
+            # Run batch; the batch job persists every scenario, so parse the whole file at once
+            scenarios = load_scenarios_from_file(args.scenarios_file)
             result = asyncio.run(run_batch_scenarios(scenarios, args.output_dir, prompt_spec_name=args.prompt_spec))
 
     elif args.command == "status":
@@ -382,7 +602,7 @@ Examples:
         import requests
 
         try:
-            response = requests.get(f"{args.api_url}/api/batches/{args.batch_id}")
+            response = _get_http_session().get(f"{args.api_url}/api/batches/{args.batch_id}")
 
             if response.status_code == 200:
                 status = response.json()
@@ -411,22 +631,26 @@ Examples:
             url = f"{args.api_url}/api/batches/{args.batch_id}/results"
             params = {"format": args.format}
 
-            response = requests.get(url, params=params)
-
-            if response.status_code == 200:
-                if args.output:
-                    with open(args.output, "w", encoding="utf-8") as f:
-                        if args.format == "json":
-                            json.dump(response.json(), f, ensure_ascii=False, indent=2)
-                        else:
-                            f.write(response.text)
-                    print(f"💾 Results saved to: {args.output}")
+            # Stream CSV/NDJSON bodies straight to disk; JSON is re-indented so it is read whole
+            stream_to_file = bool(args.output) and args.format != "json"
+
+            with _get_http_session().get(url, params=params, stream=stream_to_file) as response:
+                if response.status_code == 200:
+                    if stream_to_file:
+                        with open(args.output, "wb") as f:
+                            for chunk in response.iter_content(chunk_size=FETCH_CHUNK_SIZE):
+                                f.write(chunk)
+                        print(f"💾 Results saved to: {args.output}")
+                    elif args.output:
+                        with open(args.output, "w", encoding="utf-8") as f:
+                            f.write(dumps_json(orjson.loads(response.content) if orjson else response.json()))
+                        print(f"💾 Results saved to: {args.output}")
+                    else:
+                        print(response.text)
+                elif response.status_code == 404:
+                    print(f"❌ Batch not found: {args.batch_id}")
                 else:
-                    print(response.text)
-            elif response.status_code == 404:
-                print(f"❌ Batch not found: {args.batch_id}")
-            else:
-                print(f"❌ API error: {response.status_code}")
+                    print(f"❌ API error: {response.status_code}")
 
         except requests.RequestException as e:
             print(f"❌ Failed to connect to API: {str(e)}")
@@ -437,6 +661,8 @@ Examples:
 
 def handle_prompts_command(args):
     """Handle prompt specification management commands"""
+    from src.prompt_specification import PromptSpecificationManager
+
     manager = PromptSpecificationManager()
 
     if not args.prompts_command:
@@ -479,10 +705,10 @@ def handle_prompts_command(args):
 
             if args.output:
                 with open(args.output, "w", encoding="utf-8") as f:
-                    json.dump(contents, f, ensure_ascii=False, indent=2)
+                    f.write(dumps_json(contents))
                 print(f"💾 Specification saved to: {args.output}")
             else:
-                print(json.dumps(contents, ensure_ascii=False, indent=2))
+                print(dumps_json(contents))
 
         elif args.prompts_command == "create":
             # Create new specification
@@ -490,8 +716,7 @@ def handle_prompts_command(args):
                 print(f"❌ Specification file not found: {args.from_file}")
                 sys.exit(1)
 
-            with open(args.from_file, "r", encoding="utf-8") as f:
-                spec_data = json.load(f)
+            spec_data = read_json_file(args.from_file)
 
             if manager.specification_exists(args.spec_name):
                 print(f"⚠️  Specification '{args.spec_name}' already exists. Overwriting...")
@@ -509,17 +734,13 @@ def handle_prompts_command(args):
                 print(f"❌ Target specification already exists: {args.new_spec}")
                 sys.exit(1)
 
-            # Get source contents
-            source_contents = manager.get_specification_contents(args.source_spec)
-
-            # Update metadata
-            source_contents["name"] = getattr(args, "display_name", None) or f"{source_contents['name']} (Copy)"
-            source_contents["version"] = args.version
-            if args.description:
-                source_contents["description"] = args.description
-
-            # Save new specification
-            manager.save_specification(args.new_spec, source_contents)
+            manager.duplicate_specification(
+                args.source_spec,
+                args.new_spec,
+                display_name=args.display_name,
+                version=args.version,
+                description=args.description or None,
+            )
             print(f"✅ Specification duplicated from '{args.source_spec}' to '{args.new_spec}'!")
 
         elif args.prompts_command == "delete":
@@ -547,15 +768,11 @@ def handle_prompts_command(args):
                 print(f"❌ Specification file not found: {args.spec_file}")
                 sys.exit(1)
 
-            with open(args.spec_file, "r", encoding="utf-8") as f:
-                spec_data = json.load(f)
-
-            # Create temporary specification object for validation
-            from src.prompt_specification import SystemPromptSpecification
+            spec_data = read_json_file(args.spec_file)
 
             try:
-                specification = SystemPromptSpecification.from_dict(spec_data)
-                issues = manager.validate_specification(specification)
+                # Build a temporary specification object and validate it in one pass
+                specification, issues = manager.build_and_validate_specification(spec_data)
 
                 if issues:
                     print("❌ Specification validation failed:")
@@ -6,13 +6,12 @@ Replaces the existing ConversationEngine with multi-agent orchestration capabili
 
 import asyncio
 import time
-from typing import Dict, Any, Optional, Tuple
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 # AutoGen imports
 from autogen_agentchat.messages import HandoffMessage, TextMessage
 from autogen_agentchat.agents import AssistantAgent
-from autogen_agentchat.base import TaskResult
+from autogen_agentchat.teams import Swarm
 
 # Existing infrastructure
 from src.openai_wrapper import OpenAIWrapper
@@ -26,7 +25,7 @@ from src.config import Config
 # AutoGen infrastructure
 from src.autogen_mas_factory import AutogenMASFactory
 from src.conversation_adapter import ConversationAdapter
-from src.autogen_tools import AutogenToolFactory
+from src.autogen_tools import AutogenToolFactory, EndCallTool
 from src.autogen_model_client import AutogenModelClientFactory
 from src.conversation_turn_manager import ConversationTurnManager
 from src.conversation_context import ConversationContext
@@ -35,6 +34,9 @@ from src.conversation_loop_orchestrator import ConversationLoopOrchestrator
 # Braintrust tracing import
 from braintrust import traced
 
+# Spec agents that simulate the caller or grade the conversation rather than serve it
+SIMULATION_ROLES = ("client", "evaluator")
+
 
 class AutogenConversationEngine:
     """
@@ -43,16 +45,22 @@ class AutogenConversationEngine:
     AutoGen's multi-agent coordination, tool calling, and memory management.
     """
 
-    def __init__(self, openai_wrapper: OpenAIWrapper, prompt_spec_name: str = "default_prompts"):
+    def __init__(
+        self,
+        openai_wrapper: OpenAIWrapper,
+        prompt_spec_name: str = "default_prompts",
+        webhook_manager: Optional[WebhookManager] = None,
+    ):
         """
         Initialize AutogenConversationEngine with OpenAIWrapper and prompt specification.
 
         Args:
             openai_wrapper: OpenAI API wrapper instance
             prompt_spec_name: Name of the prompt specification to use (defaults to "default_prompts")
+            webhook_manager: Webhook manager to use (defaults to the process-wide shared manager)
         """
         self.openai = openai_wrapper
-        self.webhook_manager = WebhookManager()
+        self.webhook_manager = webhook_manager or WebhookManager.shared()
         self.logger = get_logger()
         self.error_handler = ConversationErrorHandler(self.logger)
         self.prompt_spec_name = prompt_spec_name
@@ -60,7 +68,7 @@ class AutogenConversationEngine:
         self.loop_orchestrator = ConversationLoopOrchestrator(self.turn_manager, self.logger)
 
         # Load prompt specification
-        self.prompt_manager = PromptSpecificationManager()
+        self.prompt_manager = PromptSpecificationManager.shared()
         self.prompt_specification = self.prompt_manager.load_specification(prompt_spec_name)
 
         self.logger.log_info(
@@ -68,7 +76,7 @@ class AutogenConversationEngine:
             extra_data={
                 "spec_name": prompt_spec_name,
                 "spec_version": self.prompt_specification.version,
-                "agents": list(self.prompt_specification.agents.keys()),
+                "agents": self.prompt_specification.agents.keys(),
                 "engine_type": "AutoGen",
             },
         )
@@ -89,7 +97,8 @@ class AutogenConversationEngine:
     ) -> Dict[str, Any]:
         """
         Run a basic conversation simulation without tools.
-        Delegates to run_conversation_with_tools() with empty tools for consistency.
+        Follows the same flow as run_conversation_with_tools(), but the serving agents get no tools;
+        the simulated client keeps end_call so it can still finish the call.
 
         Args:
             scenario: Dictionary containing scenario name and variables
@@ -112,8 +121,7 @@ class AutogenConversationEngine:
             },
         )
 
-        # Delegate to run_conversation_with_tools() with tools disabled
-        result = await self.run_conversation_with_tools(scenario, max_turns, timeout_sec)
+        result = await self._run_conversation(scenario, max_turns, timeout_sec, tools_enabled=False)
 
         # Ensure tools_used is False for basic conversation
         if "tools_used" in result:
@@ -121,6 +129,30 @@ class AutogenConversationEngine:
 
         return result
 
+    async def run_conversations_batch(
+        self, scenarios: List[Dict[str, Any]], concurrency: Optional[int] = None, use_tools: bool = True
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Run many scenarios concurrently on this engine.
+
+        Args:
+            scenarios: Scenarios in the same format as run_conversation_with_tools() takes
+            concurrency: Maximum conversations in flight (defaults to Config.CONCURRENCY)
+            use_tools: Run with tools (run_conversation_with_tools) or without (run_conversation)
+
+        Returns:
+            One result per scenario, in input order. Conversation failures are result dictionaries
+            as usual; an exception escaping a run is returned in its place instead of cancelling the rest.
+        """
+        slots = asyncio.Semaphore(concurrency or Config.CONCURRENCY)
+        run = self.run_conversation_with_tools if use_tools else self.run_conversation
+
+        async def run_one(scenario: Dict[str, Any]) -> Dict[str, Any]:
+            async with slots:
+                return await run(scenario)
+
+        return await asyncio.gather(*(run_one(scenario) for scenario in scenarios), return_exceptions=True)
+
     def _create_user_agent(self, model_client, formatted_spec: SystemPromptSpecification, session_id: str) -> AssistantAgent:
         """
         Create AssistantAgent for realistic user simulation using client agent from formatted spec.
@@ -138,63 +170,105 @@ class AutogenConversationEngine:
         if not client_agent_spec:
             raise ValueError("No 'client' agent found in formatted specification for user simulation")
 
-        # Always add end_call tool to user agent for conversation termination
-        from src.autogen_tools import AutogenToolFactory
-        tool_factory = AutogenToolFactory(session_id)
-        user_tools = tool_factory.get_tools_for_agent(["end_call"])
-
+        # Always add end_call tool to user agent for conversation termination; bound directly,
+        # without a factory lookup, since it is the user agent's only tool
         user_agent = AssistantAgent(
-            name="client", 
-            model_client=model_client, 
+            name="client",
+            model_client=model_client,
             system_message=client_agent_spec.prompt,
-            tools=user_tools,
+            tools=[EndCallTool(session_id)],
             reflect_on_tool_use=False
         )
 
         return user_agent
 
+    @staticmethod
+    def _plain_single_agent(spec: SystemPromptSpecification, tools_enabled: bool = True) -> Optional[str]:
+        """Name of the only serving agent when it has no (enabled) tools or handoffs, otherwise None."""
+        serving = [name for name in spec.agents if name not in SIMULATION_ROLES]
+        if len(serving) != 1:
+            return None
+        agent_spec = spec.agents[serving[0]]
+        return None if (tools_enabled and agent_spec.tools) or agent_spec.handoffs else serving[0]
+
+    def _create_agent_team(
+        self, spec: SystemPromptSpecification, model_client, session_id: str, tools_enabled: bool = True
+    ) -> Union[Swarm, AssistantAgent]:
+        """
+        Build the agent side of the conversation.
+
+        A lone agent without tools or handoffs answers every turn itself, so it runs directly
+        instead of through a Swarm; both expose run(task=...) returning a TaskResult.
+        """
+        agent_name = self._plain_single_agent(spec, tools_enabled)
+        if agent_name:
+            agent_spec = spec.agents[agent_name]
+            return AssistantAgent(
+                name=agent_name,
+                model_client=model_client,
+                system_message=agent_spec.prompt,
+                description=agent_spec.description or f"Agent {agent_name}",
+            )
+
+        tools = AutogenToolFactory(session_id).get_tools_for_agent(spec.tool_names) if tools_enabled else []
+        return AutogenMASFactory(session_id).create_swarm_team(spec, tools, model_client)
+
     @traced(name="autogen_run_conversation_with_tools")
     async def run_conversation_with_tools(
         self, scenario: Dict[str, Any], max_turns: Optional[int] = None, timeout_sec: Optional[int] = None
     ) -> Dict[str, Any]:
         """Run conversation simulation with tools using AutoGen Swarm."""
+        return await self._run_conversation(scenario, max_turns, timeout_sec, tools_enabled=True)
+
+    async def _run_conversation(
+        self,
+        scenario: Dict[str, Any],
+        max_turns: Optional[int],
+        timeout_sec: Optional[int],
+        tools_enabled: bool,
+    ) -> Dict[str, Any]:
+        """Run the conversation; without tools_enabled no tool instances are built for the serving agents."""
         max_turns = max_turns or Config.MAX_TURNS
         timeout_sec = timeout_sec or Config.TIMEOUT_SEC
 
         name = scenario.get("name", "unknown")
         variables = scenario.get("variables", {})
-        start = time.time()
+        start, started = time.time(), time.monotonic()
+
+        # A client lookup opens its own webhook session, so a separate one is only started without a
+        # client_id or when the lookup returns no session
+        session_id = None if variables.get("client_id") else await self.webhook_manager.initialize_session()
+        variables, webhook_sid = await self._enrich_variables_with_client_data(variables, session_id)
+        session_id = webhook_sid or session_id or await self.webhook_manager.initialize_session()
+        variables["session_id"] = session_id
 
         context = ConversationContext(
-            session_id=await self.webhook_manager.initialize_session(),
+            session_id=session_id,
             scenario_name=name,
             max_turns=max_turns,
             timeout_sec=timeout_sec,
             start_time=start,
+            start_monotonic=started,
         )
 
-        variables, webhook_sid = await self._enrich_variables_with_client_data(variables, context.session_id)
-        if webhook_sid:
-            context.session_id = webhook_sid
+        try:
+            team, user_agent, initial = self._build_participants(variables, context.session_id, tools_enabled)
+        except Exception as err:
+            return self.error_handler.handle_error_by_type(err, context, name, self.prompt_spec_name)
 
         try:
-            spec = self.prompt_specification.format_with_variables(variables)
-            model = AutogenModelClientFactory.create_from_openai_wrapper(self.openai)
-            user_agent = self._create_user_agent(model, spec, context.session_id)
-            tool_names = {t for a in spec.agents.values() for t in a.tools}
-            tools = AutogenToolFactory(context.session_id).get_tools_for_agent(list(tool_names))
-            swarm = AutogenMASFactory(context.session_id).create_swarm_team(spec, tools, model)
-            initial = variables.get("client_greeting") or variables.get("GREETING") or "Добрый день!"
-            await self.loop_orchestrator.run_conversation_loop(swarm, user_agent, initial, context)
+            await self.loop_orchestrator.run_conversation_loop(team, user_agent, initial, context)
+        except asyncio.TimeoutError:
+            return self.error_handler.handle_timeout_error(context, name, context.timeout_sec)
         except TypeError as exc:
-            return self._format_non_text_error(exc, context, name, start)
+            return self.error_handler.handle_non_text_message_error(exc, context, name, self.prompt_specification)
         except Exception as err:
             return self.error_handler.handle_error_by_type(err, context, name, self.prompt_spec_name)
 
-        duration = time.time() - context.start_time
-        synthetic = TaskResult(messages=context.all_messages, stop_reason=f"completed_{context.turn_count}_turns")
-        result = ConversationAdapter.autogen_to_contract_format(
-            task_result=synthetic,
+        duration = context.elapsed()
+        result = ConversationAdapter.messages_to_contract_format(
+            messages=context.all_messages,
+            stop_reason=f"completed_{context.turn_count}_turns",
             session_id=context.session_id,
             scenario_name=name,
             duration=duration,
@@ -208,26 +282,12 @@ class AutogenConversationEngine:
         )
         return result
 
-    def _format_non_text_error(
-        self, exc: TypeError, context: ConversationContext, scenario_name: str, start: float
-    ) -> Dict[str, Any]:
-        task_result = getattr(exc, "task_result", None)
-        history = ConversationAdapter.extract_conversation_history(
-            context.all_messages, self.prompt_specification
-        )
-        end = time.time()
-        return {
-            "session_id": context.session_id,
-            "scenario": scenario_name,
-            "status": "failed",
-            "error": str(exc),
-            "error_type": "NonTextMessageError",
-            "total_turns": context.turn_count,
-            "duration_seconds": end - start,
-            "tools_used": True,
-            "conversation_history": history,
-            "start_time": datetime.fromtimestamp(start).isoformat(),
-            "end_time": datetime.fromtimestamp(end).isoformat(),
-            "mas_stop_reason": getattr(task_result, "stop_reason", None),
-            "mas_message_count": len(getattr(task_result, "messages", [])),
-        }
+    def _build_participants(
+        self, variables: Dict[str, Any], session_id: str, tools_enabled: bool
+    ) -> Tuple[Union[Swarm, AssistantAgent], AssistantAgent, str]:
+        """Format the spec for this scenario and build the agent team, the simulated client and its first message."""
+        spec = self.prompt_specification.format_with_variables(variables)
+        model = AutogenModelClientFactory.create_from_openai_wrapper(self.openai)
+        user_agent = self._create_user_agent(model, spec, session_id)
+        team = self._create_agent_team(spec, model, session_id, tools_enabled)
+        return team, user_agent, spec.initial_task
@@ -3,8 +3,10 @@ AutogenMASFactory - Infrastructure Layer
 Creates AutoGen Swarm teams from SystemPromptSpecification with proper configuration
 """
 
-from typing import List, Dict
+from functools import cached_property, lru_cache
+from typing import List, Dict, Tuple
 from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.base import Handoff
 from autogen_agentchat.teams import Swarm
 from autogen_agentchat.conditions import TextMessageTermination, MaxMessageTermination
 
@@ -14,6 +16,35 @@ from src.prompt_specification import SystemPromptSpecification, AgentPromptSpeci
 from src.logging_utils import get_logger
 from src.config import Config
 
+# Agent graph shape of a specification: (agent_name, handoff targets) per agent
+AgentGraph = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+@lru_cache(maxsize=128)
+def _resolve_handoffs(agent_graph: AgentGraph) -> Tuple[Dict[str, Tuple[str, ...]], Tuple[Tuple[str, str], ...]]:
+    """Resolve handoff targets to existing agents, returning the config and any dangling (agent, target) pairs"""
+    agent_names = {agent_name for agent_name, _ in agent_graph}
+    handoff_config = {}
+    dangling = []
+    for agent_name, targets in agent_graph:
+        handoff_config[agent_name] = tuple(target for target in targets if target in agent_names)
+        dangling.extend((agent_name, target) for target in targets if target not in agent_names)
+    return handoff_config, tuple(dangling)
+
+
+class _SharedHandoff(Handoff):
+    """Handoff that builds its tool once; the tool only returns the handoff message, so sessions can share it"""
+
+    @cached_property
+    def handoff_tool(self) -> BaseTool:
+        return super().handoff_tool
+
+
+@lru_cache(maxsize=256)
+def _shared_handoff(target: str) -> Handoff:
+    """Handoff to an agent, reused by every agent and session that hands off to it"""
+    return _SharedHandoff(target=target)
+
 
 class AutogenMASFactory:
     """
@@ -48,7 +79,7 @@ class AutogenMASFactory:
             extra_data={
                 "spec_name": system_prompt_spec.name,
                 "spec_version": system_prompt_spec.version,
-                "agents": list(system_prompt_spec.agents.keys()),
+                "agents": system_prompt_spec.agents.keys(),
                 "tools_count": len(tools),
             },
         )
@@ -65,7 +96,7 @@ class AutogenMASFactory:
 
         self.logger.log_info(
             f"Swarm team created successfully for session {self.session_id}",
-            extra_data={"agents_count": len(agents), "agent_names": [agent.name for agent in agents]},
+            extra_data={"agents_count": len(agents), "agent_names": system_prompt_spec.agents.keys()},
         )
 
         return swarm
@@ -93,15 +124,14 @@ class AutogenMASFactory:
         tools_by_name = {tool.name: tool for tool in tools}
 
         for agent_name, agent_spec in agents_config.items():
-            # Get tools for this agent
+            # Get tools for this agent; an empty tool list means the conversation runs without tools
             agent_tools = []
-            for tool_name in agent_spec.tools:
+            for tool_name in agent_spec.tools if tools else ():
                 if tool_name in tools_by_name:
                     agent_tools.append(tools_by_name[tool_name])
-                else:
+                elif not tool_name.startswith("handoff_"):
                     # Skip handoff tools as they're handled by AutoGen's handoff mechanism
-                    if not tool_name.startswith("handoff_"):
-                        self.logger.log_warning(f"Tool '{tool_name}' not found for agent '{agent_name}'")
+                    self.logger.log_warning(f"Tool '{tool_name}' not found for agent '{agent_name}'")
 
             # Get handoffs for this agent
             agent_handoffs = handoff_config.get(agent_name, [])
@@ -110,7 +140,7 @@ class AutogenMASFactory:
             agent = AssistantAgent(
                 name=agent_name,
                 model_client=model_client,
-                handoffs=agent_handoffs,
+                handoffs=[_shared_handoff(target) for target in agent_handoffs],
                 tools=agent_tools,
                 system_message=agent_spec.prompt,
                 description=agent_spec.description or f"Agent {agent_name}",
@@ -118,16 +148,22 @@ class AutogenMASFactory:
 
             agents.append(agent)
 
-            self.logger.log_info(
-                f"Created agent '{agent_name}' for session {self.session_id}",
-                extra_data={"tools_count": len(agent_tools), "handoffs": agent_handoffs, "session_id": self.session_id},
-            )
+            if Config.ENABLE_DEBUG_TRACES:
+                self.logger.log_info(
+                    f"Created agent '{agent_name}' for session {self.session_id}",
+                    extra_data={
+                        "tools_count": len(agent_tools),
+                        "handoffs": agent_handoffs,
+                        "session_id": self.session_id,
+                    },
+                )
 
         return agents
 
     def _setup_agent_handoffs(self, agents_config: Dict[str, AgentPromptSpecification]) -> Dict[str, List[str]]:
         """
-        Configures handoff relationships: agent-to-agent only (no user handoffs)
+        Configures handoff relationships: agent-to-agent only (no user handoffs).
+        Resolution depends only on the agent graph, so it is computed once per specification shape.
 
         Args:
             agents_config: Dictionary of agent configurations
@@ -135,28 +171,22 @@ class AutogenMASFactory:
         Returns:
             Dictionary mapping agent_name -> list of handoff targets (agents only)
         """
-        handoff_config = {}
-
-        for agent_name, agent_spec in agents_config.items():
-            handoffs = []
+        agent_graph = tuple(
+            (agent_name, tuple(agent_spec.handoffs or ())) for agent_name, agent_spec in agents_config.items()
+        )
+        resolved, dangling = _resolve_handoffs(agent_graph)
 
-            # Add agent-to-agent handoffs from specification
-            if agent_spec.handoffs:
-                for target_agent in agent_spec.handoffs.keys():
-                    if target_agent in agents_config:
-                        handoffs.append(target_agent)
-                    else:
-                        self.logger.log_warning(
-                            f"Agent '{agent_name}' has handoff to non-existent agent: '{target_agent}'"
-                        )
+        for agent_name, target_agent in dangling:
+            self.logger.log_warning(f"Agent '{agent_name}' has handoff to non-existent agent: '{target_agent}'")
 
-            # NOTE: Removed user handoff target since user is now external to MAS
-            handoff_config[agent_name] = handoffs
+        # NOTE: Removed user handoff target since user is now external to MAS
+        handoff_config = {agent_name: list(targets) for agent_name, targets in resolved.items()}
 
-        self.logger.log_info(
-            f"Configured handoffs for session {self.session_id}",
-            extra_data={"handoff_config": handoff_config, "user_external": True},
-        )
+        if Config.ENABLE_DEBUG_TRACES:
+            self.logger.log_info(
+                f"Configured handoffs for session {self.session_id}",
+                extra_data={"handoff_config": handoff_config, "user_external": True},
+            )
 
         return handoff_config
 
@@ -175,13 +205,14 @@ class AutogenMASFactory:
         max_msg_termination = MaxMessageTermination(max_messages=max_internal_messages)
         termination = text_termination | max_msg_termination
 
-        self.logger.log_info(
-            f"Created termination conditions for session {self.session_id}",
-            extra_data={
-                "user_external": True,
-                "conditions": ["TextMessageTermination", "MaxMessageTermination"],
-                "max_internal_messages": max_internal_messages,
-            },
-        )
+        if Config.ENABLE_DEBUG_TRACES:
+            self.logger.log_info(
+                f"Created termination conditions for session {self.session_id}",
+                extra_data={
+                    "user_external": True,
+                    "conditions": ["TextMessageTermination", "MaxMessageTermination"],
+                    "max_internal_messages": max_internal_messages,
+                },
+            )
 
         return termination
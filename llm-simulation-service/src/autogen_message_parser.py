@@ -1,8 +1,11 @@
 """Message parsing utilities for ConversationAdapter."""
 
+import sys
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+import orjson
+
 from autogen_agentchat.messages import (
     BaseChatMessage,
     BaseAgentEvent,
@@ -25,10 +28,12 @@ class AutogenMessageParser:
     def __init__(self) -> None:
         self.logger = get_logger()
 
-    def parse_message(self, message: BaseChatMessage | BaseAgentEvent) -> ParsedMessage:
-        """Parse a single AutoGen message."""
+    def parse_message(
+        self, message: BaseChatMessage | BaseAgentEvent, timestamp: Optional[str] = None
+    ) -> ParsedMessage:
+        """Parse a single AutoGen message, stamping it with ``timestamp`` (defaults to now)."""
         parsed = ParsedMessage()
-        parsed.timestamp = datetime.now().isoformat()
+        parsed.timestamp = timestamp or datetime.now().isoformat()
         parsed.should_skip = self._should_skip_message(message)
         parsed.speaker = self._extract_speaker(message)
         parsed.content = self._extract_content(message)
@@ -54,7 +59,8 @@ class AutogenMessageParser:
             if source in {"tool", "tools"}:
                 return "agent"
             if source and source != "system":
-                return f"agent_{source}"
+                # One shared label string per agent instead of a new one in every history item
+                return sys.intern(f"agent_{source}")
         return "agent"
 
     @staticmethod
@@ -95,7 +101,7 @@ class AutogenMessageParser:
             if isinstance(execution_result, FunctionExecutionResult):
                 result_content = execution_result.content
                 try:
-                    parsed = result_content if not isinstance(result_content, str) else __import__("json").loads(result_content)
+                    parsed = result_content if not isinstance(result_content, str) else orjson.loads(result_content)
                 except Exception:
                     parsed = result_content
                 results.append({"call_id": execution_result.call_id, "content": parsed})
@@ -3,11 +3,15 @@ AutogenModelClient - Infrastructure Layer
 Single entry point for creating OpenAI completion clients for AutoGen usage
 """
 
+import asyncio
 import os
+from weakref import WeakKeyDictionary
 from autogen_ext.models.openai import OpenAIChatCompletionClient
 from src.openai_wrapper import OpenAIWrapper
 from src.logging_utils import get_logger
-from braintrust import wrap_openai
+
+# Model name and the AutoGen client built for it
+CachedClient = tuple[str, OpenAIChatCompletionClient]
 
 
 class AutogenModelClientFactory:
@@ -16,10 +20,16 @@ class AutogenModelClientFactory:
     Centralizes client creation logic to avoid duplication across modules.
     """
 
+    # One AutoGen client per event loop and wrapper, reused by every conversation on that loop sharing the wrapper
+    _clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, WeakKeyDictionary[OpenAIWrapper, CachedClient]]" = (
+        WeakKeyDictionary()
+    )
+
     @staticmethod
     def create_from_openai_wrapper(openai_wrapper: OpenAIWrapper) -> OpenAIChatCompletionClient:
         """
         Creates OpenAIChatCompletionClient from existing OpenAIWrapper config.
+        The client is built once per event loop, wrapper and model, then returned from cache.
 
         Args:
             openai_wrapper: Existing OpenAIWrapper instance
@@ -27,18 +37,27 @@ class AutogenModelClientFactory:
         Returns:
             Configured OpenAIChatCompletionClient for AutoGen usage
         """
+        model = openai_wrapper.model
+        openai_client = openai_wrapper.client
+        loop_clients = AutogenModelClientFactory._clients.setdefault(asyncio.get_running_loop(), WeakKeyDictionary())
+        cached_model, cached_client = loop_clients.get(openai_wrapper, (None, None))
+        # A closed wrapper client is replaced on next use, so the cached client must still point at the current one
+        if cached_model == model and cached_client._client is openai_client:
+            return cached_client
+
         logger = get_logger()
 
         # Extract configuration from OpenAIWrapper
-        api_key = openai_wrapper.client.api_key
-        model = openai_wrapper.model
+        api_key = openai_wrapper.api_key
 
         # Create AutoGen-compatible client
         client = OpenAIChatCompletionClient(model=model, api_key=api_key)
 
-        # Only enable Braintrust tracing if BRAINTRUST_API_KEY is provided
+        # Share the wrapper's OpenAI client so conversation calls reuse its connection pool and rate limits.
+        # The wrapper applies Braintrust tracing to that client when BRAINTRUST_API_KEY is provided.
+        client._client = openai_client
+
         if os.getenv("BRAINTRUST_API_KEY"):
-            client._client = wrap_openai(client._client)
             logger.log_info(
                 f"Created AutoGen client with Braintrust tracing enabled",
                 extra_data={"model": model, "engine_type": "AutoGen", "tracing_enabled": True},
@@ -49,4 +68,5 @@ class AutogenModelClientFactory:
                 extra_data={"model": model, "engine_type": "AutoGen", "tracing_enabled": False},
             )
 
+        loop_clients[openai_wrapper] = (model, client)
         return client
@@ -4,10 +4,10 @@ Creates Tool subclasses that properly handle session isolation and contracts fro
 """
 
 import json
-from typing import List, Type
+from typing import Dict, List, Sequence, Type
 from pydantic import BaseModel, Field
 from autogen_core import CancellationToken
-from autogen_core.tools import BaseTool
+from autogen_core.tools import BaseTool, ToolSchema
 from src.tool_emulator import ToolEmulator
 from src.logging_utils import get_logger
 
@@ -77,11 +77,22 @@ class JsonOutput(BaseModel):
 class SessionAwareTool(BaseTool):
     """Base class for tools that need session isolation"""
 
+    # Tool class -> schema; only the session binding differs between instances of a class
+    _schemas: Dict[type, ToolSchema] = {}
+
     def __init__(self, session_id: str, name: str, description: str, args_type: Type[BaseModel]):
         self.session_id = session_id
         # All tools return a JSON string
         super().__init__(name=name, description=description, args_type=args_type, return_type=JsonOutput)
 
+    @property
+    def schema(self) -> ToolSchema:
+        """Tool schema, built once per tool class instead of on every model call that lists the tools"""
+        schema = SessionAwareTool._schemas.get(type(self))
+        if schema is None:
+            schema = SessionAwareTool._schemas[type(self)] = super().schema
+        return schema
+
 
 class RagFindProductsTool(SessionAwareTool):
     """Tool for finding products with session isolation"""
@@ -256,6 +267,19 @@ class EndCallTool(SessionAwareTool):
             return json.dumps({"error": str(e)}, ensure_ascii=False)
 
 
+# Tool name -> session-aware tool class, built once at import
+TOOL_CLASSES: Dict[str, Type[SessionAwareTool]] = {
+    "rag_find_products": RagFindProductsTool,
+    "add_to_cart": AddToCartTool,
+    "remove_from_cart": RemoveFromCartTool,
+    "get_cart": GetCartTool,
+    "change_delivery_date": ChangeDeliveryDateTool,
+    "set_current_location": SetCurrentLocationTool,
+    "call_transfer": CallTransferTool,
+    "end_call": EndCallTool,
+}
+
+
 class AutogenToolFactory:
     """
     Factory for creating session-isolated Autogen Tool instances
@@ -265,26 +289,15 @@ class AutogenToolFactory:
     def __init__(self, session_id: str):
         self.session_id = session_id
 
-    def get_tools_for_agent(self, tool_names: List[str]) -> List[BaseTool]:
+    def get_tools_for_agent(self, tool_names: Sequence[str]) -> List[BaseTool]:
         """
         Get Tool instances for the specified tool names
         Maps tool names from ToolsSpecification to actual Tool objects
         """
-        tool_map = {
-            "rag_find_products": RagFindProductsTool,
-            "add_to_cart": AddToCartTool,
-            "remove_from_cart": RemoveFromCartTool,
-            "get_cart": GetCartTool,
-            "change_delivery_date": ChangeDeliveryDateTool,
-            "set_current_location": SetCurrentLocationTool,
-            "call_transfer": CallTransferTool,
-            "end_call": EndCallTool,
-        }
-
         tools = []
         for tool_name in tool_names:
-            if tool_name in tool_map:
-                tool_class = tool_map[tool_name]
+            tool_class = TOOL_CLASSES.get(tool_name)
+            if tool_class is not None:
                 tool_instance = tool_class(self.session_id)
                 tools.append(tool_instance)
                 logger.log_info(f"Created Tool '{tool_name}' for session {self.session_id}")
@@ -10,6 +10,7 @@ from src.logging_utils import get_logger
 from src.batch_resource_manager import BatchResourceManager
 from src.scenario_processor import ScenarioProcessor
 from src.batch_progress_tracker import BatchProgressTracker
+from src.webhook_manager import WebhookManager
 
 
 class BatchOrchestrator:
@@ -27,24 +28,50 @@ class BatchOrchestrator:
         self.logger = get_logger()
 
     async def execute_batch(
-        self, batch_job: "BatchJob", progress_callback: Optional[callable]
+        self,
+        batch_job: "BatchJob",
+        progress_callback: Optional[callable],
+        on_result: Optional[callable] = None,
+        drain: Optional[asyncio.Event] = None,
     ) -> Dict[str, Any]:
-        """Execute all scenarios in the batch."""
-        start = time.time()
-        tasks = self._create_scenario_tasks(batch_job, progress_callback)
+        """Execute all scenarios in the batch.
+
+        ``on_result`` is invoked with each scenario result (failures included) as soon as it is available.
+        Once ``drain`` is set, in-flight scenarios finish but no new ones start; the summary then has
+        status ``cancelled`` and covers only the scenarios that ran.
+        """
+        start = time.monotonic()
+        self._prefetch_client_data(batch_job.scenarios)
+        tasks = self._create_scenario_tasks(batch_job, progress_callback, on_result, drain)
         results = await asyncio.gather(*tasks, return_exceptions=True)
-        duration = time.time() - start
+        duration = time.monotonic() - start
+        skipped_count = sum(result is None for result in results)
         successful_results, failed_count = self._process_batch_results(results, batch_job)
-        return self._create_batch_summary(batch_job, successful_results, failed_count, duration)
+        return self._create_batch_summary(batch_job, successful_results, failed_count, duration, skipped_count)
+
+    def _prefetch_client_data(self, scenarios: List[Dict[str, Any]]) -> None:
+        """Start all webhook client lookups up front so scenarios waiting for a slot find them ready."""
+        lookups = []
+        for scenario in scenarios:
+            variables = scenario.get("variables", {})
+            if variables.get("client_id"):
+                lookups.append((variables["client_id"], variables.get("scenario_purchase_history")))
+        if lookups:
+            started = WebhookManager.shared().prefetch(lookups)
+            self.logger.log_info("Prefetching client data", extra_data={"lookups": started})
 
     def _create_scenario_tasks(
-        self, batch_job: "BatchJob", progress_callback: Optional[callable]
+        self,
+        batch_job: "BatchJob",
+        progress_callback: Optional[callable],
+        on_result: Optional[callable],
+        drain: Optional[asyncio.Event] = None,
     ) -> List[asyncio.Task]:
         tasks = []
         for i, scenario in enumerate(batch_job.scenarios):
             tasks.append(
                 asyncio.create_task(
-                    self._run_single_scenario(i, scenario, batch_job, progress_callback)
+                    self._run_single_scenario(i, scenario, batch_job, progress_callback, on_result, drain)
                 )
             )
         return tasks
@@ -55,21 +82,55 @@ class BatchOrchestrator:
         scenario: Dict[str, Any],
         batch_job: "BatchJob",
         progress_callback: Optional[callable],
-    ) -> Dict[str, Any]:
-        async with self.resource_manager.get_semaphore():
+        on_result: Optional[callable] = None,
+        drain: Optional[asyncio.Event] = None,
+    ) -> Optional[Dict[str, Any]]:
+        # The processor acquires the conversation and evaluation slots itself
+        try:
             result = await self.scenario_processor.process_scenario(
                 scenario,
                 scenario_index,
                 batch_job.batch_id,
                 batch_job.prompt_spec_name,
                 batch_job.use_tools,
+                resource_manager=self.resource_manager,
+                drain=drain,
             )
-            if progress_callback:
-                if asyncio.iscoroutinefunction(progress_callback):
-                    await progress_callback(self.progress_tracker.job.completed_scenarios, batch_job.total_scenarios)
-                else:
-                    progress_callback(self.progress_tracker.job.completed_scenarios, batch_job.total_scenarios)
-            return result
+        except Exception as exc:
+            if on_result:
+                await self._invoke_callback(on_result, self._build_failed_result(scenario_index, scenario, exc))
+            raise
+        if result is None:
+            # Skipped while draining
+            return None
+        if on_result:
+            await self._invoke_callback(on_result, result)
+        if progress_callback:
+            await self._invoke_callback(
+                progress_callback, self.progress_tracker.job.completed_scenarios, batch_job.total_scenarios
+            )
+        return result
+
+    @staticmethod
+    async def _invoke_callback(callback: callable, *args: Any) -> None:
+        """Call a sync or async callback."""
+        if asyncio.iscoroutinefunction(callback):
+            await callback(*args)
+        else:
+            callback(*args)
+
+    @staticmethod
+    def _build_failed_result(scenario_index: int, scenario: Dict[str, Any], exc: Exception) -> Dict[str, Any]:
+        """Build the result record reported for a scenario that raised."""
+        return {
+            "scenario_index": scenario_index,
+            "scenario": scenario.get("name", f"scenario_{scenario_index}"),
+            "status": "failed",
+            "error": str(exc),
+            "session_id": None,
+            "score": 1,
+            "comment": f"Ошибка обработки: {str(exc)}",
+        }
 
     def _process_batch_results(
         self, results: List[Any], batch_job: "BatchJob"
@@ -84,17 +145,8 @@ class BatchOrchestrator:
                     extra_data={"batch_id": batch_job.batch_id},
                 )
                 failed += 1
-                failed_result = {
-                    "scenario_index": idx,
-                    "scenario": batch_job.scenarios[idx].get("name", f"scenario_{idx}"),
-                    "status": "failed",
-                    "error": str(result),
-                    "session_id": None,
-                    "score": 1,
-                    "comment": f"Ошибка обработки: {str(result)}",
-                }
-                successful.append(failed_result)
-            else:
+                successful.append(self._build_failed_result(idx, batch_job.scenarios[idx], result))
+            elif result is not None:
                 successful.append(result)
         return successful, failed
 
@@ -104,13 +156,15 @@ class BatchOrchestrator:
         successful_results: List[Dict[str, Any]],
         failed_count: int,
         duration: float,
+        skipped_count: int = 0,
     ) -> Dict[str, Any]:
         return {
             "batch_id": batch_job.batch_id,
-            "status": "completed",
+            "status": "cancelled" if skipped_count else "completed",
             "total_scenarios": batch_job.total_scenarios,
-            "successful_scenarios": batch_job.total_scenarios - failed_count,
+            "successful_scenarios": batch_job.total_scenarios - failed_count - skipped_count,
             "failed_scenarios": failed_count,
+            "skipped_scenarios": skipped_count,
             "duration_seconds": duration,
             "results": successful_results,
         }
@@ -65,7 +65,7 @@ class BatchProcessor:
         self.logger = get_logger()
 
         # Resource manager for concurrency
-        self.resource_manager = BatchResourceManager(self.concurrency)
+        self.resource_manager = BatchResourceManager(self.concurrency, Config.EVALUATION_CONCURRENCY)
 
         # Initialize components
         self.openai_wrapper = OpenAIWrapper(openai_api_key)
@@ -210,8 +210,19 @@ class BatchProcessor:
         job = self.active_jobs[batch_id]
         return job.results
 
-    async def run_batch(self, batch_id: str, progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
-        """Run a batch job using the new orchestrator."""
+    async def run_batch(
+        self,
+        batch_id: str,
+        progress_callback: Optional[Callable] = None,
+        on_result: Optional[Callable] = None,
+        drain: Optional[asyncio.Event] = None,
+    ) -> Dict[str, Any]:
+        """Run a batch job using the new orchestrator.
+
+        ``on_result`` (sync or async) receives every scenario result as soon as it completes.
+        Setting ``drain`` stops new scenarios from starting; the batch is then finalized as cancelled
+        with the results that finished.
+        """
 
         job = self._validate_and_prepare_batch(batch_id)
 
@@ -220,8 +231,11 @@ class BatchProcessor:
         orchestrator = BatchOrchestrator(self.resource_manager, scenario_processor, progress_tracker)
 
         try:
-            result = await orchestrator.execute_batch(job, progress_callback)
-            self._finalize_successful_batch(job, result)
+            result = await orchestrator.execute_batch(job, progress_callback, on_result=on_result, drain=drain)
+            if result.get("skipped_scenarios"):
+                self._finalize_drained_batch(job, result)
+            else:
+                self._finalize_successful_batch(job, result)
             return result
         except Exception as exc:
             self._finalize_failed_batch(job, exc)
@@ -253,6 +267,19 @@ class BatchProcessor:
         job.current_stage = "completed"
         self._save_batch_to_storage(job)
 
+    def _finalize_drained_batch(self, job: BatchJob, result: Dict[str, Any]) -> None:
+        """Persist the partial outcome of a batch stopped by a drain request."""
+        job.results = result["results"]
+        job.failed_scenarios = result["failed_scenarios"]
+        job.completed_scenarios = len(result["results"])
+        job.progress_percentage = (
+            (job.completed_scenarios / job.total_scenarios) * 100 if job.total_scenarios else 100.0
+        )
+        job.status = BatchStatus.CANCELLED
+        job.completed_at = datetime.now()
+        job.current_stage = "cancelled"
+        self._save_batch_to_storage(job)
+
     def _finalize_failed_batch(self, job: BatchJob, exc: Exception) -> None:
         """Persist failure details."""
         job.status = BatchStatus.FAILED
@@ -1,13 +1,15 @@
 """Concurrency control for batch scenario processing."""
 
 import asyncio
+from typing import Optional
 
 
 class BatchResourceManager:
-    """Manage semaphore for scenario concurrency."""
+    """Manage semaphores for scenario and evaluation concurrency."""
 
-    def __init__(self, concurrency: int) -> None:
+    def __init__(self, concurrency: int, evaluation_concurrency: Optional[int] = None) -> None:
         self._semaphore = asyncio.Semaphore(concurrency)
+        self._evaluation_semaphore = asyncio.Semaphore(evaluation_concurrency or concurrency)
 
     async def acquire_scenario_slot(self) -> None:
         """Acquire a slot for scenario processing."""
@@ -21,3 +23,7 @@ class BatchResourceManager:
         """Return the semaphore instance."""
         return self._semaphore
 
+    def get_evaluation_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent evaluations."""
+        return self._evaluation_semaphore
+
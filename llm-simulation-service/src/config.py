@@ -16,11 +16,22 @@ class Config:
     # OpenAI Configuration
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+    # Account rate limits used to pace requests; 0 disables the corresponding limit
+    OPENAI_RPM: int = int(os.getenv("OPENAI_RPM", "5000"))
+    OPENAI_TPM: int = int(os.getenv("OPENAI_TPM", "2000000"))
+    # Cap on simultaneous OpenAI HTTP requests across all conversations; 0 removes the cap
+    OPENAI_MAX_CONCURRENCY: int = int(os.getenv("OPENAI_MAX_CONCURRENCY", "100"))
+    # Idle OpenAI connections kept open between requests, shared by conversations and evaluations
+    OPENAI_KEEPALIVE_CONNECTIONS: int = int(os.getenv("OPENAI_KEEPALIVE_CONNECTIONS", "64"))
+    # SDK-level retries for 429/5xx responses (exponential backoff honouring Retry-After)
+    OPENAI_SDK_MAX_RETRIES: int = int(os.getenv("OPENAI_SDK_MAX_RETRIES", "2"))
 
     # Conversation Configuration
     MAX_TURNS: int = int(os.getenv("MAX_TURNS", "30"))
     TIMEOUT_SEC: int = int(os.getenv("TIMEOUT_SEC", "90"))
     CONCURRENCY: int = int(os.getenv("CONCURRENCY", "4"))
+    # Parallel evaluations in batch mode; defaults to CONCURRENCY
+    EVALUATION_CONCURRENCY: int = int(os.getenv("EVALUATION_CONCURRENCY", str(CONCURRENCY)))
     USE_TOOLS: bool = os.getenv("USE_TOOLS", "True").lower() == "true"
 
     # AutoGen MAS Configuration - Internal message limit for agent conversations
@@ -33,10 +44,20 @@ class Config:
 
     # Webhook Configuration
     WEBHOOK_URL: str = os.getenv("WEBHOOK_URL", "")
+    # Size of the pooled webhook connection set shared by all conversations on an event loop
+    WEBHOOK_MAX_CONNECTIONS: int = int(os.getenv("WEBHOOK_MAX_CONNECTIONS", "100"))
+    # Prefetched client lookups running at once; kept below the pool size so live session calls get connections
+    WEBHOOK_PREFETCH_CONCURRENCY: int = int(os.getenv("WEBHOOK_PREFETCH_CONCURRENCY", "32"))
 
     # File Paths
     PROMPTS_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "prompts")
     SCENARIOS_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "scenarios")
+    # Level of the application log; INFO payloads are not built at WARNING and above
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+    # Full OpenAI request/response payloads and per-conversation Swarm construction details; off for batch runs
+    ENABLE_DEBUG_TRACES: bool = os.getenv("ENABLE_DEBUG_TRACES", "False").lower() == "true"
+    # Write log files from a background thread; disable to write each record before the logging call returns
+    ASYNC_LOGGING: bool = os.getenv("ASYNC_LOGGING", "True").lower() == "true"
     LOGS_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "logs")
     RESULTS_DIR: str = os.path.join(os.path.dirname(os.path.dirname(__file__)), "results")
 
@@ -4,9 +4,10 @@ Converts AutoGen TaskResult and message formats to existing ConversationEngine c
 """
 
 import json
+import re
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 # AutoGen imports
 from autogen_agentchat.messages import BaseAgentEvent, BaseChatMessage
@@ -18,6 +19,9 @@ from src.tool_flush_state_machine import ToolFlushStateMachine
 
 from src.logging_utils import get_logger
 
+# Phrases in the final message that mark a finished call, matched without lowercasing the content
+CALL_ENDED_RE = re.compile("завершил звонок|call ended", re.IGNORECASE)
+
 
 class ConversationAdapter:
     """
@@ -51,6 +55,32 @@ class ConversationAdapter:
             `ConversationHistoryItem` dictionaries defined in
             `docs/contracts/dto/conversation_history_item.md`.
         """
+        return ConversationAdapter.messages_to_contract_format(
+            task_result.messages,
+            task_result.stop_reason,
+            session_id,
+            scenario_name,
+            duration,
+            start_time,
+            prompt_spec,
+        )
+
+    @staticmethod
+    def messages_to_contract_format(
+        messages: Sequence[BaseChatMessage | BaseAgentEvent],
+        stop_reason: Optional[str],
+        session_id: str,
+        scenario_name: str,
+        duration: float,
+        start_time: Optional[float] = None,
+        prompt_spec: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """
+        Converts collected conversation messages to ConversationEngine contract format
+
+        Same result as autogen_to_contract_format, without wrapping the messages in a TaskResult
+        (whose validation copies the whole message list).
+        """
         logger = get_logger()
 
         try:
@@ -60,16 +90,13 @@ class ConversationAdapter:
             end_time = current_time
 
             # Extract conversation history from AutoGen messages
-            conversation_history = ConversationAdapter.extract_conversation_history(task_result.messages, prompt_spec)
+            conversation_history = ConversationAdapter.extract_conversation_history(messages, prompt_spec)
 
             # Determine status based on stop reason and messages
-            status = ConversationAdapter._determine_conversation_status(task_result.stop_reason, conversation_history)
+            status = ConversationAdapter._determine_conversation_status(stop_reason, conversation_history)
 
-            # Count total turns
-            total_turns = len([entry for entry in conversation_history if entry.get("turn")])
-
-            # Check if tools were used
-            tools_used = any(entry.get("tool_calls") or entry.get("tool_results") for entry in conversation_history)
+            # Count total turns and check if tools were used
+            total_turns, tools_used = ConversationAdapter._summarize_history(conversation_history)
 
             result = {
                 "session_id": session_id,
@@ -90,8 +117,8 @@ class ConversationAdapter:
                     "total_turns": total_turns,
                     "status": status,
                     "tools_used": tools_used,
-                    "stop_reason": task_result.stop_reason,
-                    "messages_count": len(task_result.messages),
+                    "stop_reason": stop_reason,
+                    "messages_count": len(messages),
                 },
             )
 
@@ -121,7 +148,7 @@ class ConversationAdapter:
 
     @staticmethod
     def extract_conversation_history(
-        messages: List[BaseChatMessage | BaseAgentEvent],
+        messages: Sequence[BaseChatMessage | BaseAgentEvent],
         prompt_spec: Optional[Any] = None,
     ) -> List[Dict]:
         """Convert AutoGen messages to the ConversationHistoryItem structure."""
@@ -131,9 +158,11 @@ class ConversationAdapter:
         state_machine = ToolFlushStateMachine()
         history: List[Dict[str, Any]] = []
         turn_number = 0
+        # Messages are converted after the conversation ends, so one formatted timestamp serves the whole pass
+        timestamp = datetime.now().isoformat()
 
         for message in messages:
-            parsed = parser.parse_message(message)
+            parsed = parser.parse_message(message, timestamp)
             if parsed.should_skip:
                 continue
             parsed.speaker_display = resolver.resolve_display_name(
@@ -159,6 +188,18 @@ class ConversationAdapter:
         return history
 
 
+    @staticmethod
+    def _summarize_history(conversation_history: List[Dict]) -> Tuple[int, bool]:
+        """Count numbered turns and detect tool usage in a single pass over the history"""
+        total_turns = 0
+        tools_used = False
+        for entry in conversation_history:
+            if entry.get("turn"):
+                total_turns += 1
+            if not tools_used and (entry.get("tool_calls") or entry.get("tool_results")):
+                tools_used = True
+        return total_turns, tools_used
+
     @staticmethod
     def _determine_conversation_status(stop_reason: str, conversation_history: List[Dict]) -> str:
         """
@@ -184,10 +225,8 @@ class ConversationAdapter:
         # Check conversation content for end indicators
         if conversation_history:
             last_entry = conversation_history[-1]
-            content = last_entry.get("content", "").lower()
-
             # Check for conversation completion phrases
-            if any(phrase in content for phrase in ["завершил звонок", "call ended"]):
+            if CALL_ENDED_RE.search(last_entry.get("content") or ""):
                 return "completed"
 
             # Check for tool calls that indicate completion
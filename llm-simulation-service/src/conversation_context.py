@@ -1,3 +1,4 @@
+import time
 from dataclasses import dataclass, field
 from typing import List
 from autogen_agentchat.messages import BaseChatMessage
@@ -12,3 +13,9 @@ class ConversationContext:
     start_time: float
     turn_count: int = 0
     all_messages: List[BaseChatMessage] = field(default_factory=list)
+    # Durations and timeouts use the monotonic clock so wall-clock adjustments cannot skew them
+    start_monotonic: float = field(default_factory=time.monotonic)
+
+    def elapsed(self) -> float:
+        """Seconds since the conversation started."""
+        return time.monotonic() - self.start_monotonic
@@ -1,15 +1,20 @@
 """Centralized error handling for conversation engine."""
 from __future__ import annotations
 
-import time
 from datetime import datetime
 from typing import Any, Dict
 import asyncio
+import re
 
 from src.conversation_context import ConversationContext
 from src.conversation_adapter import ConversationAdapter
 from src.logging_utils import SimulationLogger
 
+# Error messages of OpenAI requests refused for the caller's region, matched case-insensitively in one pass
+API_BLOCKED_RE = re.compile(
+    "geographic restriction|unsupported_country_region_territory|blocked due to geographic", re.IGNORECASE
+)
+
 
 class ConversationErrorHandler:
     """Handle errors for conversation execution."""
@@ -24,8 +29,7 @@ class ConversationErrorHandler:
         if isinstance(error, asyncio.TimeoutError):
             return self.handle_timeout_error(context, scenario_name, context.timeout_sec)
 
-        msg = str(error).lower()
-        if any(term in msg for term in ["geographic restriction", "unsupported_country_region_territory", "blocked due to geographic"]):
+        if API_BLOCKED_RE.search(str(error)):
             return self.handle_api_blocked_error(error, context, scenario_name)
 
         return self.handle_general_error(error, context, scenario_name, spec_name)
@@ -83,6 +87,30 @@ class ConversationErrorHandler:
         result.update({"conversation_history": history, "tools_used": True})
         return result
 
+    def handle_non_text_message_error(
+        self, error: TypeError, context: ConversationContext, scenario_name: str, prompt_spec: Any = None
+    ) -> Dict[str, Any]:
+        """Handle a MAS turn that ended on a non-text message; ``error.task_result`` holds that turn's result."""
+        task_result = getattr(error, "task_result", None)
+        self.logger.log_error(
+            f"AutoGen MAS ended a turn without a text message: {error}",
+            extra_data={
+                "session_id": context.session_id,
+                "scenario_name": scenario_name,
+                "completed_turns": context.turn_count,
+                "mas_stop_reason": getattr(task_result, "stop_reason", None),
+            },
+        )
+        history = ConversationAdapter.extract_conversation_history(context.all_messages, prompt_spec)
+        result = self._create_base_error_result(context, scenario_name, "failed", str(error), "NonTextMessageError")
+        result.update({
+            "tools_used": True,
+            "conversation_history": history,
+            "mas_stop_reason": getattr(task_result, "stop_reason", None),
+            "mas_message_count": len(getattr(task_result, "messages", [])),
+        })
+        return result
+
     def handle_general_error(
         self, error: Exception, context: ConversationContext, scenario_name: str, spec_name: str
     ) -> Dict[str, Any]:
@@ -90,7 +118,7 @@ class ConversationErrorHandler:
         error_context = {
             "session_id": context.session_id,
             "scenario_name": scenario_name,
-            "duration_so_far": time.time() - context.start_time,
+            "duration_so_far": context.elapsed(),
             "max_turns": context.max_turns,
             "timeout_sec": context.timeout_sec,
             "completed_turns": context.turn_count,
@@ -121,8 +149,7 @@ class ConversationErrorHandler:
         error_type: str,
     ) -> Dict[str, Any]:
         """Create the base error result structure."""
-        end_time = time.time()
-        duration = end_time - context.start_time
+        duration = context.elapsed()
         return {
             "session_id": context.session_id,
             "scenario": scenario_name,
@@ -132,5 +159,5 @@ class ConversationErrorHandler:
             "total_turns": context.turn_count,
             "duration_seconds": duration,
             "start_time": datetime.fromtimestamp(context.start_time).isoformat(),
-            "end_time": datetime.fromtimestamp(end_time).isoformat(),
+            "end_time": datetime.fromtimestamp(context.start_time + duration).isoformat(),
         }
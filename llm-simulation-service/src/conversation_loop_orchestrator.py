@@ -1,7 +1,7 @@
 """Conversation loop orchestration service."""
+from itertools import islice
 from typing import Optional
 import asyncio
-import time
 
 from autogen_agentchat.teams import Swarm
 from autogen_agentchat.agents import AssistantAgent
@@ -22,7 +22,7 @@ class ConversationLoopOrchestrator:
 
     async def run_conversation_loop(
         self,
-        swarm: Swarm,
+        swarm: Swarm | AssistantAgent,
         user_agent: AssistantAgent,
         initial_message: str,
         context: ConversationContext,
@@ -47,7 +47,7 @@ class ConversationLoopOrchestrator:
         return context
 
     def _check_conversation_timeout(self, context: ConversationContext) -> None:
-        if time.time() - context.start_time > context.timeout_sec:
+        if context.elapsed() > context.timeout_sec:
             raise asyncio.TimeoutError(
                 f"Conversation timeout after {context.timeout_sec} seconds"
             )
@@ -80,8 +80,8 @@ class ConversationLoopOrchestrator:
             
         last_user_message = user_task_result.messages[-1]
         
-        # Always add user agent messages to conversation history
-        context.all_messages.extend(user_task_result.messages[1:])
+        # Always add user agent messages to conversation history (the first is the agent's message it answered)
+        context.all_messages.extend(islice(user_task_result.messages, 1, None))
         
         # Check if user agent made tool calls (indicating intent to end simulation)
         if isinstance(last_user_message, (ToolCallRequestEvent, ToolCallExecutionEvent)):
@@ -94,10 +94,11 @@ class ConversationLoopOrchestrator:
         # If it's a TextMessage, extract content and continue
         if isinstance(last_user_message, TextMessage):
             current = last_user_message.content
-            self.logger.log_info(
-                "User simulation agent generated response",
-                extra_data={"session_id": context.session_id, "user_response": current[:100]},
-            )
+            if self.logger.info_enabled():
+                self.logger.log_info(
+                    "User simulation agent generated response",
+                    extra_data={"session_id": context.session_id, "user_response": current[:100]},
+                )
             return True, current
         
         # Unexpected message type, log and terminate
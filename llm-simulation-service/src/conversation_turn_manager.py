@@ -1,8 +1,9 @@
 """Service for managing individual conversation turns."""
+import re
 from typing import Optional, Tuple
 
 from autogen_agentchat.teams import Swarm
-from autogen_agentchat.messages import HandoffMessage, TextMessage
+from autogen_agentchat.messages import HandoffMessage, ModelClientStreamingChunkEvent, TextMessage
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.base import TaskResult
 
@@ -10,6 +11,9 @@ from src.logging_utils import SimulationLogger
 from src.conversation_context import ConversationContext
 from src.turn_result import TurnResult
 
+# Stop reasons that mean the MAS ended the conversation, matched case-insensitively in one pass
+STOP_REASON_TERMINATION_RE = re.compile("terminate|end|finished|completed", re.IGNORECASE)
+
 
 class ConversationTurnManager:
     """Handle execution of a single conversation turn."""
@@ -19,29 +23,30 @@ class ConversationTurnManager:
 
     async def execute_turn(
         self,
-        swarm: Swarm,
+        swarm: Swarm | AssistantAgent,
         user_message: str,
         target_agent: str,
         context: ConversationContext,
     ) -> TurnResult:
         """Run a conversation turn and determine continuation."""
         context.turn_count += 1
-        self.logger.log_info(
-            f"Turn {context.turn_count}: User -> {target_agent}",
-            extra_data={"session_id": context.session_id, "user_message": user_message[:100]},
-        )
+        if self.logger.info_enabled():
+            self.logger.log_info(
+                f"Turn {context.turn_count}: User -> {target_agent}",
+                extra_data={"session_id": context.session_id, "user_message": user_message[:100]},
+            )
 
-        task_result = await swarm.run(
-            task=HandoffMessage(source="client", target=target_agent, content=user_message)
+        task_result = await self._stream_turn(
+            swarm, HandoffMessage(source="client", target=target_agent, content=user_message), context
         )
-        context.all_messages.extend(task_result.messages)
 
         last_message = self._validate_agent_response(task_result, context)
 
-        self.logger.log_info(
-            f"Turn {context.turn_count}: {last_message.source} -> User",
-            extra_data={"session_id": context.session_id, "agent_response": last_message.content[:100]},
-        )
+        if self.logger.info_enabled():
+            self.logger.log_info(
+                f"Turn {context.turn_count}: {last_message.source} -> User",
+                extra_data={"session_id": context.session_id, "agent_response": last_message.content[:100]},
+            )
 
         should_continue, reason = self._determine_continuation(task_result, context)
 
@@ -52,6 +57,20 @@ class ConversationTurnManager:
             termination_reason=reason,
         )
 
+    @staticmethod
+    async def _stream_turn(
+        swarm: Swarm | AssistantAgent, task: HandoffMessage, context: ConversationContext
+    ) -> TaskResult:
+        """Run the turn as a stream, recording each message as soon as the MAS emits it."""
+        task_result = None
+        async for item in swarm.run_stream(task=task):
+            if isinstance(item, TaskResult):
+                task_result = item
+            elif not isinstance(item, ModelClientStreamingChunkEvent):
+                # A turn cut short by a timeout or error still leaves its messages in the history
+                context.all_messages.append(item)
+        return task_result
+
     async def generate_user_response(
         self, user_agent: AssistantAgent, agent_message: TextMessage
     ) -> TaskResult:
@@ -64,7 +83,8 @@ class ConversationTurnManager:
     ) -> TextMessage:
         """Ensure the MAS returned a TextMessage."""
         last_message = task_result.messages[-1]
-        if not isinstance(last_message, TextMessage):
+        # AutoGen has no TextMessage subclasses, so an exact type check suffices
+        if type(last_message) is not TextMessage:
             error = TypeError(
                 f"MAS terminated with non-text message ({type(last_message).__name__})"
             )
@@ -76,10 +96,7 @@ class ConversationTurnManager:
         self, task_result: TaskResult, context: ConversationContext
     ) -> Tuple[bool, Optional[str]]:
         """Decide whether the conversation should continue."""
-        if task_result.stop_reason and any(
-            term in task_result.stop_reason.lower()
-            for term in ["terminate", "end", "finished", "completed"]
-        ):
+        if task_result.stop_reason and STOP_REASON_TERMINATION_RE.search(task_result.stop_reason):
             self.logger.log_info(
                 f"Conversation ended naturally: {task_result.stop_reason}",
                 extra_data={"session_id": context.session_id},
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedMessage:
     """DTO for parsed AutoGen message matching ConversationHistoryItem structure."""
 
@@ -15,3 +15,15 @@ class ParsedMessage:
     tool_results: Optional[List[Any]] = None
     is_tool_event: bool = False
     should_skip: bool = False
+
+    def to_history_item(self) -> Dict[str, Any]:
+        """Return the ConversationHistoryItem fields, leaving out the parser flags."""
+        return {
+            "turn": self.turn,
+            "speaker": self.speaker,
+            "speaker_display": self.speaker_display,
+            "content": self.content,
+            "timestamp": self.timestamp,
+            "tool_calls": self.tool_calls,
+            "tool_results": self.tool_results,
+        }
@@ -18,7 +18,7 @@ class ConversationEvaluator:
         self.logger = get_logger()
 
         # Load evaluator prompt from specification
-        self.prompt_manager = PromptSpecificationManager()
+        self.prompt_manager = PromptSpecificationManager.shared()
         self.prompt_specification = self.prompt_manager.load_specification(prompt_spec_name)
 
         evaluator_spec = self.prompt_specification.get_agent_prompt("evaluator")
@@ -2,13 +2,40 @@
 Logging infrastructure for LLM Simulation Service
 """
 
+import atexit
 import logging
 import os
-import json
+import queue
+from collections.abc import Set, KeysView, ValuesView
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from typing import Dict, Any, Optional
+
+import orjson
+
 from src.config import Config
 
+# Non-string dict keys (e.g. integer ids in tool arguments) are stringified, as stdlib json did
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _extra_default(value: Any) -> Any:
+    """Convert values orjson cannot encode when the log line is written, not when the payload is built"""
+    if isinstance(value, (Set, KeysView, ValuesView)):
+        return list(value)
+    return str(value)
+
+
+def _format_extra(message: str, extra_data: Dict[str, Any]) -> str:
+    """Append extra_data to a log message as JSON"""
+    payload = orjson.dumps(extra_data, default=_extra_default, option=ORJSON_OPTIONS).decode()
+    return f"{message} - {payload}"
+
+
+def _format_record(record: Dict[str, Any]) -> str:
+    """Encode a structured log record (token, conversation and OpenAI logs) as one JSON line"""
+    return orjson.dumps(record, default=_extra_default, option=ORJSON_OPTIONS).decode()
+
 
 class SimulationLogger:
     """Custom logger for simulation service"""
@@ -23,7 +50,7 @@ class SimulationLogger:
 
         # Main application logger
         self.app_logger = logging.getLogger("simulation_app")
-        self.app_logger.setLevel(logging.INFO)
+        self.app_logger.setLevel(getattr(logging, Config.LOG_LEVEL, logging.INFO))
 
         # Error logger
         self.error_logger = logging.getLogger("simulation_error")
@@ -44,52 +71,72 @@ class SimulationLogger:
         # Setup file handlers
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         batch_suffix = f"_{self.batch_id}" if self.batch_id else ""
+        detailed = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        timestamped = logging.Formatter("%(asctime)s - %(message)s")
+        json_lines = logging.Formatter("%(message)s")
+
+        # (logger, file name, formatter); all files are UTF-8
+        outputs = [
+            (self.app_logger, f"app_{timestamp}{batch_suffix}.log", detailed),
+            (self.error_logger, f"error_{timestamp}{batch_suffix}.log", detailed),
+            (self.token_logger, f"tokens_{timestamp}{batch_suffix}.log", timestamped),
+            (self.conversation_logger, f"conversations_{timestamp}{batch_suffix}.jsonl", json_lines),
+            (self.openai_logger, f"openai_api_{timestamp}{batch_suffix}.jsonl", json_lines),
+        ]
+
+        self._file_handlers = []
+        for logger, filename, formatter in outputs:
+            handler = logging.FileHandler(os.path.join(Config.LOGS_DIR, filename), encoding="utf-8")
+            handler.setFormatter(formatter)
+            # With ASYNC_LOGGING the listener sees every logger's records; each file keeps only its own logger's
+            handler.addFilter(logging.Filter(logger.name))
+            self._file_handlers.append(handler)
+
+        # With ASYNC_LOGGING loggers only enqueue records and one listener thread writes every file,
+        # so conversations running on the event loop never block on disk writes
+        self._listener: Optional[QueueListener] = None
+        if Config.ASYNC_LOGGING:
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            self._logger_handlers = [QueueHandler(log_queue)] * len(outputs)
+            self._listener = QueueListener(log_queue, *self._file_handlers)
+            self._listener.start()
+        else:
+            self._logger_handlers = self._file_handlers
+        for (logger, _, _), handler in zip(outputs, self._logger_handlers):
+            logger.addHandler(handler)
+        atexit.register(self.close)
+
+    def close(self) -> None:
+        """Write out queued records and detach this logger's files; runs at interpreter exit"""
+        atexit.unregister(self.close)
+        for logger, handler in zip(
+            (self.app_logger, self.error_logger, self.token_logger, self.conversation_logger, self.openai_logger),
+            self._logger_handlers,
+        ):
+            logger.removeHandler(handler)
+        if self._listener is not None:
+            self._listener.stop()
+        for handler in self._file_handlers:
+            handler.close()
 
-        # App log handler with UTF-8 encoding
-        app_handler = logging.FileHandler(
-            os.path.join(Config.LOGS_DIR, f"app_{timestamp}{batch_suffix}.log"), encoding="utf-8"
-        )
-        app_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
-        self.app_logger.addHandler(app_handler)
-
-        # Error log handler with UTF-8 encoding
-        error_handler = logging.FileHandler(
-            os.path.join(Config.LOGS_DIR, f"error_{timestamp}{batch_suffix}.log"), encoding="utf-8"
-        )
-        error_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
-        self.error_logger.addHandler(error_handler)
-
-        # Token log handler with UTF-8 encoding
-        token_handler = logging.FileHandler(
-            os.path.join(Config.LOGS_DIR, f"tokens_{timestamp}{batch_suffix}.log"), encoding="utf-8"
-        )
-        token_handler.setFormatter(logging.Formatter("%(asctime)s - %(message)s"))
-        self.token_logger.addHandler(token_handler)
-
-        # Conversation log handler (JSON format) with UTF-8 encoding
-        conversation_handler = logging.FileHandler(
-            os.path.join(Config.LOGS_DIR, f"conversations_{timestamp}{batch_suffix}.jsonl"), encoding="utf-8"
-        )
-        conversation_handler.setFormatter(logging.Formatter("%(message)s"))
-        self.conversation_logger.addHandler(conversation_handler)
-
-        # OpenAI API log handler (JSON format) with UTF-8 encoding
-        openai_handler = logging.FileHandler(
-            os.path.join(Config.LOGS_DIR, f"openai_api_{timestamp}{batch_suffix}.jsonl"), encoding="utf-8"
-        )
-        openai_handler.setFormatter(logging.Formatter("%(message)s"))
-        self.openai_logger.addHandler(openai_handler)
+    def info_enabled(self) -> bool:
+        """Whether info messages reach the app log; lets callers skip building costly extra_data"""
+        return self.app_logger.isEnabledFor(logging.INFO)
 
     def log_info(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
         """Log info message"""
+        if not self.app_logger.isEnabledFor(logging.INFO):
+            return
         if extra_data:
-            message = f"{message} - {json.dumps(extra_data, ensure_ascii=False)}"
+            message = _format_extra(message, extra_data)
         self.app_logger.info(message)
 
     def log_warning(self, message: str, extra_data: Optional[Dict[str, Any]] = None):
         """Log warning message"""
+        if not self.app_logger.isEnabledFor(logging.WARNING):
+            return
         if extra_data:
-            message = f"{message} - {json.dumps(extra_data, ensure_ascii=False)}"
+            message = _format_extra(message, extra_data)
         self.app_logger.warning(message)
 
     def log_error(
@@ -97,7 +144,7 @@ class SimulationLogger:
     ):
         """Log error message"""
         if extra_data:
-            message = f"{message} - {json.dumps(extra_data, ensure_ascii=False)}"
+            message = _format_extra(message, extra_data)
         if exception:
             self.error_logger.error(message, exc_info=exception)
         else:
@@ -111,8 +158,9 @@ class SimulationLogger:
         completion_tokens: int,
         total_tokens: int,
         cost_estimate: float = 0.0,
+        cached_tokens: int = 0,
     ):
-        """Log token usage for cost tracking"""
+        """Log token usage for cost tracking; cached_tokens counts prompt tokens served from the prompt cache"""
         token_data = {
             "session_id": session_id,
             "model": model,
@@ -120,9 +168,10 @@ class SimulationLogger:
             "completion_tokens": completion_tokens,
             "total_tokens": total_tokens,
             "cost_estimate": cost_estimate,
+            "cached_tokens": cached_tokens,
             "timestamp": datetime.now().isoformat(),
         }
-        self.token_logger.info(json.dumps(token_data, ensure_ascii=False))
+        self.token_logger.info(_format_record(token_data))
 
     def log_conversation_turn(
         self,
@@ -143,7 +192,7 @@ class SimulationLogger:
             "tool_results": tool_results,
             "timestamp": datetime.now().isoformat(),
         }
-        self.conversation_logger.info(json.dumps(turn_data, ensure_ascii=False))
+        self.conversation_logger.info(_format_record(turn_data))
 
     def log_conversation_complete(
         self,
@@ -163,7 +212,7 @@ class SimulationLogger:
             "timestamp": datetime.now().isoformat(),
             "event_type": "conversation_complete",
         }
-        self.conversation_logger.info(json.dumps(completion_data, ensure_ascii=False))
+        self.conversation_logger.info(_format_record(completion_data))
 
     def log_openai_request(
         self,
@@ -176,7 +225,9 @@ class SimulationLogger:
         tools: Optional[list] = None,
         response_format: Optional[dict] = None,
     ):
-        """Log OpenAI API request"""
+        """Log OpenAI API request (only with ENABLE_DEBUG_TRACES)"""
+        if not Config.ENABLE_DEBUG_TRACES:
+            return
         request_data = {
             "event_type": "openai_request",
             "request_id": request_id,
@@ -189,7 +240,7 @@ class SimulationLogger:
             "response_format": response_format,
             "timestamp": datetime.now().isoformat(),
         }
-        self.openai_logger.info(json.dumps(request_data, ensure_ascii=False))
+        self.openai_logger.info(_format_record(request_data))
 
     def log_openai_response(
         self,
@@ -202,7 +253,9 @@ class SimulationLogger:
         attempt: int = 1,
         error: Optional[str] = None,
     ):
-        """Log OpenAI API response"""
+        """Log OpenAI API response (only with ENABLE_DEBUG_TRACES)"""
+        if not Config.ENABLE_DEBUG_TRACES:
+            return
         # Handle different response types
         if hasattr(response_content, "content"):
             content = response_content.content
@@ -233,7 +286,7 @@ class SimulationLogger:
             "error": error,
             "timestamp": datetime.now().isoformat(),
         }
-        self.openai_logger.info(json.dumps(response_data, ensure_ascii=False))
+        self.openai_logger.info(_format_record(response_data))
 
 
 # Global logger instance
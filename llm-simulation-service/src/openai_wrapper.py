@@ -3,43 +3,53 @@ OpenAI API wrapper with retry logic and rate limiting
 """
 
 import asyncio
-import json
 import time
 import uuid
 import os
 from typing import Dict, List, Optional, Any, Tuple
-from openai import AsyncOpenAI
+from weakref import WeakKeyDictionary
+import httpx
+import orjson
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
 from asyncio_throttle import Throttler
 import random
 from src.config import Config
 from src.logging_utils import get_logger
+from src.rate_limiter import TokenBucket
 
 # Braintrust imports
 from braintrust import init_logger, wrap_openai
 
+# Rough request-body bytes per prompt token, used to pre-estimate token usage
+BYTES_PER_TOKEN = 4
+
 
 class OpenAIWrapper:
     """Wrapper for OpenAI API with retry logic and rate limiting"""
 
     def __init__(self, api_key: str, model: str = None, max_retries: int = 3):
-        # Initialize standard OpenAI client
-        self.client = AsyncOpenAI(api_key=api_key)
+        # Pace requests against the account's RPM/TPM limits instead of waiting out 429 backoffs
+        self.request_limiter = TokenBucket(Config.OPENAI_RPM) if Config.OPENAI_RPM > 0 else None
+        self.token_limiter = TokenBucket(Config.OPENAI_TPM) if Config.OPENAI_TPM > 0 else None
+
+        # One OpenAI client per event loop: pooled keep-alive connections are bound to the loop that opened them,
+        # and API-launched batches each run on their own loop
+        self.api_key = api_key
+        self._clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = WeakKeyDictionary()
+        self.logger = get_logger()
 
         # Initialize Braintrust tracing
+        self.tracing_enabled = False
         if os.getenv("BRAINTRUST_API_KEY"):
             try:
                 self.braintrust_logger = init_logger(
                     project="LLM Simulation Service", api_key=os.getenv("BRAINTRUST_API_KEY")
                 )
-                # Wrap the OpenAI client with Braintrust tracing
-                self.client = wrap_openai(self.client)
-                self.logger = get_logger()
+                self.tracing_enabled = True
                 self.logger.log_info("Braintrust tracing initialized successfully")
             except Exception as e:
-                self.logger = get_logger()
                 self.logger.log_error(f"Failed to initialize Braintrust tracing: {e}")
         else:
-            self.logger = get_logger()
             self.logger.log_info("BRAINTRUST_API_KEY not set - tracing disabled")
 
         self.model = model or Config.OPENAI_MODEL
@@ -55,6 +65,34 @@ class OpenAIWrapper:
             "gpt-3.5-turbo": {"input": 0.0015, "output": 0.002},
         }
 
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Return the OpenAI client of the running event loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._create_client()
+            self._clients[loop] = client
+        return client
+
+    def _create_client(self) -> AsyncOpenAI:
+        """Build an OpenAI client with a keep-alive pool sized for the configured concurrency"""
+        # The pool's connection limit caps in-flight requests from every conversation sharing this client;
+        # the SDK retries 429s with exponential backoff.
+        client = AsyncOpenAI(
+            api_key=self.api_key,
+            max_retries=Config.OPENAI_SDK_MAX_RETRIES,
+            http_client=DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=Config.OPENAI_MAX_CONCURRENCY or None,
+                    max_keepalive_connections=Config.OPENAI_KEEPALIVE_CONNECTIONS,
+                ),
+                event_hooks={"request": [self._pace_request]},
+            ),
+        )
+        # Wrap the OpenAI client with Braintrust tracing
+        return wrap_openai(client) if self.tracing_enabled else client
+
     async def _make_request_with_retry(
         self,
         messages: List[Dict[str, str]],
@@ -82,7 +120,7 @@ class OpenAIWrapper:
         )
 
         for attempt in range(self.max_retries):
-            request_start_time = time.time()
+            request_start_time = time.monotonic()
 
             try:
                 async with self.throttler:
@@ -107,7 +145,7 @@ class OpenAIWrapper:
                     response = await self.client.chat.completions.create(**request_params)
 
                     # Calculate request duration
-                    duration_ms = (time.time() - request_start_time) * 1000
+                    duration_ms = (time.monotonic() - request_start_time) * 1000
 
                     # Extract response data
                     message = response.choices[0].message
@@ -121,6 +159,8 @@ class OpenAIWrapper:
                         "prompt_tokens": response.usage.prompt_tokens,
                         "completion_tokens": response.usage.completion_tokens,
                         "total_tokens": response.usage.total_tokens,
+                        # Prompt tokens served from OpenAI's prefix cache; shows whether prompts share a stable prefix
+                        "cached_tokens": getattr(response.usage.prompt_tokens_details, "cached_tokens", None) or 0,
                     }
 
                     # Calculate cost estimate
@@ -145,13 +185,14 @@ class OpenAIWrapper:
                         completion_tokens=usage["completion_tokens"],
                         total_tokens=usage["total_tokens"],
                         cost_estimate=cost_estimate,
+                        cached_tokens=usage["cached_tokens"],
                     )
 
                     return content, usage
 
             except Exception as e:
                 # Calculate request duration for failed request
-                duration_ms = (time.time() - request_start_time) * 1000
+                duration_ms = (time.monotonic() - request_start_time) * 1000
 
                 error_context = {
                     "session_id": session_id,
@@ -239,6 +280,19 @@ class OpenAIWrapper:
 
         raise Exception(f"Failed to complete OpenAI request after {self.max_retries} attempts")
 
+    async def _pace_request(self, request: httpx.Request) -> None:
+        """Wait for request and estimated token budget before each HTTP request, retries included"""
+        if self.request_limiter:
+            await self.request_limiter.acquire()
+        if self.token_limiter:
+            await self.token_limiter.acquire(len(request.content) / BYTES_PER_TOKEN)
+
+    async def close(self) -> None:
+        """Close the running event loop's HTTP client and its connection pool"""
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
     def _calculate_cost(self, usage: Dict[str, int]) -> float:
         """Calculate estimated cost based on token usage"""
         if self.model not in self.token_costs:
@@ -276,9 +330,9 @@ class OpenAIWrapper:
         )
 
         try:
-            json_response = json.loads(content)
+            json_response = orjson.loads(content)
             return json_response, usage
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             self.logger.log_error(
                 f"Failed to parse JSON response from OpenAI",
                 exception=e,
@@ -5,12 +5,87 @@ Defines prompts and tools for different agents in the conversation
 
 import json
 import os
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, asdict, field
+import orjson
 from src.config import Config
 from src.tools_specification import ToolsSpecification
 from src.logging_utils import get_logger
 
+# Sidecar in the prompts directory caching list metadata for each specification
+SPEC_INDEX_FILENAME = ".spec_index.json"
+
+# Upper bound on threads parsing changed specification files; reads are I/O bound
+SPEC_READ_WORKERS = 32
+
+# Parsed specifications kept per manager; the least recently loaded is dropped beyond this
+LOADED_SPEC_CACHE_SIZE = 32
+
+# Formatted copies kept per loaded specification, keyed by the values of the variables its prompts read
+FORMATTED_SPEC_CACHE_SIZE = 256
+
+# Scenario variables holding the simulated client's opening message, in order of precedence
+INITIAL_TASK_VARIABLES = ("client_greeting", "GREETING")
+DEFAULT_INITIAL_TASK = "Добрый день!"
+
+
+@lru_cache(maxsize=None)
+def _jinja_environment():
+    """Shared Jinja2 environment that fails on undefined variables"""
+    from jinja2 import Environment, BaseLoader, StrictUndefined
+
+    return Environment(loader=BaseLoader(), undefined=StrictUndefined)
+
+
+@lru_cache(maxsize=512)
+def _compile_prompt_template(template: str):
+    """Compile a prompt template once per distinct template text"""
+    return _jinja_environment().from_string(template)
+
+
+@lru_cache(maxsize=512)
+def _template_variables(template: str) -> Tuple[str, ...]:
+    """Names of the variables a prompt template reads, sorted"""
+    from jinja2 import meta
+
+    return tuple(sorted(meta.find_undeclared_variables(_jinja_environment().parse(template))))
+
+
+@lru_cache(maxsize=1024)
+def _render_prompt_cached(template: str, values: Tuple[Tuple[str, type, Any], ...]) -> str:
+    return _compile_prompt_template(template).render({name: value for name, _, value in values})
+
+
+def _render_prompt(template: str, variables: Dict[str, Any]) -> str:
+    """Render a prompt template, reusing the result for the same values of the variables it reads"""
+    # The value type is part of the key so that equal values such as 1 and True render separately
+    values = tuple(
+        (name, type(variables[name]), variables[name]) for name in _template_variables(template) if name in variables
+    )
+    try:
+        hash(values)
+    except TypeError:
+        # Unhashable values (lists, dicts) cannot key the cache; render them directly
+        return _compile_prompt_template(template).render(variables)
+    # Rendering errors propagate from this single attempt instead of triggering an uncached retry
+    return _render_prompt_cached(template, values)
+
+
+@lru_cache(maxsize=256)
+def _agent_tool_schemas(tools: Tuple[str, ...], handoffs: Tuple[Tuple[str, str], ...]) -> Tuple[Dict[str, Any], ...]:
+    """Resolve an agent's tool and handoff schemas once per distinct tools/handoffs configuration"""
+    tool_names = list(tools)
+
+    # Automatically add handoff tools based on handoffs configuration
+    for agent_name, _ in handoffs:
+        handoff_tool_name = f"handoff_{agent_name}"
+        if handoff_tool_name not in tool_names:
+            tool_names.append(handoff_tool_name)
+
+    return tuple(ToolsSpecification.get_tools_by_names(tool_names, dict(handoffs)))
+
 
 @dataclass
 class AgentPromptSpecification:
@@ -23,18 +98,11 @@ class AgentPromptSpecification:
     handoffs: Optional[Dict[str, str]] = None  # Dict of agent_name -> handoff_description
 
     def get_tool_schemas(self) -> List[Dict[str, Any]]:
-        """Get the actual tool schemas for this agent"""
-        # Start with explicitly defined tools
-        tool_names = self.tools.copy()
-
-        # Automatically add handoff tools based on handoffs configuration
-        if self.handoffs:
-            for agent_name in self.handoffs.keys():
-                handoff_tool_name = f"handoff_{agent_name}"
-                if handoff_tool_name not in tool_names:
-                    tool_names.append(handoff_tool_name)
+        """Get the actual tool schemas for this agent
 
-        return ToolsSpecification.get_tools_by_names(tool_names, self.handoffs or {})
+        Formatting only changes the prompt, so every formatted copy of an agent shares one resolution.
+        """
+        return list(_agent_tool_schemas(tuple(self.tools), tuple((self.handoffs or {}).items())))
 
     def format_with_variables(self, variables: Dict[str, Any]) -> "AgentPromptSpecification":
         """
@@ -49,15 +117,12 @@ class AgentPromptSpecification:
         Raises:
             Exception: If formatting fails due to missing variables or template errors
         """
-        from jinja2 import Environment, BaseLoader, Template, StrictUndefined, UndefinedError
+        from jinja2 import UndefinedError
 
         try:
-            # Create Jinja2 environment with strict undefined handling
-            jinja_env = Environment(loader=BaseLoader(), undefined=StrictUndefined)
-
-            # Use Jinja2 to render the template with proper variable handling
-            jinja_template = jinja_env.from_string(self.prompt)
-            formatted_prompt = jinja_template.render(**variables)
+            # Templates are compiled once; scenarios that agree on the variables a prompt reads
+            # (session_id included only if the prompt uses it) share one render
+            formatted_prompt = _render_prompt(self.prompt, variables)
 
             # Create new instance with formatted prompt
             return AgentPromptSpecification(
@@ -118,6 +183,20 @@ class SystemPromptSpecification:
     version: str
     description: Optional[str]
     agents: Dict[str, AgentPromptSpecification]
+    _formatted: Dict[Tuple, "SystemPromptSpecification"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Sorted names of the variables that key _formatted, collected from the prompts on first use
+    _key_variables: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    # Files a loaded specification was read from: the JSON file followed by its ``file:`` prompts
+    _source_files: Tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+    # Every tool named by any agent, in first-seen order
+    tool_names: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    # Opening message of the simulated client; set on formatted specifications from the scenario variables
+    initial_task: str = field(default=DEFAULT_INITIAL_TASK, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.tool_names = tuple(dict.fromkeys(tool for agent in self.agents.values() for tool in agent.tools))
 
     def get_agent_prompt(self, agent_name: str) -> Optional[AgentPromptSpecification]:
         """Get prompt specification for a specific agent"""
@@ -137,6 +216,9 @@ class SystemPromptSpecification:
         Args:
             variables: Dictionary of variables to substitute in prompt templates
 
+        Scenarios that agree on every variable the prompts read get the same instance back, so the
+        result must be treated as read-only.
+
         Returns:
             New SystemPromptSpecification instance with all prompts formatted
 
@@ -147,6 +229,11 @@ class SystemPromptSpecification:
         if "client" not in self.agents:
             raise ValueError("SystemPromptSpecification must contain a 'client' agent for user simulation")
 
+        key = self._format_cache_key(variables)
+        cached = self._formatted.get(key) if key is not None else None
+        if cached is not None:
+            return cached
+
         # Format all agent prompts
         formatted_agents = {}
         for agent_name, agent_spec in self.agents.items():
@@ -156,9 +243,36 @@ class SystemPromptSpecification:
                 raise ValueError(f"Failed to format prompt for agent '{agent_name}': {e}")
 
         # Create new instance with formatted agents
-        return SystemPromptSpecification(
+        formatted = SystemPromptSpecification(
             name=self.name, version=self.version, description=self.description, agents=formatted_agents
         )
+        formatted.initial_task = next(
+            (variables[name] for name in INITIAL_TASK_VARIABLES if variables.get(name)), DEFAULT_INITIAL_TASK
+        )
+        if key is not None:
+            if len(self._formatted) >= FORMATTED_SPEC_CACHE_SIZE:
+                del self._formatted[next(iter(self._formatted))]
+            self._formatted[key] = formatted
+        return formatted
+
+    def _format_cache_key(self, variables: Dict[str, Any]) -> Optional[Tuple]:
+        """Values of the variables read by any agent prompt or the initial task, or None when they cannot key a cache"""
+        try:
+            names = self._key_variables
+            if names is None:
+                names = self._key_variables = tuple(
+                    sorted(
+                        {name for agent in self.agents.values() for name in _template_variables(agent.prompt)}.union(
+                            INITIAL_TASK_VARIABLES
+                        )
+                    )
+                )
+            key = tuple((name, type(variables[name]), variables[name]) for name in names if name in variables)
+            hash(key)
+        except Exception:
+            # Unhashable values and unparsable templates skip the cache; formatting reports template errors
+            return None
+        return key
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
@@ -192,21 +306,45 @@ class SystemPromptSpecification:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"Prompt specification file not found: {filepath}")
 
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(filepath, "rb") as f:
+            data = orjson.loads(f.read())
 
         # Pass the prompts directory for file reference resolution
         prompts_dir = os.path.dirname(filepath)
-        return cls.from_dict(data, prompts_dir)
+        specification = cls.from_dict(data, prompts_dir)
+        specification._source_files = (filepath,) + tuple(
+            os.path.join(prompts_dir, agent["prompt"][5:])
+            for agent in data["agents"].values()
+            if isinstance(agent.get("prompt"), str) and agent["prompt"].startswith("file:")
+        )
+        return specification
 
 
 class PromptSpecificationManager:
     """Manager for loading and handling prompt specifications"""
 
+    _shared: Optional["PromptSpecificationManager"] = None
+
     def __init__(self):
         self.logger = get_logger()
         self.prompts_dir = Config.PROMPTS_DIR
-        self._cache: Dict[str, SystemPromptSpecification] = {}
+        # spec name -> (source file signature at load time, parsed specification)
+        self._cache: Dict[str, Tuple[Optional[Tuple], SystemPromptSpecification]] = {}
+
+    @classmethod
+    def shared(cls) -> "PromptSpecificationManager":
+        """Return the process-wide manager whose parsed specifications are reused by all engines"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @staticmethod
+    def _files_signature(paths: Tuple[str, ...]) -> Optional[Tuple[Tuple[int, int], ...]]:
+        """Modification time and size of each file, or None if any of them is missing"""
+        try:
+            return tuple((stat.st_mtime_ns, stat.st_size) for stat in map(os.stat, paths))
+        except OSError:
+            return None
 
     def get_specification_path(self, spec_name: str) -> str:
         """Get full path to a prompt specification file"""
@@ -215,15 +353,27 @@ class PromptSpecificationManager:
         return os.path.join(self.prompts_dir, spec_name)
 
     def load_specification(self, spec_name: str) -> SystemPromptSpecification:
-        """Load prompt specification from file with caching"""
-        if spec_name in self._cache:
-            return self._cache[spec_name]
+        """Load prompt specification from file with caching
+
+        The parsed specification is reused until its JSON file or one of its ``file:`` prompts changes,
+        so edits made on disk or through another manager are picked up.
+        """
+        cached = self._cache.get(spec_name)
+        if cached is not None:
+            signature, specification = cached
+            if self._files_signature(specification._source_files) == signature:
+                # Move to the end so eviction drops the least recently used specification
+                self._cache[spec_name] = self._cache.pop(spec_name)
+                return specification
 
         spec_path = self.get_specification_path(spec_name)
 
         try:
             specification = SystemPromptSpecification.load_from_file(spec_path)
-            self._cache[spec_name] = specification
+            self._cache.pop(spec_name, None)
+            if len(self._cache) >= LOADED_SPEC_CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[spec_name] = (self._files_signature(specification._source_files), specification)
 
             self.logger.log_info(
                 f"Loaded prompt specification: {spec_name}",
@@ -257,11 +407,8 @@ class PromptSpecificationManager:
     def save_specification(self, spec_name: str, spec_data: Dict[str, Any]) -> None:
         """Save provided data as a new JSON specification"""
         try:
-            # Validate the specification data
-            specification = SystemPromptSpecification.from_dict(spec_data, self.prompts_dir)
-
-            # Validate the specification
-            issues = self.validate_specification(specification)
+            # Build and validate the specification data
+            specification, issues = self.build_and_validate_specification(spec_data, self.prompts_dir)
             if issues:
                 raise ValueError(f"Specification validation failed: {'; '.join(issues)}")
 
@@ -272,6 +419,7 @@ class PromptSpecificationManager:
             # Clear cache for this specification in case it existed before
             if spec_name in self._cache:
                 del self._cache[spec_name]
+            self._update_index_entry(spec_name, specification.to_dict())
 
             self.logger.log_info(
                 f"Saved prompt specification: {spec_name}",
@@ -287,52 +435,164 @@ class PromptSpecificationManager:
             self.logger.log_error(f"Failed to save prompt specification: {spec_name}", exception=e)
             raise
 
-    def list_available_specifications(self) -> List[Dict[str, Any]]:
-        """List all available prompt specifications in the prompts directory"""
-        specifications = []
+    def duplicate_specification(
+        self,
+        source_spec: str,
+        new_spec: str,
+        display_name: Optional[str] = None,
+        version: str = "1.0.0",
+        description: Optional[str] = None,
+    ) -> None:
+        """Copy a specification file, rewriting only its top-level name, version and description
+
+        Agent definitions are copied verbatim (``file:`` prompt references stay references), so the
+        source is parsed once and never re-validated or re-resolved.
+        """
+        source_path = self.get_specification_path(source_spec)
+        new_path = self.get_specification_path(new_spec)
+
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"Prompt specification file not found: {source_spec}")
 
         try:
-            if not os.path.exists(self.prompts_dir):
-                return specifications
+            with open(source_path, "rb") as f:
+                spec_data = orjson.loads(f.read())
+
+            spec_data["name"] = display_name or f"{spec_data.get('name', source_spec)} (Copy)"
+            spec_data["version"] = version
+            if description is not None:
+                spec_data["description"] = description
+
+            with open(new_path, "wb") as f:
+                f.write(orjson.dumps(spec_data, option=orjson.OPT_INDENT_2))
 
-            for filename in os.listdir(self.prompts_dir):
-                if filename.endswith(".json"):
+            if new_spec in self._cache:
+                del self._cache[new_spec]
+            self._update_index_entry(new_spec, spec_data)
+
+            self.logger.log_info(
+                f"Duplicated prompt specification: {source_spec} -> {new_spec}",
+                extra_data={"source_spec": source_spec, "new_spec": new_spec, "spec_path": new_path},
+            )
+
+        except Exception as e:
+            self.logger.log_error(f"Failed to duplicate prompt specification: {source_spec}", exception=e)
+            raise
+
+    def list_available_specifications(self) -> List[Dict[str, Any]]:
+        """List all available prompt specifications in the prompts directory
+
+        Metadata comes from the index sidecar; only files whose size or mtime changed are parsed,
+        concurrently so per-file open latency overlaps on network filesystems.
+        """
+        if not os.path.exists(self.prompts_dir):
+            return []
+
+        try:
+            index = self._load_index()
+            current: Dict[str, Dict[str, Any]] = {}
+            stale: List[Tuple[str, str, os.stat_result]] = []
+
+            with os.scandir(self.prompts_dir) as entries:
+                for entry in entries:
+                    filename = entry.name
+                    if not filename.endswith(".json") or filename.startswith("."):
+                        continue
                     spec_name = filename[:-5]  # Remove .json extension
 
                     try:
-                        spec_path = os.path.join(self.prompts_dir, filename)
-
-                        # Get file metadata
-                        stat = os.stat(spec_path)
-
-                        # Try to load basic info without full parsing
-                        with open(spec_path, "r", encoding="utf-8") as f:
-                            spec_data = json.load(f)
-
-                        specifications.append(
-                            {
-                                "name": spec_name,
-                                "display_name": spec_data.get("name", spec_name),
-                                "version": spec_data.get("version", "unknown"),
-                                "description": spec_data.get("description", ""),
-                                "agents": list(spec_data.get("agents", {}).keys()),
-                                "file_size": stat.st_size,
-                                "last_modified": stat.st_mtime,
-                            }
-                        )
-                    except Exception as e:
-                        # Skip files that can't be parsed, but log the error
-                        self.logger.log_error(f"Failed to parse specification file: {filename}", exception=e)
-                        continue
+                        stat = entry.stat()
+                        cached = index.get(spec_name)
+                        if (
+                            cached
+                            and cached["file_size"] == stat.st_size
+                            and cached["last_modified"] == stat.st_mtime
+                        ):
+                            current[spec_name] = cached
+                        else:
+                            stale.append((spec_name, entry.path, stat))
+                    except OSError as e:
+                        self.logger.log_error(f"Failed to stat specification file: {filename}", exception=e)
+
+            if len(stale) > 1:
+                with ThreadPoolExecutor(max_workers=min(SPEC_READ_WORKERS, len(stale))) as executor:
+                    parsed = list(executor.map(lambda item: self._load_spec_metadata(*item), stale))
+            else:
+                parsed = [self._load_spec_metadata(*item) for item in stale]
+
+            for (spec_name, _, _), metadata in zip(stale, parsed):
+                if metadata is not None:
+                    current[spec_name] = metadata
 
-            # Sort by name
-            specifications.sort(key=lambda x: x["name"])
+            if current != index:
+                self._save_index(current)
 
         except Exception as e:
             self.logger.log_error("Failed to list available specifications", exception=e)
             raise
 
-        return specifications
+        # Sort by name
+        return [{"name": spec_name, **current[spec_name]} for spec_name in sorted(current)]
+
+    def _load_spec_metadata(self, spec_name: str, path: str, stat: os.stat_result) -> Optional[Dict[str, Any]]:
+        """Parse one specification file into listing metadata, or None if it can't be parsed"""
+        try:
+            with open(path, "rb") as f:
+                spec_data = orjson.loads(f.read())
+            return self._index_entry(spec_name, spec_data, stat)
+        except Exception as e:
+            # Skip files that can't be parsed, but log the error
+            self.logger.log_error(f"Failed to parse specification file: {spec_name}.json", exception=e)
+            return None
+
+    def _index_path(self) -> str:
+        """Get full path to the specification metadata index"""
+        return os.path.join(self.prompts_dir, SPEC_INDEX_FILENAME)
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read the specification metadata index, treating a missing or corrupt index as empty"""
+        try:
+            with open(self._index_path(), "rb") as f:
+                index = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _save_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        """Write the specification metadata index; failures only cost a re-parse on the next listing"""
+        try:
+            with open(self._index_path(), "wb") as f:
+                f.write(orjson.dumps(index))
+        except OSError as e:
+            self.logger.log_error("Failed to write specification index", exception=e)
+
+    def _update_index_entry(self, spec_name: str, spec_data: Optional[Dict[str, Any]]) -> None:
+        """Refresh or drop (when ``spec_data`` is None) one specification in the metadata index"""
+        if spec_name.endswith(".json"):
+            spec_name = spec_name[:-5]
+        index = self._load_index()
+        if spec_data is None:
+            if index.pop(spec_name, None) is None:
+                return
+        else:
+            try:
+                stat = os.stat(self.get_specification_path(spec_name))
+            except OSError:
+                return
+            index[spec_name] = self._index_entry(spec_name, spec_data, stat)
+        self._save_index(index)
+
+    @staticmethod
+    def _index_entry(spec_name: str, spec_data: Dict[str, Any], stat: os.stat_result) -> Dict[str, Any]:
+        """Build the listing metadata for a specification file"""
+        return {
+            "display_name": spec_data.get("name", spec_name),
+            "version": spec_data.get("version", "unknown"),
+            "description": spec_data.get("description", ""),
+            "agents": list(spec_data.get("agents", {}).keys()),
+            "file_size": stat.st_size,
+            "last_modified": stat.st_mtime,
+        }
 
     def delete_specification(self, spec_name: str) -> None:
         """Delete a prompt specification file"""
@@ -351,6 +611,7 @@ class PromptSpecificationManager:
             # Clear from cache if present
             if spec_name in self._cache:
                 del self._cache[spec_name]
+            self._update_index_entry(spec_name, None)
 
             self.logger.log_info(
                 f"Deleted prompt specification: {spec_name}",
@@ -376,30 +637,70 @@ class PromptSpecificationManager:
 
     def validate_specification(self, specification: SystemPromptSpecification) -> List[str]:
         """Validate a prompt specification and return list of issues"""
-        issues = []
+        issues = self._missing_agent_issues(specification.agents)
+        available_tools = set(ToolsSpecification.get_available_tool_names())
 
-        # Check that required agents exist
-        required_agents = ["agent", "client", "evaluator"]
-        for agent_name in required_agents:
-            if agent_name not in specification.agents:
-                issues.append(f"Missing required agent: {agent_name}")
+        for agent_name, agent_spec in specification.agents.items():
+            issues.extend(self._agent_issues(agent_name, agent_spec, specification.agents, available_tools))
 
-        # Validate tools for each agent
-        available_tools = ToolsSpecification.get_available_tool_names()
+        return issues
 
-        for agent_name, agent_spec in specification.agents.items():
-            for tool_name in agent_spec.tools:
-                # Skip handoff tools as they are dynamically generated
-                if tool_name.startswith("handoff_"):
-                    continue
-                if tool_name not in available_tools:
-                    issues.append(f"Agent '{agent_name}' references unknown tool: {tool_name}")
-
-            # Validate handoffs if present
-            if agent_spec.handoffs:
-                for target_agent in agent_spec.handoffs.keys():
-                    if target_agent not in specification.agents:
-                        issues.append(f"Agent '{agent_name}' has handoff to non-existent agent: {target_agent}")
+    def build_and_validate_specification(
+        self, spec_data: Dict[str, Any], prompts_dir: Optional[str] = None
+    ) -> Tuple[SystemPromptSpecification, List[str]]:
+        """Build a specification from raw data and collect its validation issues in one pass over the agents
+
+        Equivalent to ``SystemPromptSpecification.from_dict`` followed by ``validate_specification``.
+        """
+        agents_data = spec_data["agents"]
+        issues = self._missing_agent_issues(agents_data)
+        available_tools = set(ToolsSpecification.get_available_tool_names())
+
+        agents = {}
+        for agent_name, agent_data in agents_data.items():
+            agent_spec = AgentPromptSpecification.from_dict(agent_data, prompts_dir)
+            agents[agent_name] = agent_spec
+            issues.extend(self._agent_issues(agent_name, agent_spec, agents_data, available_tools))
+
+        specification = SystemPromptSpecification(
+            name=spec_data["name"],
+            version=spec_data["version"],
+            description=spec_data.get("description"),
+            agents=agents,
+        )
+        return specification, issues
+
+    @staticmethod
+    def _missing_agent_issues(agent_names: Dict[str, Any]) -> List[str]:
+        """Report required agents absent from a specification"""
+        return [
+            f"Missing required agent: {agent_name}"
+            for agent_name in ("agent", "client", "evaluator")
+            if agent_name not in agent_names
+        ]
+
+    @staticmethod
+    def _agent_issues(
+        agent_name: str,
+        agent_spec: AgentPromptSpecification,
+        agent_names: Dict[str, Any],
+        available_tools: set,
+    ) -> List[str]:
+        """Report unknown tools and dangling handoffs for one agent"""
+        # Skip handoff tools as they are dynamically generated
+        issues = [
+            f"Agent '{agent_name}' references unknown tool: {tool_name}"
+            for tool_name in agent_spec.tools
+            if not tool_name.startswith("handoff_") and tool_name not in available_tools
+        ]
+
+        # Validate handoffs if present
+        if agent_spec.handoffs:
+            issues.extend(
+                f"Agent '{agent_name}' has handoff to non-existent agent: {target_agent}"
+                for target_agent in agent_spec.handoffs
+                if target_agent not in agent_names
+            )
 
         return issues
 
@@ -0,0 +1,31 @@
+"""
+Token-bucket rate limiting for outgoing OpenAI requests
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at ``rate`` units per ``period`` seconds
+
+    Callers reserve capacity up front and sleep off any deficit, so waiters are served in
+    arrival order without a lock and the bucket can be shared across event loops.
+    """
+
+    def __init__(self, rate: float, period: float = 60.0):
+        self.capacity = float(rate)
+        self._fill_rate = rate / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Consume ``amount`` units, waiting until the bucket has refilled enough"""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self._fill_rate)
+        self._updated = now
+
+        # Requests larger than the bucket would otherwise never be admitted
+        self._tokens -= min(amount, self.capacity)
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._fill_rate)
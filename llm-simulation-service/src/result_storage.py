@@ -5,12 +5,44 @@ Result storage and reporting system
 import json
 import csv
 import os
-from typing import Dict, List, Any, Optional
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
+import orjson
 import pandas as pd
 from src.config import Config
 from src.logging_utils import get_logger
 
+# Scalar result fields needed for CSV export and summary reports
+SUMMARY_RESULT_FIELDS = (
+    "session_id",
+    "scenario",
+    "score",
+    "comment",
+    "total_turns",
+    "start_time",
+    "status",
+    "duration_seconds",
+    "evaluation_status",
+)
+
+# Column order of the CSV export (PRD format plus status columns)
+CSV_FIELDNAMES = (
+    "session_id",
+    "scenario",
+    "prompt_version",
+    "score",
+    "comment",
+    "turns",
+    "start_ts",
+    "status",
+    "duration_seconds",
+    "evaluation_status",
+)
+
+# Formats written by ResultStorage.save_all
+EXPORT_FORMATS = ("ndjson", "csv", "json", "summary")
+
 
 class ResultStorage:
     """Handles storage and export of simulation results"""
@@ -51,6 +83,34 @@ class ResultStorage:
             self.logger.log_error(f"Failed to save NDJSON results", exception=e, extra_data={"batch_id": batch_id})
             raise e
 
+    @contextmanager
+    def stream_batch_results_ndjson(self, batch_id: str) -> Iterator[Tuple[str, Callable[[Dict[str, Any]], None]]]:
+        """Open a batch NDJSON file and yield its path with a function appending one result per call"""
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"batch_{batch_id}_{timestamp}.ndjson"
+        filepath = os.path.join(self.results_dir, filename)
+        result_count = 0
+
+        with open(filepath, "wb") as f:
+
+            def write_result(result: Dict[str, Any]) -> None:
+                nonlocal result_count
+                result_with_metadata = {
+                    "batch_id": batch_id,
+                    "export_timestamp": datetime.now().isoformat(),
+                    **result,
+                }
+                f.write(orjson.dumps(result_with_metadata, option=orjson.OPT_APPEND_NEWLINE))
+                result_count += 1
+
+            yield filepath, write_result
+
+        self.logger.log_info(
+            f"Streamed NDJSON results",
+            extra_data={"batch_id": batch_id, "filepath": filepath, "result_count": result_count},
+        )
+
     def save_batch_results_csv(
         self, batch_id: str, results: List[Dict[str, Any]], prompt_version: str = "default"
     ) -> str:
@@ -63,42 +123,11 @@ class ResultStorage:
         try:
             # Prepare CSV data according to PRD format:
             # session_id,scenario,prompt_version,score,comment,turns,start_ts
-            csv_data = []
-
-            for result in results:
-                csv_row = {
-                    "session_id": result.get("session_id", ""),
-                    "scenario": result.get("scenario", ""),
-                    "prompt_version": prompt_version,
-                    "score": result.get("score", 1),
-                    "comment": result.get("comment", "").replace("\n", " ").replace("\r", " "),  # Clean newlines
-                    "turns": result.get("total_turns", 0),
-                    "start_ts": result.get("start_time", ""),
-                    "status": result.get("status", "unknown"),
-                    "duration_seconds": result.get("duration_seconds", 0),
-                    "evaluation_status": result.get("evaluation_status", "unknown"),
-                }
-                csv_data.append(csv_row)
+            csv_data = [self._csv_row(result, prompt_version) for result in results]
 
             # Write CSV file
             if csv_data:
-                fieldnames = [
-                    "session_id",
-                    "scenario",
-                    "prompt_version",
-                    "score",
-                    "comment",
-                    "turns",
-                    "start_ts",
-                    "status",
-                    "duration_seconds",
-                    "evaluation_status",
-                ]
-
-                with open(filepath, "w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    writer.writerows(csv_data)
+                self._write_csv(filepath, csv_data)
 
             self.logger.log_info(
                 f"Saved CSV results",
@@ -111,6 +140,103 @@ class ResultStorage:
             self.logger.log_error(f"Failed to save CSV results", exception=e, extra_data={"batch_id": batch_id})
             raise e
 
+    @staticmethod
+    def _csv_row(result: Dict[str, Any], prompt_version: str) -> Dict[str, Any]:
+        """Map one result onto the CSV export columns"""
+        return {
+            "session_id": result.get("session_id", ""),
+            "scenario": result.get("scenario", ""),
+            "prompt_version": prompt_version,
+            "score": result.get("score", 1),
+            "comment": result.get("comment", "").replace("\n", " ").replace("\r", " "),  # Clean newlines
+            "turns": result.get("total_turns", 0),
+            "start_ts": result.get("start_time", ""),
+            "status": result.get("status", "unknown"),
+            "duration_seconds": result.get("duration_seconds", 0),
+            "evaluation_status": result.get("evaluation_status", "unknown"),
+        }
+
+    @staticmethod
+    def _write_csv(filepath: str, csv_data: List[Dict[str, Any]]) -> None:
+        """Write CSV rows with the export header"""
+        with open(filepath, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+            writer.writeheader()
+            writer.writerows(csv_data)
+
+    def save_all(
+        self,
+        batch_id: str,
+        results: List[Dict[str, Any]],
+        formats: Tuple[str, ...] = EXPORT_FORMATS,
+        prompt_version: str = "default",
+    ) -> Dict[str, str]:
+        """Export batch results in several formats from a single walk over the results
+
+        All files share one timestamp. Returns a mapping of format name to written file path.
+        """
+
+        unknown_formats = set(formats) - set(EXPORT_FORMATS)
+        if unknown_formats:
+            raise ValueError(f"Unsupported export formats: {', '.join(sorted(unknown_formats))}")
+
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        export_timestamp = now.isoformat()
+        paths = {
+            fmt: os.path.join(self.results_dir, f"batch_{batch_id}_{timestamp}.{fmt}")
+            for fmt in formats
+            if fmt != "summary"
+        }
+
+        try:
+            csv_data = [] if "csv" in formats else None
+            summary_rows = [] if "summary" in formats else None
+            ndjson_file = open(paths["ndjson"], "wb") if "ndjson" in formats else None
+
+            try:
+                for result in results:
+                    if ndjson_file:
+                        ndjson_file.write(
+                            orjson.dumps(
+                                {"batch_id": batch_id, "export_timestamp": export_timestamp, **result},
+                                option=orjson.OPT_APPEND_NEWLINE,
+                            )
+                        )
+                    if csv_data is not None:
+                        csv_data.append(self._csv_row(result, prompt_version))
+                    if summary_rows is not None:
+                        summary_rows.append({k: result[k] for k in SUMMARY_RESULT_FIELDS if k in result})
+            finally:
+                if ndjson_file:
+                    ndjson_file.close()
+
+            if csv_data:
+                self._write_csv(paths["csv"], csv_data)
+
+            if "json" in formats:
+                with open(paths["json"], "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            {"batch_id": batch_id, "export_timestamp": export_timestamp, "results": results},
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        )
+                    )
+
+            if summary_rows is not None:
+                paths["summary"] = self.save_summary_report(self.generate_summary_report(batch_id, summary_rows))
+
+            self.logger.log_info(
+                "Saved batch results",
+                extra_data={"batch_id": batch_id, "filepaths": paths, "result_count": len(results)},
+            )
+
+            return paths
+
+        except Exception as e:
+            self.logger.log_error("Failed to save batch results", exception=e, extra_data={"batch_id": batch_id})
+            raise e
+
     def save_batch_results_json(self, batch_id: str, results: List[Dict[str, Any]]) -> str:
         """Save batch results in JSON format"""
 
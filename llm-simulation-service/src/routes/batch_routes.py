@@ -9,8 +9,14 @@ from werkzeug.exceptions import BadRequest, NotFound
 from src.config import Config
 from src.batch_processor import BatchProcessor
 from src.result_storage import ResultStorage
+from src.webhook_manager import WebhookManager
 from src.logging_utils import get_logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional and unavailable on Windows
+    uvloop = None
+
 # Create blueprint for batch routes
 batch_bp = Blueprint("batch", __name__)
 
@@ -75,7 +81,8 @@ def launch_batch():
         def run_batch_async():
             """Run batch in background thread"""
             try:
-                loop = asyncio.new_event_loop()
+                # Background batches get their own loop; uvloop's libuv loop when it is installed
+                loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
                 asyncio.set_event_loop(loop)
                 result = loop.run_until_complete(processor.run_batch(batch_id))
                 logger.log_info(
@@ -85,6 +92,8 @@ def launch_batch():
             except Exception as e:
                 logger.log_error(f"Background batch failed", exception=e, extra_data={"batch_id": batch_id})
             finally:
+                loop.run_until_complete(WebhookManager.shared().aclose())
+                loop.run_until_complete(processor.openai_wrapper.close())
                 loop.close()
 
         # Start background thread
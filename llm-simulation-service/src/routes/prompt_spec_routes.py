@@ -166,13 +166,8 @@ def validate_prompt_specification(spec_name: str):
         if not data:
             return jsonify({"error": "JSON data is required"}), 400
 
-        # Try to create specification object from data
-        from src.prompt_specification import SystemPromptSpecification
-
-        specification = SystemPromptSpecification.from_dict(data)
-
-        # Validate the specification
-        issues = prompt_manager.validate_specification(specification)
+        # Build the specification object from data and validate it
+        specification, issues = prompt_manager.build_and_validate_specification(data)
 
         is_valid = len(issues) == 0
 
@@ -219,17 +214,14 @@ def duplicate_prompt_specification(spec_name: str):
         if prompt_manager.specification_exists(new_name):
             return jsonify({"error": f"Target specification already exists: {new_name}"}), 409
 
-        # Get source specification contents
-        source_contents = prompt_manager.get_specification_contents(spec_name)
-
-        # Update name and version in the duplicated content
-        source_contents["name"] = data.get("display_name", f"{source_contents['name']} (Copy)")
-        source_contents["version"] = data.get("version", "1.0.0")
-        if "description" in data:
-            source_contents["description"] = data["description"]
-
-        # Save as new specification
-        prompt_manager.save_specification(new_name, source_contents)
+        # Copy the source file with updated name, version and description
+        prompt_manager.duplicate_specification(
+            spec_name,
+            new_name,
+            display_name=data.get("display_name"),
+            version=data.get("version", "1.0.0"),
+            description=data.get("description"),
+        )
 
         logger.log_info(f"Duplicated prompt specification from {spec_name} to {new_name}")
 
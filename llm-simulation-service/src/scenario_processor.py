@@ -1,10 +1,15 @@
 """Scenario processing logic with engine isolation."""
 
-from typing import Any, Dict, Tuple
+import asyncio
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
 
 from src.openai_wrapper import OpenAIWrapper
 from src.logging_utils import get_logger
 
+if TYPE_CHECKING:
+    from src.batch_resource_manager import BatchResourceManager
+
 
 class ScenarioProcessor:
     """Process individual scenarios using isolated engines."""
@@ -21,22 +26,40 @@ class ScenarioProcessor:
         batch_id: str,
         prompt_spec_name: str,
         use_tools: bool,
-    ) -> Dict[str, Any]:
-        """Run conversation and evaluation for a single scenario."""
+        resource_manager: Optional["BatchResourceManager"] = None,
+        drain: Optional[asyncio.Event] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Run conversation and evaluation for a single scenario.
+
+        With a ``resource_manager`` the conversation and the evaluation each hold their own
+        semaphore, so a finished conversation frees its slot for the next scenario while it is evaluated.
+        Engines are only built once a conversation slot is held. Returns None without building them
+        or starting the conversation if ``drain`` is set by the time a slot is free.
+        """
         scenario_name = scenario.get("name", f"scenario_{scenario_index}")
-        engine, evaluator = self._create_isolated_engines(prompt_spec_name)
-        self.logger.log_info(
-            f"Processing scenario {scenario_index}: {scenario_name}",
-            extra_data={"batch_id": batch_id},
-        )
-        if use_tools:
-            conversation_result = await engine.run_conversation_with_tools(scenario)
-        else:
-            conversation_result = await engine.run_conversation(scenario)
+        conversation_slot = resource_manager.get_semaphore() if resource_manager else nullcontext()
+        async with conversation_slot:
+            if drain is not None and drain.is_set():
+                self.logger.log_info(
+                    f"Skipping scenario {scenario_index}: batch is draining",
+                    extra_data={"batch_id": batch_id},
+                )
+                return None
+            engine, evaluator = self._create_isolated_engines(prompt_spec_name)
+            self.logger.log_info(
+                f"Processing scenario {scenario_index}: {scenario_name}",
+                extra_data={"batch_id": batch_id},
+            )
+            if use_tools:
+                conversation_result = await engine.run_conversation_with_tools(scenario)
+            else:
+                conversation_result = await engine.run_conversation(scenario)
 
         evaluation_result = None
         if conversation_result.get("status") in {"completed", "timeout"}:
-            evaluation_result = await evaluator.evaluate_conversation(conversation_result)
+            evaluation_slot = resource_manager.get_evaluation_semaphore() if resource_manager else nullcontext()
+            async with evaluation_slot:
+                evaluation_result = await evaluator.evaluate_conversation(conversation_result)
 
         result = self._format_scenario_result(
             conversation_result,
@@ -31,6 +31,15 @@ GLOBAL_INSTRUCTIONS = """
 
 DEFAULTS["GLOBAL_INSTRUCTIONS"] = GLOBAL_INSTRUCTIONS
 
+# Webhook variables that prompts also read under a lowercase name
+UPPER_TO_LOWER = (
+    ("LOCATIONS", "locations"),
+    ("DELIVERY_DAYS", "delivery_days"),
+    ("PURCHASE_HISTORY", "purchase_history"),
+    ("NAME", "name"),
+    ("CURRENT_DATE", "current_date"),
+)
+
 async def enrich_scenario_variables(
     variables: Dict[str, Any], session_id: str, webhook_manager: WebhookManager, logger: SimulationLogger
 ) -> Tuple[Dict[str, Any], Optional[str]]:
@@ -52,21 +61,15 @@ async def enrich_scenario_variables(
     variables["session_id"] = session_id
     _apply_default_values(variables)
 
-    logger.log_info(f"Enriched variables: {variables}")
+    if logger.info_enabled():
+        logger.log_info(f"Enriched variables: {variables}")
     
     return variables, webhook_session_id
 
 def _create_lowercase_mappings(variables: Dict[str, Any]) -> None:
-    if "LOCATIONS" in variables and "locations" not in variables:
-        variables["locations"] = variables["LOCATIONS"]
-    if "DELIVERY_DAYS" in variables and "delivery_days" not in variables:
-        variables["delivery_days"] = variables["DELIVERY_DAYS"]
-    if "PURCHASE_HISTORY" in variables and "purchase_history" not in variables:
-        variables["purchase_history"] = variables["PURCHASE_HISTORY"]
-    if "NAME" in variables and "name" not in variables:
-        variables["name"] = variables["NAME"]
-    if "CURRENT_DATE" in variables and "current_date" not in variables:
-        variables["current_date"] = variables["CURRENT_DATE"]
+    for upper, lower in UPPER_TO_LOWER:
+        if upper in variables:
+            variables.setdefault(lower, variables[upper])
 
 def _apply_default_values(variables: Dict[str, Any]) -> None:
     for key, default in DEFAULTS.items():
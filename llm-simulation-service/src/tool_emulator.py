@@ -4,6 +4,7 @@ Tool emulation system for conversation simulation
 
 import json
 import aiohttp
+import orjson
 from typing import Dict, Any, List, Optional
 from src.logging_utils import get_logger
 import ssl
@@ -89,7 +90,7 @@ class ToolEmulator:
                         response_headers = dict(response.headers)
 
                         try:
-                            response_data = await response.json()
+                            response_data = await response.json(loads=orjson.loads)
                         except:
                             response_text = await response.text()
                             response_data = {"raw_text": response_text}
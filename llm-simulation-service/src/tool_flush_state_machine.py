@@ -49,7 +49,7 @@ class ToolFlushStateMachine:
             self.pending.clear()
             self.pending_speaker = None
             self.pending_display_name = None
-        return parsed_message.__dict__
+        return parsed_message.to_history_item()
 
     def handle_orphaned_tools(self, turn_number: int) -> Optional[Dict]:
         if not self.pending:
@@ -67,7 +67,7 @@ class ToolFlushStateMachine:
 
     def _create_orphaned_tools_entry(self) -> Dict:
         self.logger.log_error(
-            "Tool events without following text message", extra_data={"calls": list(self.pending.keys())}
+            "Tool events without following text message", extra_data={"calls": self.pending.keys()}
         )
         entry = {
             "speaker": "simulation_system",
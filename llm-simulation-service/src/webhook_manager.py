@@ -3,23 +3,86 @@ Webhook integration for session initialization and client data retrieval
 """
 
 import aiohttp
+import asyncio
 import uuid
 import json
 import ssl
+import time
 import certifi
-from typing import Optional, Dict, Any
+import orjson
+from typing import Iterable, Optional, Dict, Any, Tuple
+from weakref import WeakKeyDictionary
 from src.config import Config
 from src.logging_utils import get_logger
 
 ssl_context = ssl.create_default_context(cafile=certifi.where())
 
+# Prefetched client data older than this is discarded and fetched again
+PREFETCH_TTL_SEC = 600
+
+# Idle pooled connections stay open this long; a conversation takes longer than aiohttp's 15s default
+# between webhook calls, which would otherwise cost every scenario a fresh TCP/TLS handshake
+KEEPALIVE_TIMEOUT_SEC = 60
+
+ClientDataKey = Tuple[str, Optional[Tuple[str, ...]]]
+# Prefetch start time and the task fetching that client's data
+PrefetchEntry = Tuple[float, asyncio.Task]
+
 
 class WebhookManager:
     """Manages webhook interactions for session initialization and client data retrieval"""
 
+    _shared: Optional["WebhookManager"] = None
+
     def __init__(self):
         self.logger = get_logger()
         self.webhook_url = Config.WEBHOOK_URL
+        # aiohttp sessions are bound to an event loop, so each loop gets its own pooled session
+        self._sessions: "WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = WeakKeyDictionary()
+        # Prefetched lookups are tasks, so they are also kept per event loop
+        self._prefetched: "WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[ClientDataKey, PrefetchEntry]]" = (
+            WeakKeyDictionary()
+        )
+        # Bounds concurrent prefetches; semaphores are bound to the loop they are first used on
+        self._prefetch_slots: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = WeakKeyDictionary()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+
+    @classmethod
+    def shared(cls) -> "WebhookManager":
+        """Return the process-wide manager whose connection pool is reused by all conversations"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session for the running event loop, creating it on first use"""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=Config.WEBHOOK_MAX_CONNECTIONS, keepalive_timeout=KEEPALIVE_TIMEOUT_SEC, ssl=ssl_context
+            )
+            session = aiohttp.ClientSession(connector=connector)
+            self._sessions[loop] = session
+        return session
+
+    def pool_stats(self) -> Dict[str, int]:
+        """Return connection pool usage; in_flight at the limit means requests are queueing for a connection"""
+        return {
+            "limit": Config.WEBHOOK_MAX_CONNECTIONS,
+            "in_flight": self._in_flight,
+            "peak_in_flight": self._peak_in_flight,
+        }
+
+    async def aclose(self) -> None:
+        """Close the pooled session of the running event loop and drop its unused prefetches"""
+        loop = asyncio.get_running_loop()
+        for _, task in self._prefetched.pop(loop, {}).values():
+            task.cancel()
+        session = self._sessions.pop(loop, None)
+        if session is not None:
+            await session.close()
 
     async def get_client_variables(self, client_id: str) -> Dict[str, str]:
         """
@@ -34,6 +97,57 @@ class WebhookManager:
         client_data = await self.get_client_data(client_id)
         return client_data["variables"]
 
+    @staticmethod
+    def _client_data_key(client_id: str, purchase_history_codes: Optional[list]) -> ClientDataKey:
+        return client_id, tuple(purchase_history_codes) if purchase_history_codes else None
+
+    def prefetch(self, lookups: Iterable[Tuple[str, Optional[list]]]) -> int:
+        """
+        Start concurrent client data lookups that later get_client_data calls pick up
+
+        Each prefetched result is handed out once, since it carries its own webhook session_id.
+
+        Args:
+            lookups: (client_id, purchase_history_codes) pairs; duplicates are fetched once
+
+        Returns:
+            Number of lookups started
+        """
+        if not self.webhook_url:
+            return 0
+        loop = asyncio.get_running_loop()
+        prefetched = self._prefetched.setdefault(loop, {})
+        slots = self._prefetch_slots.get(loop)
+        if slots is None:
+            slots = self._prefetch_slots[loop] = asyncio.Semaphore(Config.WEBHOOK_PREFETCH_CONCURRENCY)
+        started = 0
+        for client_id, purchase_history_codes in lookups:
+            key = self._client_data_key(client_id, purchase_history_codes)
+            if key not in prefetched:
+                task = asyncio.create_task(self._prefetch_client_data(slots, client_id, purchase_history_codes))
+                prefetched[key] = (time.monotonic(), task)
+                started += 1
+        return started
+
+    async def _prefetch_client_data(
+        self, slots: asyncio.Semaphore, client_id: str, purchase_history_codes: Optional[list]
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch once a prefetch slot is free, so a large batch does not queue on the pool past its timeout"""
+        async with slots:
+            return await self._fetch_client_data(client_id, purchase_history_codes)
+
+    def _take_prefetched(self, key: ClientDataKey) -> Optional[asyncio.Task]:
+        """Remove and return an unexpired prefetched lookup of the running event loop"""
+        prefetched = self._prefetched.get(asyncio.get_running_loop())
+        entry = prefetched.pop(key, None) if prefetched else None
+        if entry is None:
+            return None
+        started_at, task = entry
+        if time.monotonic() - started_at > PREFETCH_TTL_SEC:
+            task.cancel()
+            return None
+        return task
+
     async def get_client_data(self, client_id: str, purchase_history_codes: Optional[list] = None) -> Dict[str, Any]:
         """
         Retrieve client data including variables and session_id from the RAG webhook
@@ -45,6 +159,19 @@ class WebhookManager:
         Returns:
             Dictionary containing 'variables' and 'session_id'
         """
+        prefetched = self._take_prefetched(self._client_data_key(client_id, purchase_history_codes))
+        client_data = await prefetched if prefetched else None
+        if client_data is None:
+            client_data = await self._fetch_client_data(client_id, purchase_history_codes)
+        if client_data is None:
+            # Return fallback data if webhook fails
+            return {"variables": self._get_fallback_variables(), "session_id": None}
+        return client_data
+
+    async def _fetch_client_data(
+        self, client_id: str, purchase_history_codes: Optional[list]
+    ) -> Optional[Dict[str, Any]]:
+        """Request client data from the RAG webhook, returning None when it fails"""
         try:
             payload = {"call_inbound": {"from_number": client_id}}
             if purchase_history_codes:
@@ -52,17 +179,20 @@ class WebhookManager:
 
             self.logger.log_info(f"Fetching client data for client_id: {client_id}")
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(self.webhook_url, json=payload, timeout=30, ssl=ssl_context) as response:
+            session = self._get_session()
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            try:
+                async with session.post(self.webhook_url, json=payload, timeout=30) as response:
                     if response.status == 200:
-                        data = await response.json()
+                        data = await response.json(loads=orjson.loads)
 
                         # Extract dynamic variables from response
                         dynamic_variables = data.get("call_inbound", {}).get("dynamic_variables", {})
 
                         if not dynamic_variables:
                             self.logger.log_error("Webhook response missing dynamic_variables")
-                            return {"variables": self._get_fallback_variables(), "session_id": None}
+                            return None
 
                         # Extract session_id from dynamic variables
                         webhook_session_id = dynamic_variables.get("session_id")
@@ -93,12 +223,13 @@ class WebhookManager:
                         self.logger.log_error(f"RAG webhook request failed with status: {response.status}")
                         response_text = await response.text()
                         self.logger.log_error(f"Response content: {response_text}")
+            finally:
+                self._in_flight -= 1
 
         except Exception as e:
             self.logger.log_error("Failed to retrieve client data from RAG webhook", exception=e)
 
-        # Return fallback data if webhook fails
-        return {"variables": self._get_fallback_variables(), "session_id": None}
+        return None
 
     def _get_fallback_variables(self) -> Dict[str, str]:
         """Return fallback values when webhook fails"""
@@ -112,19 +243,18 @@ class WebhookManager:
         """Initialize a new session via webhook"""
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.webhook_url, timeout=10) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        session_id = data.get("session_id")
-
-                        if session_id:
-                            self.logger.log_info(f"Retrieved session ID from webhook: {session_id}")
-                            return session_id
-                        else:
-                            self.logger.log_error("Webhook response missing session_id field")
+            async with self._get_session().get(self.webhook_url, timeout=10) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    session_id = data.get("session_id")
+
+                    if session_id:
+                        self.logger.log_info(f"Retrieved session ID from webhook: {session_id}")
+                        return session_id
                     else:
-                        self.logger.log_error(f"Webhook request failed with status: {response.status}")
+                        self.logger.log_error("Webhook response missing session_id field")
+                else:
+                    self.logger.log_error(f"Webhook request failed with status: {response.status}")
 
         except Exception as e:
             self.logger.log_error("Failed to initialize session via webhook", exception=e)
@@ -141,19 +271,18 @@ class WebhookManager:
             return True  # No webhook configured is valid
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(self.webhook_url, timeout=5) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if "session_id" in data:
-                            self.logger.log_info("Webhook validation successful")
-                            return True
-                        else:
-                            self.logger.log_error("Webhook validation failed: missing session_id field")
-                            return False
+            async with self._get_session().get(self.webhook_url, timeout=5) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if "session_id" in data:
+                        self.logger.log_info("Webhook validation successful")
+                        return True
                     else:
-                        self.logger.log_error(f"Webhook validation failed: status {response.status}")
+                        self.logger.log_error("Webhook validation failed: missing session_id field")
                         return False
+                else:
+                    self.logger.log_error(f"Webhook validation failed: status {response.status}")
+                    return False
 
         except Exception as e:
             self.logger.log_error("Webhook validation failed", exception=e)
@@ -7,9 +7,12 @@ import asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime
 
+from autogen_agentchat.base import TaskResult
+
 from src.autogen_conversation_engine import AutogenConversationEngine
 from src.openai_wrapper import OpenAIWrapper
 from src.prompt_specification import SystemPromptSpecification, AgentPromptSpecification
+from tests.test_utils.autogen_message_builders import AutogenMessageBuilder as B
 
 
 class TestAutogenConversationEngine:
@@ -46,7 +49,7 @@ class TestAutogenConversationEngine:
         with patch("src.autogen_conversation_engine.PromptSpecificationManager") as mock_manager_class:
             mock_manager = Mock()
             mock_manager.load_specification.return_value = self.mock_system_prompt_spec
-            mock_manager_class.return_value = mock_manager
+            mock_manager_class.shared.return_value = mock_manager
 
             with patch("src.autogen_conversation_engine.WebhookManager") as mock_webhook_class:
                 mock_webhook = Mock()
@@ -110,6 +113,39 @@ class TestAutogenConversationEngine:
         assert enriched_vars["session_id"] == test_session_id
         assert session_id == "webhook_session_456"
 
+    @pytest.mark.asyncio
+    async def test_client_lookup_session_replaces_session_initialization(self):
+        """Test that a client lookup's webhook session is used without initializing another one"""
+        webhook = Mock()
+        webhook.initialize_session = AsyncMock(return_value="test_session_123")
+        webhook.get_client_data = AsyncMock(return_value={"variables": {"NAME": "Alice"}, "session_id": "wh_sid"})
+        self.engine.webhook_manager = webhook
+        self.engine.loop_orchestrator.run_conversation_loop = AsyncMock()
+
+        scenario = {"name": "s", "variables": {"client_id": "c1", "scenario_purchase_history": ["p1"]}}
+        with patch.object(self.engine.prompt_specification, "format_with_variables") as format_spec:
+            format_spec.side_effect = Exception("stop after setup")
+            result = await self.engine.run_conversation_with_tools(scenario)
+
+        assert result["session_id"] == "wh_sid"
+        assert format_spec.call_args[0][0]["session_id"] == "wh_sid"
+        webhook.get_client_data.assert_awaited_once_with("c1", ["p1"])
+        webhook.initialize_session.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_session_initialized_when_client_lookup_has_no_session(self):
+        """Test the session webhook fallback when the client lookup returns no session"""
+        webhook = Mock()
+        webhook.initialize_session = AsyncMock(return_value="test_session_123")
+        webhook.get_client_data = AsyncMock(return_value={"variables": {"NAME": "Alice"}, "session_id": None})
+        self.engine.webhook_manager = webhook
+        self.engine.loop_orchestrator.run_conversation_loop = AsyncMock()
+
+        result = await self.engine.run_conversation_with_tools({"name": "s", "variables": {"client_id": "c1"}})
+
+        assert result["session_id"] == "test_session_123"
+        webhook.initialize_session.assert_awaited_once()
+
     def test_create_autogen_client(self):
         """Test AutoGen client creation via AutogenModelClientFactory"""
         with patch("src.autogen_model_client.AutogenModelClientFactory.create_from_openai_wrapper") as mock_factory:
@@ -125,8 +161,126 @@ class TestAutogenConversationEngine:
             assert result == mock_client_instance
 
     @pytest.mark.asyncio
-    async def test_run_conversation_delegates_to_tools_version(self):
-        """Test that run_conversation delegates to run_conversation_with_tools"""
+    async def test_autogen_client_reused_per_wrapper(self):
+        """Test that conversations sharing a wrapper share one AutoGen client"""
+        from src.autogen_model_client import AutogenModelClientFactory
+
+        wrapper = OpenAIWrapper("sk-test")
+        first = AutogenModelClientFactory.create_from_openai_wrapper(wrapper)
+        assert AutogenModelClientFactory.create_from_openai_wrapper(wrapper) is first
+        assert first._client is wrapper.client
+
+        await wrapper.close()
+        reopened = AutogenModelClientFactory.create_from_openai_wrapper(wrapper)
+        assert reopened is not first
+        assert reopened._client is wrapper.client
+
+        wrapper.model = "gpt-4o"
+        assert AutogenModelClientFactory.create_from_openai_wrapper(wrapper) is not reopened
+
+    def test_openai_client_per_event_loop(self):
+        """Test that each event loop gets its own wrapper and AutoGen clients, as batches run on separate loops"""
+        from src.autogen_model_client import AutogenModelClientFactory
+
+        wrapper = OpenAIWrapper("sk-test")
+
+        async def clients():
+            return wrapper.client, AutogenModelClientFactory.create_from_openai_wrapper(wrapper)
+
+        first_loop = asyncio.new_event_loop()
+        second_loop = asyncio.new_event_loop()
+        try:
+            first_openai, first_autogen = first_loop.run_until_complete(clients())
+            second_openai, second_autogen = second_loop.run_until_complete(clients())
+            assert first_openai is not second_openai
+            assert first_autogen is not second_autogen
+            assert second_autogen._client is second_openai
+            assert first_loop.run_until_complete(clients()) == (first_openai, first_autogen)
+        finally:
+            first_loop.run_until_complete(wrapper.close())
+            second_loop.run_until_complete(wrapper.close())
+            first_loop.close()
+            second_loop.close()
+
+    def test_single_plain_agent_runs_without_swarm(self):
+        """Test that a lone agent without tools or handoffs is used directly instead of a Swarm"""
+        from autogen_agentchat.agents import AssistantAgent
+
+        plain_spec = SystemPromptSpecification(
+            name="plain",
+            version="1.0",
+            description="",
+            agents={
+                "agent": AgentPromptSpecification(name="Agent", prompt="Hi", tools=[]),
+                "client": self.mock_client_spec,
+                "evaluator": AgentPromptSpecification(name="Evaluator", prompt="Grade", tools=[]),
+            },
+        )
+
+        with patch("src.autogen_conversation_engine.AutogenMASFactory") as mock_mas_factory:
+            team = self.engine._create_agent_team(plain_spec, Mock(), "s1")
+            assert isinstance(team, AssistantAgent)
+            assert team.name == "agent"
+            mock_mas_factory.assert_not_called()
+
+            self.engine._create_agent_team(self.mock_system_prompt_spec, Mock(), "s1")
+            mock_mas_factory.return_value.create_swarm_team.assert_called_once()
+
+    def test_agent_team_without_tools_builds_no_tool_instances(self):
+        """Test that a tools-off conversation skips tool construction and keeps handoffs"""
+        from autogen_agentchat.agents import AssistantAgent
+
+        self.mock_agent_spec.handoffs = {"client": "unused"}
+        with (
+            patch("src.autogen_conversation_engine.AutogenToolFactory") as mock_tool_factory,
+            patch("src.autogen_conversation_engine.AutogenMASFactory") as mock_mas_factory,
+        ):
+            self.engine._create_agent_team(self.mock_system_prompt_spec, Mock(), "s1", tools_enabled=False)
+
+            mock_tool_factory.assert_not_called()
+            assert mock_mas_factory.return_value.create_swarm_team.call_args[0][1] == []
+
+        # Without tools a lone agent with no handoffs answers directly
+        self.mock_agent_spec.handoffs = None
+        team = self.engine._create_agent_team(self.mock_system_prompt_spec, Mock(), "s1", tools_enabled=False)
+        assert isinstance(team, AssistantAgent)
+
+    def test_user_agent_gets_session_bound_end_call(self):
+        """Test that the simulated client gets end_call bound to its session without a tool factory"""
+        with patch("src.autogen_conversation_engine.AutogenToolFactory") as mock_tool_factory:
+            user_agent = self.engine._create_user_agent(MagicMock(), self.mock_system_prompt_spec, "s1")
+
+        mock_tool_factory.assert_not_called()
+        assert [(tool.name, tool.session_id) for tool in user_agent._tools] == [("end_call", "s1")]
+
+    @pytest.mark.asyncio
+    async def test_run_conversations_batch_bounds_concurrency_and_keeps_order(self):
+        """Test that batch runs overlap up to the concurrency limit and return results in input order"""
+        in_flight = peak = 0
+
+        async def fake_run(scenario):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01 if scenario["name"] == "s0" else 0)
+            in_flight -= 1
+            if scenario["name"] == "s3":
+                raise RuntimeError("boom")
+            return {"scenario": scenario["name"]}
+
+        self.engine.run_conversation_with_tools = fake_run
+        scenarios = [{"name": f"s{i}"} for i in range(5)]
+
+        results = await self.engine.run_conversations_batch(scenarios, concurrency=2)
+
+        assert peak == 2
+        assert [r["scenario"] for r in results[:3]] == ["s0", "s1", "s2"]
+        assert isinstance(results[3], RuntimeError)
+        assert results[4] == {"scenario": "s4"}
+
+    @pytest.mark.asyncio
+    async def test_run_conversation_runs_without_tools(self):
+        """Test that run_conversation runs the shared conversation flow with tools disabled"""
         scenario = {"name": "test_scenario", "variables": {"CLIENT_NAME": "John"}}
 
         # Mock the tools version to return a specific result
@@ -136,13 +290,13 @@ class TestAutogenConversationEngine:
             "tools_used": True,  # This should be changed to False
         }
 
-        with patch.object(self.engine, "run_conversation_with_tools", new_callable=AsyncMock) as mock_tools_method:
-            mock_tools_method.return_value = mock_result
+        with patch.object(self.engine, "_run_conversation", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = mock_result
 
             result = await self.engine.run_conversation(scenario)
 
-            # Verify delegation occurred
-            mock_tools_method.assert_called_once_with(scenario, None, None)
+            # Verify the shared flow ran with tools disabled
+            mock_run.assert_called_once_with(scenario, None, None, tools_enabled=False)
 
             # Verify tools_used was set to False
             assert result["tools_used"] == False
@@ -166,7 +320,7 @@ class TestAutogenConversationEngine:
         non_text_msg.__class__ = Mock  # This won't be a TextMessage
 
         # Mock TaskResult with mixed message types
-        mock_task_result = Mock()
+        mock_task_result = Mock(spec=TaskResult)
         mock_task_result.messages = [text_msg, non_text_msg]  # Last message is not TextMessage
         mock_task_result.stop_reason = "MaxMessageTermination reached"
 
@@ -186,6 +340,7 @@ class TestAutogenConversationEngine:
 
             mock_formatted_spec = Mock()
             mock_formatted_spec.agents = self.engine.prompt_specification.agents
+            mock_formatted_spec.initial_task = "Добрый день!"
             mock_format_spec.return_value = mock_formatted_spec
 
             mock_user_agent = Mock()
@@ -198,7 +353,7 @@ class TestAutogenConversationEngine:
 
             mock_mas_factory = Mock()
             mock_swarm = Mock()
-            mock_swarm.run = AsyncMock(return_value=mock_task_result)
+            mock_swarm.run_stream = B.create_run_stream(mock_task_result)
             mock_mas_factory.create_swarm_team.return_value = mock_swarm
             mock_mas_factory_class.return_value = mock_mas_factory
 
@@ -237,6 +392,7 @@ class TestAutogenConversationEngine:
             # Mock formatted spec
             mock_formatted_spec = Mock()
             mock_formatted_spec.agents = self.engine.prompt_specification.agents
+            mock_formatted_spec.initial_task = "Добрый день!"
             mock_format_spec.return_value = mock_formatted_spec
 
             # Mock user agent
@@ -256,10 +412,10 @@ class TestAutogenConversationEngine:
 
             mock_agent_message = TextMessage(content="Hello! How can I help you?", source="agent_agent")
 
-            mock_task_result = Mock()
+            mock_task_result = Mock(spec=TaskResult)
             mock_task_result.stop_reason = "completed_1_turns"  # Natural completion after 1 turn
             mock_task_result.messages = [mock_agent_message]
-            mock_swarm.run = AsyncMock(return_value=mock_task_result)
+            mock_swarm.run_stream = B.create_run_stream(mock_task_result)
             mock_mas_factory.create_swarm_team.return_value = mock_swarm
             mock_mas_factory_class.return_value = mock_mas_factory
 
@@ -270,7 +426,7 @@ class TestAutogenConversationEngine:
                 "total_turns": 3,
                 "tools_used": True,
             }
-            mock_adapter_class.autogen_to_contract_format.return_value = mock_adapter_result
+            mock_adapter_class.messages_to_contract_format.return_value = mock_adapter_result
 
             # Mock wait_for is not used in new implementation - remove this
 
@@ -290,14 +446,14 @@ class TestAutogenConversationEngine:
             mock_mas_factory.create_swarm_team.assert_called_once()
 
             # Verify run was called with HandoffMessage (not string)
-            assert mock_swarm.run.call_count >= 1
-            call_args = mock_swarm.run.call_args_list[0]
+            assert mock_swarm.run_stream.call_count >= 1
+            call_args = mock_swarm.run_stream.call_args_list[0]
             handoff_message = call_args[1]["task"]  # keyword argument
             assert handoff_message.source == "client"
             assert handoff_message.target == "agent"
             assert handoff_message.content == "Добрый день!"
 
-            mock_adapter_class.autogen_to_contract_format.assert_called_once()
+            mock_adapter_class.messages_to_contract_format.assert_called_once()
 
             # Verify result
             assert result == mock_adapter_result
@@ -330,7 +486,7 @@ class TestAutogenConversationEngine:
 
             mock_mas_factory = Mock()
             mock_swarm = Mock()
-            mock_swarm.run = AsyncMock(side_effect=asyncio.TimeoutError())
+            mock_swarm.run_stream = Mock(side_effect=asyncio.TimeoutError())
             mock_mas_factory.create_swarm_team.return_value = mock_swarm
             mock_mas_factory_class.return_value = mock_mas_factory
 
@@ -404,6 +560,26 @@ class TestAutogenConversationEngine:
             assert result["tools_used"] == True
             assert "error_context" in result
 
+    @pytest.mark.asyncio
+    async def test_setup_type_error_is_not_reported_as_non_text_message(self):
+        """A TypeError while building the agents is a general failure, not a non-text message from the loop"""
+        scenario = {"name": "test_scenario", "variables": {"CLIENT_NAME": "John"}}
+
+        with (
+            patch(
+                "src.autogen_conversation_engine.AutogenModelClientFactory.create_from_openai_wrapper"
+            ) as mock_create_client,
+            patch.object(self.engine, "_enrich_variables_with_client_data") as mock_enrich,
+        ):
+            mock_create_client.side_effect = TypeError("bad client config")
+            mock_enrich.return_value = ({"CLIENT_NAME": "John", "name": "John"}, None)
+
+            result = await self.engine.run_conversation_with_tools(scenario)
+
+        assert result["status"] == "failed"
+        assert result["error_type"] == "TypeError"
+        assert "mas_stop_reason" not in result
+
     @pytest.mark.asyncio
     async def test_run_conversation_with_tools_uses_webhook_session_id(self):
         """Test that webhook session_id is used when available"""
@@ -442,10 +618,10 @@ class TestAutogenConversationEngine:
 
             mock_agent_message = TextMessage(content="Hello! How can I help you?", source="agent_agent")
 
-            mock_task_result = Mock()
+            mock_task_result = Mock(spec=TaskResult)
             mock_task_result.stop_reason = "completed_1_turns"  # Natural completion after 1 turn
             mock_task_result.messages = [mock_agent_message]
-            mock_swarm.run = AsyncMock(return_value=mock_task_result)
+            mock_swarm.run_stream = B.create_run_stream(mock_task_result)
             mock_mas_factory.create_swarm_team.return_value = mock_swarm
             mock_mas_factory_class.return_value = mock_mas_factory
 
@@ -454,7 +630,7 @@ class TestAutogenConversationEngine:
                 "scenario": "test_scenario",
                 "status": "completed",
             }
-            mock_adapter_class.autogen_to_contract_format.return_value = mock_adapter_result
+            mock_adapter_class.messages_to_contract_format.return_value = mock_adapter_result
 
             # Mock webhook client data
             mock_get_client_data.return_value = {"session_id": "webhook_session_456"}
@@ -473,5 +649,5 @@ class TestAutogenConversationEngine:
             mock_mas_factory_class.assert_called_once_with("webhook_session_456")
 
             # Verify session_id in adapter call
-            adapter_call_args = mock_adapter_class.autogen_to_contract_format.call_args
+            adapter_call_args = mock_adapter_class.messages_to_contract_format.call_args
             assert adapter_call_args[1]["session_id"] == "webhook_session_456"
@@ -20,7 +20,7 @@ class TestAutogenConversationEngineIntegration:
         ) as wh_cls:
             mgr = Mock()
             mgr.load_specification.return_value = Mock(agents={"agent": Mock(tools=[])}, version="1")
-            mgr_cls.return_value = mgr
+            mgr_cls.shared.return_value = mgr
             wh = Mock()
             wh.initialize_session = AsyncMock(return_value="sid")
             wh_cls.return_value = wh
@@ -46,8 +46,8 @@ class TestAutogenConversationEngineIntegration:
             mas = Mock()
             mas_cls.return_value.create_swarm_team.return_value = Mock()
             mas_cls.return_value = mas
-            adapter.autogen_to_contract_format.return_value = {"session_id": "sid", "status": "completed"}
-            format_spec.return_value = Mock(agents={"agent": Mock(tools=[])})
+            adapter.messages_to_contract_format.return_value = {"session_id": "sid", "status": "completed"}
+            format_spec.return_value = Mock(agents={"agent": Mock(tools=[])}, initial_task="Добрый день!")
             enrich.return_value = ({"session_id": "sid"}, None)
             loop.return_value = ConversationContext("sid", "s", 1, 5, 0.0)
             result = await self.engine.run_conversation_with_tools(scenario, max_turns=1)
@@ -73,12 +73,15 @@ class TestAutogenConversationEngineIntegration:
     @pytest.mark.asyncio
     async def test_public_interface_preservation(self):
         scenario = {"name": "s", "variables": {}}
-        with patch.object(self.engine, "run_conversation_with_tools", new_callable=AsyncMock) as run_tools:
-            run_tools.return_value = {"session_id": "sid", "status": "done", "tools_used": True}
+        with patch.object(self.engine, "_run_conversation", new_callable=AsyncMock) as run:
+            run.return_value = {"session_id": "sid", "status": "done", "tools_used": True}
             result = await self.engine.run_conversation(scenario)
-            run_tools.assert_called_once_with(scenario, None, None)
+            run.assert_called_once_with(scenario, None, None, tools_enabled=False)
             assert result["tools_used"] is False
 
+            await self.engine.run_conversation_with_tools(scenario)
+            run.assert_called_with(scenario, None, None, tools_enabled=True)
+
     @pytest.mark.asyncio
     async def test_turn_management_integration(self):
         scenario = {"name": "sc", "variables": {}}
@@ -98,8 +101,8 @@ class TestAutogenConversationEngineIntegration:
             tool_factory_cls.return_value.get_tools_for_agent.return_value = []
             mock_swarm = Mock()
             mas_factory_cls.return_value.create_swarm_team.return_value = mock_swarm
-            adapter_cls.autogen_to_contract_format.return_value = {"session_id": "sid", "status": "completed"}
-            format_spec.return_value = Mock(agents={"agent": Mock(tools=[])})
+            adapter_cls.messages_to_contract_format.return_value = {"session_id": "sid", "status": "completed"}
+            format_spec.return_value = Mock(agents={"agent": Mock(tools=[])}, initial_task="Добрый день!")
             enrich.return_value = ({"session_id": "sid"}, None)
             msg = TextMessage(content="hi", source="agent")
             task_result = TaskResult(messages=[msg], stop_reason="completed")
@@ -3,8 +3,8 @@ Tests for AutogenMASFactory
 """
 
 import pytest
-from unittest.mock import Mock, patch
-from src.autogen_mas_factory import AutogenMASFactory
+from unittest.mock import MagicMock, Mock, patch
+from src.autogen_mas_factory import AutogenMASFactory, _resolve_handoffs
 from src.prompt_specification import SystemPromptSpecification, AgentPromptSpecification
 from src.openai_wrapper import OpenAIWrapper
 
@@ -53,6 +53,39 @@ class TestAutogenMASFactory:
         assert "sales_agent" in handoff_config["support_agent"]
         assert "client" not in handoff_config["support_agent"]  # User is external now
 
+    def test_setup_agent_handoffs_cached_per_graph(self):
+        """Test that handoff resolution is reused across sessions and drops unknown targets"""
+        agents_config = {
+            "sales_agent": AgentPromptSpecification(
+                name="sales_agent", prompt="Hi {{name}}", tools=[], handoffs={"missing_agent": "Gone"}
+            ),
+        }
+
+        _resolve_handoffs.cache_clear()
+        first = self.factory._setup_agent_handoffs(agents_config)
+        second = AutogenMASFactory("other_session")._setup_agent_handoffs(agents_config)
+
+        assert first == second == {"sales_agent": []}
+        assert first is not second
+        assert _resolve_handoffs.cache_info().hits == 1
+
+    def test_handoff_tools_shared_across_sessions(self):
+        """Test that agents built for different sessions reuse the same handoff tool objects"""
+        agents_config = {
+            "sales_agent": AgentPromptSpecification(
+                name="sales_agent", prompt="Sales", tools=[], handoffs={"support_agent": "Support"}
+            ),
+            "support_agent": AgentPromptSpecification(name="support_agent", prompt="Support", tools=[]),
+        }
+        model_client = MagicMock()
+
+        first = self.factory._create_swarm_agents(agents_config, [], model_client)
+        second = AutogenMASFactory("other_session")._create_swarm_agents(agents_config, [], model_client)
+
+        assert [tool.name for tool in first[0]._handoff_tools] == ["transfer_to_support_agent"]
+        assert first[0]._handoff_tools[0] is second[0]._handoff_tools[0]
+        assert first[0]._handoffs["transfer_to_support_agent"].target == "support_agent"
+
     def test_create_termination_conditions(self):
         """Test termination conditions creation with max_internal_messages parameter"""
         max_internal_messages = 15
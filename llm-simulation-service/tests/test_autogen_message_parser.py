@@ -40,3 +40,15 @@ class TestAutogenMessageParser:
         assert parsed.should_skip
 
 
+
+    def test_parse_message_uses_given_timestamp(self):
+        msg = TextMessage(source="agent", content="hi")
+        parsed = self.parser.parse_message(msg, "2024-01-15T10:00:00")
+        assert parsed.timestamp == "2024-01-15T10:00:00"
+        assert self.parser.parse_message(msg).timestamp
+
+    def test_agent_speaker_label_shared_across_messages(self):
+        first = self.parser.parse_message(TextMessage(source="sales", content="a"))
+        second = self.parser.parse_message(TextMessage(source="sales", content="b"))
+        assert first.speaker == "agent_sales"
+        assert first.speaker is second.speaker
@@ -0,0 +1,12 @@
+from src.autogen_tools import AutogenToolFactory, GetCartTool
+
+
+def test_tool_schema_shared_across_sessions():
+    first = AutogenToolFactory("s1").get_tools_for_agent(["get_cart", "add_to_cart"])
+    second = AutogenToolFactory("s2").get_tools_for_agent(("get_cart",))
+
+    assert [tool.session_id for tool in first] == ["s1", "s1"]
+    assert second[0].session_id == "s2"
+    assert first[0].schema is second[0].schema is GetCartTool("s3").schema
+    assert first[0].schema["name"] == "get_cart"
+    assert first[1].schema["parameters"]["properties"]["items"]["type"] == "array"
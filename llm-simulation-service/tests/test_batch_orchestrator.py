@@ -66,3 +66,38 @@ async def test_result_aggregation():
     summary = await orchestrator.execute_batch(job, None)
     assert summary["results"][0]["status"] == "completed"
     assert summary["results"][1]["status"] == "failed"
+
+
+@pytest.mark.asyncio
+async def test_on_result_receives_every_result():
+    job = BatchJob(
+        batch_id="b4",
+        scenarios=[{"name": "a"}, {"name": "b"}],
+        status=BatchStatus.PENDING,
+        created_at=datetime.now(),
+    )
+    tracker = BatchProgressTracker(job)
+    processor = MultiResultProcessor([{"scenario_index": 0, "status": "completed"}, Exception("err")])
+    orchestrator = BatchOrchestrator(BatchResourceManager(1), processor, tracker)
+    streamed = []
+    summary = await orchestrator.execute_batch(job, None, on_result=streamed.append)
+    assert len(streamed) == 2
+    assert streamed[0]["status"] == "completed"
+    assert streamed[1]["status"] == "failed"
+    assert streamed[1]["scenario"] == "b"
+    assert summary["results"] == streamed
+
+
+@pytest.mark.asyncio
+async def test_drained_scenarios_are_skipped():
+    job = BatchJob(batch_id="b5", scenarios=[{"a": 1}, {"b": 2}], status=BatchStatus.PENDING, created_at=datetime.now())
+    tracker = BatchProgressTracker(job)
+    # The processor returns None for scenarios it skipped after a drain request
+    processor = MultiResultProcessor([{"scenario_index": 0, "status": "completed"}, None])
+    orchestrator = BatchOrchestrator(BatchResourceManager(1), processor, tracker)
+    streamed = []
+    summary = await orchestrator.execute_batch(job, None, on_result=streamed.append, drain=asyncio.Event())
+    assert summary["status"] == "cancelled"
+    assert summary["skipped_scenarios"] == 1
+    assert summary["successful_scenarios"] == 1
+    assert summary["results"] == streamed == [{"scenario_index": 0, "status": "completed"}]
@@ -65,7 +65,7 @@ async def test_progress_callback_integration():
     async def progress_cb(completed, total):
         calls.append((completed, total))
 
-    async def execute(self, job, cb):
+    async def execute(self, job, cb, on_result=None, drain=None):
         await cb(1, 1)
         return {
             "results": [],
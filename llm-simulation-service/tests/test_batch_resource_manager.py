@@ -32,3 +32,13 @@ async def test_concurrency_limiting():
 
     await asyncio.gather(worker(), worker(), worker())
     assert max_active <= 2
+
+
+@pytest.mark.asyncio
+async def test_evaluation_semaphore_is_independent():
+    manager = BatchResourceManager(1, evaluation_concurrency=2)
+
+    async with manager.get_semaphore():
+        assert not manager.get_evaluation_semaphore().locked()
+        async with manager.get_evaluation_semaphore():
+            assert not manager.get_evaluation_semaphore().locked()
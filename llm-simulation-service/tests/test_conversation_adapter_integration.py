@@ -1,3 +1,4 @@
+from autogen_agentchat.base import TaskResult
 from src.conversation_adapter import ConversationAdapter
 from src.prompt_specification import AgentPromptSpecification, SystemPromptSpecification
 from tests.test_utils.autogen_message_builders import AutogenMessageBuilder as B
@@ -28,4 +29,31 @@ class TestConversationAdapterIntegration:
         assert history[1]["tool_calls"]
         assert history[1]["tool_results"]
 
+    def test_autogen_to_contract_format_counts_turns_and_tools(self):
+        fc = B.create_function_call("c1", "find", "{}")
+        exec_res = B.create_execution_result("c1", "find", "{\"result\": 1}")
+        task_result = TaskResult(
+            messages=[
+                B.create_text_message("Hi", "client"),
+                B.create_tool_call_request([fc], "sales_agent"),
+                B.create_tool_execution_event([exec_res]),
+                B.create_text_message("done", "sales_agent"),
+            ],
+            stop_reason="completed",
+        )
+        result = ConversationAdapter.autogen_to_contract_format(task_result, "s1", "scenario", 1.0)
+        assert result["total_turns"] == 2
+        assert result["tools_used"] is True
+
+    def test_messages_to_contract_format_matches_task_result_form(self):
+        messages = [B.create_text_message("Hi", "client"), B.create_text_message("Hello", "sales_agent")]
+        task_result = TaskResult(messages=messages, stop_reason="completed_1_turns")
+
+        direct = ConversationAdapter.messages_to_contract_format(
+            messages, "completed_1_turns", "s1", "scenario", 1.0, 100.0
+        )
+        wrapped = ConversationAdapter.autogen_to_contract_format(task_result, "s1", "scenario", 1.0, 100.0)
 
+        for key in ("status", "total_turns", "tools_used", "start_time"):
+            assert direct[key] == wrapped[key]
+        assert [item["content"] for item in direct["conversation_history"]] == ["Hi", "Hello"]
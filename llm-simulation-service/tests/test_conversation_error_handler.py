@@ -50,6 +50,20 @@ class TestConversationErrorHandler:
         assert "error_context" in result
         self.logger.log_error.assert_called_once()
 
+    def test_handle_non_text_message_error(self):
+        self.context.all_messages.append(TextMessage(content="hi", source="agent"))
+        self.context.turn_count = 1
+        err = TypeError("MAS terminated with non-text message (HandoffMessage)")
+        err.task_result = Mock(stop_reason="MaxMessageTermination reached", messages=[1, 2])
+        result = self.handler.handle_non_text_message_error(err, self.context, "scenario")
+        assert result["status"] == "failed"
+        assert result["error_type"] == "NonTextMessageError"
+        assert result["total_turns"] == 1
+        assert len(result["conversation_history"]) == 1
+        assert result["mas_stop_reason"] == "MaxMessageTermination reached"
+        assert result["mas_message_count"] == 2
+        self.logger.log_error.assert_called_once()
+
     def test_handle_error_by_type_api_blocked(self):
         err = Exception("Blocked due to geographic")
         result = self.handler.handle_error_by_type(err, self.context, "scenario", "spec")
@@ -199,3 +199,8 @@ class TestConversationLoopOrchestrator:
         
         # No messages should be added to history
         assert len(context.all_messages) == 0
+
+    def test_check_conversation_timeout_ignores_wall_clock_jumps(self, context, turn_manager, logger):
+        orchestrator = ConversationLoopOrchestrator(turn_manager, logger)
+        context.start_time -= 3600
+        orchestrator._check_conversation_timeout(context)
@@ -8,6 +8,7 @@ from src.conversation_turn_manager import ConversationTurnManager
 from src.conversation_context import ConversationContext
 from src.turn_result import TurnResult
 from src.logging_utils import SimulationLogger
+from tests.test_utils.autogen_message_builders import AutogenMessageBuilder as B
 
 
 @pytest.fixture
@@ -32,7 +33,7 @@ class TestConversationTurnManager:
         manager = ConversationTurnManager(logger)
         swarm = Mock()
         msg = TextMessage(content="hi", source="agent")
-        swarm.run = AsyncMock(return_value=TaskResult(messages=[msg], stop_reason=None))
+        swarm.run_stream = B.create_run_stream(TaskResult(messages=[msg], stop_reason=None))
 
         result = await manager.execute_turn(swarm, "hello", "agent", context)
 
@@ -47,7 +48,7 @@ class TestConversationTurnManager:
         manager = ConversationTurnManager(logger)
         swarm = Mock()
         non_text = HandoffMessage(content="handoff", source="agent", target="user")
-        swarm.run = AsyncMock(return_value=TaskResult(messages=[non_text], stop_reason=None))
+        swarm.run_stream = B.create_run_stream(TaskResult(messages=[non_text], stop_reason=None))
 
         with pytest.raises(TypeError):
             await manager.execute_turn(swarm, "hello", "agent", context)
@@ -84,6 +85,16 @@ class TestConversationTurnManager:
         assert cont is False
         assert reason == "finished"
 
+    def test_determine_continuation_stop_reason_case_insensitive(self, context, logger):
+        manager = ConversationTurnManager(logger)
+        context.turn_count = 1
+        task_result = TaskResult(
+            messages=[TextMessage(content="hi", source="agent")], stop_reason="Text message TERMINATED"
+        )
+        cont, reason = manager._determine_continuation(task_result, context)
+        assert cont is False
+        assert reason == "Text message TERMINATED"
+
     def test_determine_continuation_max_turns(self, context, logger):
         manager = ConversationTurnManager(logger)
         context.turn_count = 3
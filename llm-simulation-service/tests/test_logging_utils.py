@@ -0,0 +1,50 @@
+import json
+
+import pytest
+
+from src.config import Config
+from src.logging_utils import SimulationLogger, _format_extra, _format_record
+
+
+def test_format_extra_encodes_views_and_objects_on_emit():
+    agents = {"agent": 1, "client": 2}
+
+    line = _format_extra("Built", {"agents": agents.keys(), "error": ValueError("boom"), "name": "Анна"})
+
+    assert line == 'Built - {"agents":["agent","client"],"error":"boom","name":"Анна"}'
+
+
+def test_format_record_is_one_json_line_with_unescaped_text():
+    line = _format_record({"session_id": "s1", "content": "Добрый день!", "tool_calls": None})
+
+    assert line == '{"session_id":"s1","content":"Добрый день!","tool_calls":null}'
+    assert json.loads(line)["content"] == "Добрый день!"
+
+
+
+def test_format_record_stringifies_non_string_keys():
+    line = _format_record({"tool_args": {1: "first", 2: "second"}})
+
+    assert json.loads(line) == {"tool_args": {"1": "first", "2": "second"}}
+
+
+@pytest.mark.parametrize("async_logging", [True, False])
+def test_log_files_get_their_own_records(tmp_path, monkeypatch, async_logging):
+    monkeypatch.setattr(Config, "LOGS_DIR", str(tmp_path))
+    monkeypatch.setattr(Config, "ASYNC_LOGGING", async_logging)
+    logger = SimulationLogger("queued")
+    try:
+        logger.log_info("hello", extra_data={"turn": 1})
+        logger.log_error("broken", exception=ValueError("boom"))
+        logger.log_token_usage("s1", "gpt-4o-mini", 10, 5, 15, cached_tokens=8)
+    finally:
+        logger.close()
+
+    app_log = next(tmp_path.glob("app_*_queued.log")).read_text(encoding="utf-8")
+    error_log = next(tmp_path.glob("error_*_queued.log")).read_text(encoding="utf-8")
+    token_log = next(tmp_path.glob("tokens_*_queued.log")).read_text(encoding="utf-8")
+
+    assert 'simulation_app - INFO - hello - {"turn":1}' in app_log
+    assert "broken" not in app_log
+    assert "broken" in error_log and "ValueError: boom" in error_log
+    assert json.loads(token_log.split(" - ", 1)[1])["cached_tokens"] == 8
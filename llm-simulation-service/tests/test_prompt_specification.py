@@ -2,8 +2,21 @@
 Tests for prompt specification formatting functionality
 """
 
+import json
+import os
+from unittest.mock import patch
+
+import orjson
 import pytest
-from src.prompt_specification import AgentPromptSpecification, SystemPromptSpecification
+from src.prompt_specification import (
+    SPEC_INDEX_FILENAME,
+    AgentPromptSpecification,
+    PromptSpecificationManager,
+    SystemPromptSpecification,
+    _agent_tool_schemas,
+    _compile_prompt_template,
+    _render_prompt_cached,
+)
 
 
 class TestAgentPromptSpecificationFormatting:
@@ -53,6 +66,59 @@ class TestAgentPromptSpecificationFormatting:
 
         assert "Missing variable in prompt template for agent 'test_agent'" in str(exc_info.value)
 
+    def test_format_with_variables_reuses_compiled_template(self):
+        """Test that repeated formatting of the same prompt compiles it once"""
+        agent_spec = AgentPromptSpecification(name="test_agent", prompt="Hi {{name}} ({{session_id}})", tools=[])
+
+        _compile_prompt_template.cache_clear()
+        first = agent_spec.format_with_variables({"name": "John", "session_id": "s1"})
+        second = agent_spec.format_with_variables({"name": "Anna", "session_id": "s2"})
+
+        assert first.prompt == "Hi John (s1)"
+        assert second.prompt == "Hi Anna (s2)"
+        assert _compile_prompt_template.cache_info().misses == 1
+
+    def test_format_with_variables_reuses_render_for_same_prompt_inputs(self):
+        """Test that scenarios agreeing on the variables a prompt reads share one render"""
+        agent_spec = AgentPromptSpecification(name="test_agent", prompt="Hi {{name}}", tools=[])
+
+        _render_prompt_cached.cache_clear()
+        first = agent_spec.format_with_variables({"name": "John", "session_id": "s1", "other": "a"})
+        second = agent_spec.format_with_variables({"name": "John", "session_id": "s2", "other": "b"})
+        listed = agent_spec.format_with_variables({"name": "John", "items": ["unhashable"]})
+
+        assert first.prompt == second.prompt == listed.prompt == "Hi John"
+        assert _render_prompt_cached.cache_info().misses == 1
+        assert _render_prompt_cached.cache_info().hits == 2
+
+        # Unhashable values the prompt reads are rendered without the cache
+        list_spec = AgentPromptSpecification(name="test_agent", prompt="{{ items | join(', ') }}", tools=[])
+        assert list_spec.format_with_variables({"items": ["a", "b"]}).prompt == "a, b"
+
+    def test_tool_schemas_shared_by_formatted_copies(self):
+        """Test that tool schemas are resolved once for an agent and its formatted copies"""
+        agent_spec = AgentPromptSpecification(
+            name="test_agent", prompt="Hi {{name}}", tools=["get_cart"], handoffs={"support": "Help"}
+        )
+
+        _agent_tool_schemas.cache_clear()
+        schemas = agent_spec.get_tool_schemas()
+        formatted_schemas = agent_spec.format_with_variables({"name": "John"}).get_tool_schemas()
+
+        assert [s["function"]["name"] for s in schemas] == ["get_cart", "handoff_support"]
+        assert formatted_schemas == schemas
+        assert _agent_tool_schemas.cache_info().misses == 1
+
+    def test_format_with_variables_render_error_rendered_once(self):
+        """Test that a failing render is attempted once, not retried without the cache"""
+        agent_spec = AgentPromptSpecification(name="test_agent", prompt="{{ count + name }}", tools=[])
+
+        with patch("src.prompt_specification._compile_prompt_template", wraps=_compile_prompt_template) as compile_:
+            with pytest.raises(ValueError, match="Template formatting failed"):
+                agent_spec.format_with_variables({"count": 1, "name": "John"})
+
+        assert compile_.call_count == 1
+
     def test_format_with_variables_no_template(self):
         """Test formatting prompt without any variables"""
         agent_spec = AgentPromptSpecification(
@@ -104,6 +170,51 @@ class TestSystemPromptSpecificationFormatting:
         assert formatted_spec.agents["agent1"].prompt == "Hello John, I'm agent1"
         assert formatted_spec.agents["client"].prompt == "Hi, I'm John from NYC"
 
+    def test_format_with_variables_reuses_formatted_spec(self):
+        """Test that variable sets agreeing on what the prompts read share one formatted spec"""
+        agents = {
+            "agent1": AgentPromptSpecification(name="agent1", prompt="Hello {{name}}", tools=[]),
+            "client": AgentPromptSpecification(name="client", prompt="Hi from {{location}}", tools=[]),
+        }
+        system_spec = SystemPromptSpecification(
+            name="test_system", version="1.0", description="Test system", agents=agents
+        )
+
+        first = system_spec.format_with_variables({"name": "John", "location": "NYC", "session_id": "s1"})
+        second = system_spec.format_with_variables({"name": "John", "location": "NYC", "session_id": "s2"})
+        other = system_spec.format_with_variables({"name": "Anna", "location": "NYC"})
+
+        assert first is second
+        assert other is not first
+        assert other.agents["agent1"].prompt == "Hello Anna"
+
+    def test_formatted_spec_carries_initial_task(self):
+        """Test that the client's opening message follows client_greeting, then GREETING, then the default"""
+        agents = {"client": AgentPromptSpecification(name="client", prompt="Hi {{name}}", tools=[])}
+        system_spec = SystemPromptSpecification(name="s", version="1", description=None, agents=agents)
+
+        default = system_spec.format_with_variables({"name": "John"})
+        greeting = system_spec.format_with_variables({"name": "John", "GREETING": "Здравствуйте"})
+        client_greeting = system_spec.format_with_variables(
+            {"name": "John", "GREETING": "Здравствуйте", "client_greeting": "Алло"}
+        )
+
+        assert default.initial_task == "Добрый день!"
+        assert greeting.initial_task == "Здравствуйте"
+        assert client_greeting.initial_task == "Алло"
+
+    def test_tool_names_union_in_first_seen_order(self):
+        """Test that the tool union is computed with the spec and carried by formatted copies"""
+        agents = {
+            "agent1": AgentPromptSpecification(name="agent1", prompt="Hi {{name}}", tools=["get_cart", "add_to_cart"]),
+            "agent2": AgentPromptSpecification(name="agent2", prompt="Hi", tools=["add_to_cart", "end_call"]),
+            "client": AgentPromptSpecification(name="client", prompt="Hi", tools=[]),
+        }
+        system_spec = SystemPromptSpecification(name="s", version="1", description=None, agents=agents)
+
+        assert system_spec.tool_names == ("get_cart", "add_to_cart", "end_call")
+        assert system_spec.format_with_variables({"name": "John"}).tool_names == system_spec.tool_names
+
     def test_format_with_variables_missing_client_agent(self):
         """Test that missing client agent raises ValueError"""
         agents = {"agent1": AgentPromptSpecification(name="agent1", prompt="Hello {{name}}", tools=[])}
@@ -183,3 +294,144 @@ class TestSystemPromptSpecificationFormatting:
 
         assert formatted_spec.agents["agent1"].handoffs == {"agent2": "For advanced queries"}
         assert formatted_spec.agents["agent2"].handoffs is None
+
+
+class TestPromptSpecificationLoading:
+    """Test reuse of parsed specifications"""
+
+    def test_load_reuses_parsed_spec_until_a_source_file_changes(self, tmp_path):
+        manager = PromptSpecificationManager()
+        manager.prompts_dir = str(tmp_path)
+        prompt_file = tmp_path / "agent.txt"
+        prompt_file.write_text("Agent prompt")
+        spec_file = tmp_path / "spec_a.json"
+        spec_file.write_text(
+            json.dumps(
+                {
+                    "name": "Spec A",
+                    "version": "1",
+                    "agents": {
+                        "agent": {"name": "Agent", "prompt": "file:agent.txt", "tools": []},
+                        "client": {"name": "Client", "prompt": "Client prompt", "tools": []},
+                    },
+                }
+            )
+        )
+
+        first = manager.load_specification("spec_a")
+        assert manager.load_specification("spec_a") is first
+        assert first.agents["agent"].prompt == "Agent prompt"
+
+        prompt_file.write_text("Edited agent prompt")
+        os.utime(prompt_file, ns=(0, 0))
+        reloaded = manager.load_specification("spec_a")
+        assert reloaded is not first
+        assert reloaded.agents["agent"].prompt == "Edited agent prompt"
+
+    def test_load_keeps_bounded_number_of_specs(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.prompt_specification.LOADED_SPEC_CACHE_SIZE", 2)
+        manager = PromptSpecificationManager()
+        manager.prompts_dir = str(tmp_path)
+        for name in ("spec_a", "spec_b", "spec_c"):
+            (tmp_path / f"{name}.json").write_text(
+                json.dumps(
+                    {"name": name, "version": "1", "agents": {"client": {"name": "C", "prompt": "p", "tools": []}}}
+                )
+            )
+
+        spec_a = manager.load_specification("spec_a")
+        manager.load_specification("spec_b")
+        assert manager.load_specification("spec_a") is spec_a
+        manager.load_specification("spec_c")
+
+        # spec_b was the least recently used, so it is the one dropped
+        assert list(manager._cache) == ["spec_a", "spec_c"]
+
+    def test_shared_returns_single_instance(self):
+        assert PromptSpecificationManager.shared() is PromptSpecificationManager.shared()
+
+
+class TestPromptSpecificationIndex:
+    """Test the metadata index used by list_available_specifications"""
+
+    @staticmethod
+    def _write_spec(path, name, version="1.0"):
+        path.write_text(json.dumps({"name": name, "version": version, "description": "d", "agents": {"agent": {}}}))
+
+    def test_list_uses_index_until_file_changes(self, tmp_path):
+        manager = PromptSpecificationManager()
+        manager.prompts_dir = str(tmp_path)
+        spec_file = tmp_path / "spec_a.json"
+        self._write_spec(spec_file, "Spec A")
+
+        first = manager.list_available_specifications()
+        assert [s["name"] for s in first] == ["spec_a"]
+        assert (tmp_path / SPEC_INDEX_FILENAME).exists()
+
+        with patch("src.prompt_specification.orjson.loads", wraps=orjson.loads) as loads:
+            assert manager.list_available_specifications() == first
+            # Only the index itself is parsed when nothing changed
+            assert loads.call_count == 1
+
+        self._write_spec(spec_file, "Spec A", version="2.0")
+        os.utime(spec_file, (0, 0))
+        assert manager.list_available_specifications()[0]["version"] == "2.0"
+
+    def test_list_drops_removed_specifications(self, tmp_path):
+        manager = PromptSpecificationManager()
+        manager.prompts_dir = str(tmp_path)
+        self._write_spec(tmp_path / "spec_a.json", "Spec A")
+        self._write_spec(tmp_path / "spec_b.json", "Spec B")
+        assert len(manager.list_available_specifications()) == 2
+
+        (tmp_path / "spec_b.json").unlink()
+        assert [s["name"] for s in manager.list_available_specifications()] == ["spec_a"]
+
+    def test_list_parses_changed_files_concurrently_and_skips_broken(self, tmp_path):
+        manager = PromptSpecificationManager()
+        manager.prompts_dir = str(tmp_path)
+        for i in range(40):
+            self._write_spec(tmp_path / f"spec_{i:02d}.json", f"Spec {i}")
+        (tmp_path / "broken.json").write_text("{not json")
+
+        specs = manager.list_available_specifications()
+        assert [s["name"] for s in specs] == [f"spec_{i:02d}" for i in range(40)]
+        assert specs[7]["display_name"] == "Spec 7"
+
+    def test_duplicate_specification_patches_metadata_only(self, tmp_path):
+        manager = PromptSpecificationManager()
+        manager.prompts_dir = str(tmp_path)
+        source = {"name": "Spec A", "version": "3.0", "description": "d", "agents": {"agent": {"prompt": "file:x.txt"}}}
+        (tmp_path / "spec_a.json").write_text(json.dumps(source))
+
+        manager.duplicate_specification("spec_a", "spec_b", version="1.0.0", description="copy")
+
+        copied = json.loads((tmp_path / "spec_b.json").read_text())
+        assert copied == {**source, "name": "Spec A (Copy)", "version": "1.0.0", "description": "copy"}
+        assert [s["name"] for s in manager.list_available_specifications()] == ["spec_a", "spec_b"]
+
+    def test_build_and_validate_matches_two_step_validation(self):
+        manager = PromptSpecificationManager()
+        spec_data = {
+            "name": "Spec",
+            "version": "1",
+            "agents": {
+                "agent": {
+                    "name": "Agent",
+                    "prompt": "p",
+                    "tools": ["unknown_tool", "handoff_client"],
+                    "handoffs": {"ghost": "d"},
+                },
+                "client": {"name": "Client", "prompt": "p", "tools": []},
+            },
+        }
+
+        specification, issues = manager.build_and_validate_specification(spec_data)
+
+        assert specification == SystemPromptSpecification.from_dict(spec_data)
+        assert issues == manager.validate_specification(specification)
+        assert issues == [
+            "Missing required agent: evaluator",
+            "Agent 'agent' references unknown tool: unknown_tool",
+            "Agent 'agent' has handoff to non-existent agent: ghost",
+        ]
@@ -0,0 +1,42 @@
+import asyncio
+import time
+
+import pytest
+
+from src.rate_limiter import TokenBucket
+
+
+@pytest.mark.asyncio
+async def test_burst_within_capacity_does_not_wait():
+    bucket = TokenBucket(10, period=1.0)
+    start = time.monotonic()
+    for _ in range(10):
+        await bucket.acquire()
+    assert time.monotonic() - start < 0.05
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill():
+    bucket = TokenBucket(10, period=1.0)
+    await bucket.acquire(10)
+    start = time.monotonic()
+    await bucket.acquire(2)
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_concurrent_waiters_are_paced():
+    bucket = TokenBucket(20, period=1.0)
+    await bucket.acquire(20)
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+    # Four units at 20/s take about 0.2s regardless of how the waiters interleave
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.asyncio
+async def test_oversized_request_is_capped_to_capacity():
+    bucket = TokenBucket(100, period=1.0)
+    start = time.monotonic()
+    await bucket.acquire(1000)
+    assert time.monotonic() - start < 0.05
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, patch
 from datetime import datetime
@@ -5,6 +6,7 @@ from datetime import datetime
 from src.scenario_processor import ScenarioProcessor
 from src.batch_progress_tracker import BatchProgressTracker
 from src.batch_processor import BatchJob, BatchStatus
+from src.batch_resource_manager import BatchResourceManager
 from src.openai_wrapper import OpenAIWrapper
 
 
@@ -144,3 +146,102 @@ async def test_process_scenario_api_blocked():
     assert result["score"] == 2
     assert tracker.job.completed_scenarios == 1
     assert tracker.job.failed_scenarios == 0
+
+
+@pytest.mark.asyncio
+async def test_conversation_slot_released_before_evaluation():
+    job = BatchJob(
+        batch_id="b6",
+        scenarios=[{"name": "sc"}],
+        status=BatchStatus.PENDING,
+        created_at=datetime.now(),
+        prompt_spec_name="spec",
+    )
+    tracker = BatchProgressTracker(job)
+    processor = ScenarioProcessor(DummyWrapper(), tracker)
+    manager = BatchResourceManager(1)
+    slots = {}
+
+    async def run_conversation(scenario):
+        slots["conversation"] = manager.get_semaphore().locked()
+        return {"session_id": "s6", "status": "completed", "total_turns": 1, "conversation_history": []}
+
+    async def evaluate(conversation_result):
+        slots["conversation_during_eval"] = manager.get_semaphore().locked()
+        slots["evaluation"] = manager.get_evaluation_semaphore().locked()
+        return {"score": 3, "comment": "ok", "evaluation_status": "s"}
+
+    with (
+        patch("src.autogen_conversation_engine.AutogenConversationEngine") as MockEngine,
+        patch("src.evaluator.ConversationEvaluator") as MockEval,
+    ):
+        MockEngine.return_value.run_conversation_with_tools = run_conversation
+        MockEval.return_value.evaluate_conversation = evaluate
+
+        result = await processor.process_scenario({"name": "sc"}, 0, "b6", "spec", True, resource_manager=manager)
+
+    assert result["score"] == 3
+    assert slots == {"conversation": True, "conversation_during_eval": False, "evaluation": True}
+
+
+@pytest.mark.asyncio
+async def test_process_scenario_skipped_when_draining():
+    job = BatchJob(
+        batch_id="b6",
+        scenarios=[{"name": "sc"}],
+        status=BatchStatus.PENDING,
+        created_at=datetime.now(),
+        prompt_spec_name="spec",
+    )
+    tracker = BatchProgressTracker(job)
+    processor = ScenarioProcessor(DummyWrapper(), tracker)
+    drain = asyncio.Event()
+    drain.set()
+
+    with (
+        patch("src.autogen_conversation_engine.AutogenConversationEngine") as MockEngine,
+        patch("src.evaluator.ConversationEvaluator"),
+    ):
+        MockEngine.return_value.run_conversation_with_tools = AsyncMock()
+        result = await processor.process_scenario(
+            {"name": "sc"}, 0, "b6", "spec", True, resource_manager=BatchResourceManager(1), drain=drain
+        )
+        MockEngine.return_value.run_conversation_with_tools.assert_not_awaited()
+
+    assert result is None
+    assert tracker.job.completed_scenarios == 0
+
+
+@pytest.mark.asyncio
+async def test_engines_created_only_after_slot_acquired():
+    job = BatchJob(
+        batch_id="b7",
+        scenarios=[{"name": "sc"}],
+        status=BatchStatus.PENDING,
+        created_at=datetime.now(),
+        prompt_spec_name="spec",
+    )
+    tracker = BatchProgressTracker(job)
+    processor = ScenarioProcessor(DummyWrapper(), tracker)
+    manager = BatchResourceManager(1)
+    drain = asyncio.Event()
+
+    with (
+        patch("src.autogen_conversation_engine.AutogenConversationEngine") as MockEngine,
+        patch("src.evaluator.ConversationEvaluator") as MockEval,
+    ):
+        MockEngine.return_value.run_conversation_with_tools = AsyncMock(return_value={"status": "failed"})
+        async with manager.get_semaphore():
+            task = asyncio.create_task(
+                processor.process_scenario({"name": "sc"}, 0, "b7", "spec", True, resource_manager=manager, drain=drain)
+            )
+            await asyncio.sleep(0)
+            MockEngine.assert_not_called()
+            MockEval.assert_not_called()
+            drain.set()
+        result = await task
+
+        MockEngine.assert_not_called()
+        MockEval.assert_not_called()
+
+    assert result is None
@@ -140,3 +140,14 @@ class TestScenarioVariableEnricher:
         )
         webhook_manager.get_client_data.assert_not_called()
         assert session is None
+
+    @pytest.mark.asyncio
+    async def test_lowercase_mapping_keeps_existing_lowercase(self):
+        variables = {"NAME": "JOHN", "name": "john"}
+        webhook_manager = Mock(spec=WebhookManager)
+        logger = Mock(spec=SimulationLogger)
+        result, _ = await enrich_scenario_variables(
+            variables, "sid", webhook_manager, logger
+        )
+        assert result["name"] == "john"
+        assert result["locations"] == DEFAULTS["locations"]
@@ -31,3 +31,9 @@ class TestToolFlushStateMachine:
         assert entry["tool_calls"]
         assert entry["tool_results"] is None
 
+
+    def test_text_entry_has_only_history_item_keys(self):
+        entry = self.machine.process_text_message(ParsedMessage(speaker="client", content="hi"))
+        assert list(entry) == [
+            "turn", "speaker", "speaker_display", "content", "timestamp", "tool_calls", "tool_results"
+        ]
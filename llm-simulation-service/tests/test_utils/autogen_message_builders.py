@@ -1,3 +1,5 @@
+from unittest.mock import Mock
+
 from autogen_agentchat.messages import TextMessage, ToolCallRequestEvent, ToolCallExecutionEvent
 from autogen_core._types import FunctionCall
 from autogen_core.models import FunctionExecutionResult
@@ -26,3 +28,13 @@ class AutogenMessageBuilder:
     def create_execution_result(call_id: str, name: str, content: str) -> FunctionExecutionResult:
         return FunctionExecutionResult(call_id=call_id, name=name, content=content, is_error=False)
 
+    @staticmethod
+    def create_run_stream(task_result) -> Mock:
+        """Mock ``run_stream`` that emits the result's messages followed by the result itself."""
+
+        async def run_stream(task=None):
+            for message in task_result.messages:
+                yield message
+            yield task_result
+
+        return Mock(side_effect=run_stream)
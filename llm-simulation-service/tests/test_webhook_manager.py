@@ -0,0 +1,69 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from src.webhook_manager import KEEPALIVE_TIMEOUT_SEC, WebhookManager
+
+
+def test_shared_returns_single_instance():
+    assert WebhookManager.shared() is WebhookManager.shared()
+
+
+@pytest.mark.asyncio
+async def test_session_pooled_per_loop_until_closed():
+    manager = WebhookManager()
+    session = manager._get_session()
+
+    assert manager._get_session() is session
+
+    await manager.aclose()
+    assert session.closed
+    assert manager._get_session() is not session
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_prefetched_client_data_used_once():
+    manager = WebhookManager()
+    manager.webhook_url = "http://webhook"
+    client_data = {"variables": {"name": "Anna"}, "session_id": "wh-1"}
+    manager._fetch_client_data = AsyncMock(return_value=client_data)
+
+    assert manager.prefetch([("c1", ["p1"]), ("c1", ["p1"])]) == 1
+    assert await manager.get_client_data("c1", ["p1"]) == client_data
+    manager._fetch_client_data.assert_awaited_once_with("c1", ["p1"])
+
+    # The prefetched result is consumed, so the next lookup goes to the webhook again
+    await manager.get_client_data("c1", ["p1"])
+    assert manager._fetch_client_data.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_pooled_session_keeps_idle_connections_between_conversations():
+    manager = WebhookManager()
+    session = manager._get_session()
+    assert session.connector._keepalive_timeout == KEEPALIVE_TIMEOUT_SEC
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_runs_bounded_number_of_lookups_at_once(monkeypatch):
+    monkeypatch.setattr("src.config.Config.WEBHOOK_PREFETCH_CONCURRENCY", 2)
+    manager = WebhookManager()
+    manager.webhook_url = "http://webhook"
+    running = peak = 0
+
+    async def fetch(client_id, purchase_history_codes):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"variables": {}, "session_id": client_id}
+
+    manager._fetch_client_data = fetch
+    assert manager.prefetch([(f"c{i}", None) for i in range(5)]) == 5
+    results = [await manager.get_client_data(f"c{i}") for i in range(5)]
+
+    assert [result["session_id"] for result in results] == [f"c{i}" for i in range(5)]
+    assert peak == 2